@@ -8,12 +8,21 @@ AI 기반 뉴스 선정 시스템
 import os
 import google.generativeai as genai
 from models.news_article import NewsArticle
+from analyzers.news_selector import NewsSelector
 from typing import List, Optional
 
+from utils.config import Config
+from utils.llm_concurrency import llm_semaphore
+from utils.llm_response import FieldStream, parse_int, read_stream, read_stream_async
+from utils.prompt_builder import fit_to_budget
+
 
 class AINewsSelector:
     """LLM 기반 뉴스 자동 선정"""
 
+    # 응답 형식 ("선정 번호: 3" / "선정 이유: ...")
+    SELECTION_FIELDS = ['선정 번호', '선정 이유']
+
     def __init__(self, api_key: str = None):
         """
         Args:
@@ -26,36 +35,110 @@ class AINewsSelector:
         genai.configure(api_key=self.api_key)
         self.model = genai.GenerativeModel('gemini-2.0-flash-lite')
 
+        # 1차 선별용 규칙 기반 점수 (LLM 프롬프트 크기 상한)
+        self.rule_selector = NewsSelector()
+
     def select_best_news_from_metadata(
         self,
         metadata_list: List[dict],
-        verbose: bool = True
+        verbose: bool = True,
+        top_k: int = None
     ) -> Optional[str]:
         """
         메타데이터(제목+요약)만으로 최고의 뉴스를 선정 - 빠른 선택용
 
+        2단계 선정: 규칙 기반 점수로 상위 K개만 남긴 뒤 LLM이 그중 1개 선택
+
         Args:
-            metadata_list: [{'url': ..., 'title': ..., 'summary': ...}, ...]
+            metadata_list: [{'url': ..., 'title': ..., 'summary': ..., 'content': (선택)}, ...]
             verbose: 상세 정보 출력 여부
+            top_k: 1차 선별 개수 (None이면 Config.SELECTOR_TOP_K, 0이면 선별 없이 전체 전달)
 
         Returns:
             선정된 뉴스 URL (또는 None)
         """
+        metadata_list = self.shortlist(metadata_list, top_k, verbose)
+        if not metadata_list:
+            return None
+
+        if len(metadata_list) == 1:
+            return metadata_list[0]['url']
+
+        prompt = self._metadata_prompt(metadata_list)
+
+        try:
+            response = self.model.generate_content(prompt, stream=True)
+            result_text = read_stream(response, FieldStream(self.SELECTION_FIELDS), until=self._stop_fields())
+            return self._resolve_metadata_selection(result_text.strip(), metadata_list, verbose)
+
+        except Exception as e:
+            return self._metadata_fallback(metadata_list, e)
+
+    async def select_best_news_from_metadata_async(
+        self,
+        metadata_list: List[dict],
+        verbose: bool = True,
+        top_k: int = None
+    ) -> Optional[str]:
+        """
+        select_best_news_from_metadata()의 비동기 버전
+
+        이벤트 루프를 막지 않도록 SDK의 비동기 호출 사용 (전역 동시 호출 수 제한 적용)
+        """
+        metadata_list = self.shortlist(metadata_list, top_k, verbose)
         if not metadata_list:
             return None
 
         if len(metadata_list) == 1:
             return metadata_list[0]['url']
 
+        prompt = self._metadata_prompt(metadata_list)
+
+        try:
+            async with llm_semaphore():
+                response = await self.model.generate_content_async(prompt, stream=True)
+                result_text = await read_stream_async(
+                    response, FieldStream(self.SELECTION_FIELDS), until=self._stop_fields()
+                )
+            return self._resolve_metadata_selection(result_text.strip(), metadata_list, verbose)
+
+        except Exception as e:
+            return self._metadata_fallback(metadata_list, e)
+
+    def _stop_fields(self) -> Optional[List[str]]:
+        """선정 번호만 받으면 선정 이유를 기다리지 않고 스트림 중단"""
+        return ['선정 번호'] if Config.LLM_STREAM_EARLY_STOP else None
+
+    def shortlist(self, metadata_list: List[dict], top_k: Optional[int] = None, verbose: bool = True) -> List[dict]:
+        """
+        규칙 기반 점수로 상위 K개 후보만 남김
+
+        선정 전에 후보 본문을 미리 수집할 때 대상 선별용으로도 사용
+        (이미 선별한 목록은 선정 메서드에 top_k=0으로 전달)
+        """
+        top_k = Config.SELECTOR_TOP_K if top_k is None else top_k
+        if not metadata_list or not top_k or len(metadata_list) <= top_k:
+            return metadata_list
+
+        shortlisted = self.rule_selector.rank_metadata(metadata_list, top_k)
+        if verbose:
+            print(f"[1차 선별] {len(metadata_list)}개 → {len(shortlisted)}개 (규칙 기반 점수)")
+        return shortlisted
+
+    def _metadata_prompt(self, metadata_list: List[dict]) -> str:
+        """메타데이터 선정 프롬프트"""
         # 뉴스 목록을 프롬프트용으로 포맷팅
         news_list = ""
         for i, meta in enumerate(metadata_list, 1):
             news_list += f"{i}. 제목: {meta['title']}\n"
-            if meta.get('summary'):
+            if meta.get('content'):
+                # 본문을 미리 수집한 후보는 요약(lede) 대신 본문 앞부분 사용
+                news_list += f"   본문 미리보기: {fit_to_budget(meta['content'], Config.PROMPT_TOKENS_SELECTOR_PREVIEW).text}\n"
+            elif meta.get('summary'):
                 news_list += f"   요약: {meta['summary']}\n"
             news_list += "\n"
 
-        prompt = f"""
+        return f"""
 당신은 경제 뉴스 편집장입니다.
 다음 {len(metadata_list)}개 뉴스 중에서 **경제적으로 가장 중요하고 독자에게 유용한 뉴스 1개**를 선정해주세요.
 
@@ -82,45 +165,44 @@ class AINewsSelector:
 선정 이유: 달러 환율 급등은 수출입 기업과 개인 투자자 모두에게 직접적 영향을 미치는 중요한 경제 지표입니다.
         """.strip()
 
-        try:
-            response = self.model.generate_content(prompt)
-            result_text = response.text.strip()
+    def _resolve_metadata_selection(self, result_text: str, metadata_list: List[dict], verbose: bool) -> str:
+        """AI 응답에서 선정된 뉴스 URL 결정"""
+        # 선정 번호 추출 (출력 전에 먼저 추출)
+        selected_number = self._extract_selected_number(result_text)
 
-            # 선정 번호 추출 (출력 전에 먼저 추출)
-            selected_number = self._extract_selected_number(result_text)
+        if verbose:
+            try:
+                print("\n[AI 선정 결과]")
+                print("-" * 70)
+                print(result_text)
+                print("-" * 70)
+            except UnicodeEncodeError:
+                # Windows 콘솔 인코딩 문제 - 무시하고 계속 진행
+                print("\n[AI 선정 결과] (콘솔 인코딩 문제로 일부 출력 생략)")
+
+        if selected_number and 1 <= selected_number <= len(metadata_list):
+            selected_url = metadata_list[selected_number - 1]['url']
 
             if verbose:
                 try:
-                    print("\n[AI 선정 결과]")
-                    print("-" * 70)
-                    print(result_text)
-                    print("-" * 70)
+                    print(f"\n✅ 선정: [{selected_number}] {metadata_list[selected_number - 1]['title']}")
                 except UnicodeEncodeError:
-                    # Windows 콘솔 인코딩 문제 - 무시하고 계속 진행
-                    print("\n[AI 선정 결과] (콘솔 인코딩 문제로 일부 출력 생략)")
-
-            if selected_number and 1 <= selected_number <= len(metadata_list):
-                selected_url = metadata_list[selected_number - 1]['url']
+                    print(f"\n선정: [{selected_number}]")
 
-                if verbose:
-                    try:
-                        print(f"\n✅ 선정: [{selected_number}] {metadata_list[selected_number - 1]['title']}")
-                    except UnicodeEncodeError:
-                        print(f"\n선정: [{selected_number}]")
-
-                return selected_url
-            else:
-                print(f"[WARNING] AI가 유효한 번호를 선정하지 못했습니다. 첫 번째 뉴스를 반환합니다.")
-                return metadata_list[0]['url']
-
-        except Exception as e:
-            try:
-                print(f"[ERROR] AI 선정 실패: {e}")
-            except (UnicodeEncodeError, UnicodeDecodeError):
-                print("[ERROR] AI 선정 실패")
-            print("[FALLBACK] 첫 번째 뉴스를 반환합니다.")
+            return selected_url
+        else:
+            print(f"[WARNING] AI가 유효한 번호를 선정하지 못했습니다. 첫 번째 뉴스를 반환합니다.")
             return metadata_list[0]['url']
 
+    def _metadata_fallback(self, metadata_list: List[dict], error: Exception) -> str:
+        """AI 선정 실패 시 첫 번째 뉴스 반환"""
+        try:
+            print(f"[ERROR] AI 선정 실패: {error}")
+        except (UnicodeEncodeError, UnicodeDecodeError):
+            print("[ERROR] AI 선정 실패")
+        print("[FALLBACK] 첫 번째 뉴스를 반환합니다.")
+        return metadata_list[0]['url']
+
     def select_best_news(
         self,
         articles: List[NewsArticle],
@@ -149,7 +231,7 @@ class AINewsSelector:
 {i}. 제목: {article.title}
    출처: {article.source}
    날짜: {article.published_at.strftime('%Y-%m-%d %H:%M')}
-   본문 미리보기: {article.content[:300]}...
+   본문 미리보기: {fit_to_budget(article.content, Config.PROMPT_TOKENS_SELECTOR_PREVIEW).text}
 """
 
         prompt = f"""
@@ -180,8 +262,10 @@ class AINewsSelector:
         """.strip()
 
         try:
-            response = self.model.generate_content(prompt)
-            result_text = response.text.strip()
+            response = self.model.generate_content(prompt, stream=True)
+            result_text = read_stream(
+                response, FieldStream(self.SELECTION_FIELDS), until=self._stop_fields()
+            ).strip()
 
             if verbose:
                 print("\n[AI 선정 결과]")
@@ -220,13 +304,16 @@ class AINewsSelector:
         """
         import re
 
-        # "선정 번호: 3" 형태 찾기
-        match = re.search(r'선정\s*번호\s*[:：]\s*(\d+)', response_text)
-        if match:
-            return int(match.group(1))
+        # "선정 번호: 3" / "**선정 번호**: [3]" / "번호: 3" 형태
+        fields = FieldStream(['선정 번호', '번호'])
+        fields.feed(response_text)
+        fields.close()
+        number = parse_int(fields.get('선정 번호')) or parse_int(fields.get('번호'))
+        if number is not None:
+            return number
 
-        # "번호: 3" 형태 찾기
-        match = re.search(r'번호\s*[:：]\s*(\d+)', response_text)
+        # 문장 중간의 "번호: 3" 형태
+        match = re.search(r'번호\s*[:：]\s*\[?(\d+)', response_text)
         if match:
             return int(match.group(1))
 
@@ -265,7 +352,7 @@ class AINewsSelector:
         for i, article in enumerate(articles, 1):
             news_list += f"""
 {i}. 제목: {article.title}
-   본문: {article.content[:200]}...
+   본문: {fit_to_budget(article.content, Config.PROMPT_TOKENS_SELECTOR_PREVIEW).text}
 """
 
         prompt = f"""
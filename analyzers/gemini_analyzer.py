@@ -3,14 +3,65 @@ Gemini API를 사용한 뉴스 분석
 요약, 쉬운 설명, 인사이트 생성
 """
 
+import asyncio
 import google.generativeai as genai
 from utils.config import Config
+from utils.llm_concurrency import llm_semaphore
+from utils.llm_response import extract_json
+from utils.prompt_builder import estimate_tokens, fit_to_budget
 from models.news_article import NewsArticle
+from database.llm_cache import LLMCache
 
 
 class GeminiAnalyzer:
     """Gemini API 래퍼"""
 
+    # 쉬운 설명(Q&A 3줄) 출력 형식 - explain_simple / analyze_all 공용
+    EXPLAIN_FORMAT = """
+Q. 무슨 일이야?
+A. [2-3문장으로 핵심 요약 + 왜 중요한지]
+   - 첫 문장: 한 마디로 무슨 일인지 (중학생도 이해 가능하게)
+   - 둘째 문장: 구체적 숫자/규모 (예: "코스피 1.73% 급등", "외국인 1조원 매수")
+   - 셋째 문장: 왜 이 뉴스가 중요한지 (시장 의미, 시그널)
+
+Q. 내 투자엔 어떤 영향?
+A. [3-4문장으로 실전 투자 전략 + 과거 사례 비교]
+   - 첫 문장: 수혜 종목/섹터 (구체적 종목명, 예: "삼성전자, SK하이닉스 같은 반도체주")
+   - 둘째 문장: 타격 종목/섹터 (반대 케이스, 예: "배터리, 전기차 관련주는 소외")
+   - 셋째 문장: 과거 비슷한 상황 때 어땠는지 (연도 + 구체적 수치, 예: "2020년 AI 붐 때 반도체주 30% 급등")
+   - 넷째 문장: 환율/금리/원자재 등 연관 자산 영향 (있다면)
+
+Q. 뭘 주목해야 해?
+A. [2-3문장으로 앞으로의 경제 흐름 + 관련주 등락 포인트]
+   - 첫 문장: 다음 주목 이벤트/지표 (예: "다음 주 미국 CPI 발표", "삼성전자 실적 발표")
+   - 둘째 문장: 기관/외국인 투자자들의 시각 (예: "외국인은 반도체 쏠림 지속 전망")
+   - 셋째 문장: 관련주 등락 시나리오 (예: "상승 지속 시 장비주도 동반 상승, 조정 시 5% 하락 가능")
+   - 알아두면 폼 나는 인사이트 하나 (있다면 자연스럽게 포함)
+
+**작성 원칙:**
+1. 구체적 숫자 필수 (%, 금액, 비율 등)
+2. 고유명사 명확히 (기업명, 지수명, 지표명)
+3. 과거 사례는 연도 + 구체적 수치와 함께
+4. "예상", "전망" 등 추측 표현은 근거와 함께
+5. 문장 끝은 명사형 종결어미 ("~한 상황", "~인 셈", "~로 분석", "~될 전망")
+6. 전문 용어는 괄호로 쉽게 풀어쓰기 (예: "KOSPI(한국종합주가지수)")
+7. 각 답변은 간결하지만 인사이트 풍부하게
+""".strip()
+
+    # 키워드 작성 기준 - extract_keywords / analyze_all 공용
+    KEYWORD_GUIDE = """
+**중요**: 키워드는 보편적인 카테고리로 작성하세요. 고유명사보다는 일반 명사를 사용하세요.
+
+예시:
+- ❌ "최창걸 명예회장", "고려아연" (너무 specific)
+- ✅ "기업", "경영", "비철금속산업" (보편적 카테고리)
+
+- ❌ "연준 의장", "제롬 파월" (너무 specific)
+- ✅ "금리", "통화정책", "미국경제" (보편적 카테고리)
+
+뉴스를 모아볼 수 있는 태그로 사용될 키워드를 추출하세요.
+""".strip()
+
     def __init__(self):
         """Gemini API 초기화"""
         # API 키 검증
@@ -18,7 +69,14 @@ class GeminiAnalyzer:
 
         # Gemini 설정
         genai.configure(api_key=Config.GEMINI_API_KEY)
-        self.model = genai.GenerativeModel(Config.GEMINI_MODEL)
+        self.model_name = Config.GEMINI_MODEL
+        self.model = genai.GenerativeModel(self.model_name)
+
+        # 응답 캐시 (같은 프롬프트 재호출 방지)
+        self.cache = LLMCache()
+
+        # 메서드별 마지막 프롬프트 추정 토큰 수
+        self.prompt_tokens: dict[str, int] = {}
 
         # 안전 설정 (뉴스 분석이므로 관대하게)
         self.safety_settings = [
@@ -40,99 +98,167 @@ class GeminiAnalyzer:
             }
         ]
 
-    def summarize(self, article: NewsArticle, num_sentences: int = 3) -> str:
+    def _generate(self, method: str, prompt: str, json_mode: bool = False) -> str:
         """
-        기사를 지정된 문장 수로 요약
+        캐시를 거쳐 Gemini 호출
 
         Args:
-            article: 뉴스 기사 객체
-            num_sentences: 요약 문장 수 (기본 3)
+            method: 호출한 분석 메서드명 (캐시 키 구분용)
+            prompt: 프롬프트
+            json_mode: JSON 응답 강제 여부
 
         Returns:
-            요약문
+            응답 텍스트 (strip 처리)
         """
-        prompt = f"""
+        self.prompt_tokens[method] = estimate_tokens(prompt)
+
+        cached = self.cache.get(method, self.model_name, prompt)
+        if cached is not None:
+            return cached
+
+        response = self.model.generate_content(
+            prompt,
+            safety_settings=self.safety_settings,
+            generation_config=self._generation_config(json_mode)
+        )
+        text = response.text.strip()
+
+        self.cache.set(method, self.model_name, prompt, text)
+        return text
+
+    async def _generate_async(self, method: str, prompt: str, json_mode: bool = False) -> str:
+        """_generate()의 비동기 버전 (전역 동시 호출 수 제한 적용)"""
+        self.prompt_tokens[method] = estimate_tokens(prompt)
+
+        cached = self.cache.get(method, self.model_name, prompt)
+        if cached is not None:
+            return cached
+
+        async with llm_semaphore():
+            response = await self.model.generate_content_async(
+                prompt,
+                safety_settings=self.safety_settings,
+                generation_config=self._generation_config(json_mode)
+            )
+        text = response.text.strip()
+
+        self.cache.set(method, self.model_name, prompt, text)
+        return text
+
+    def _fit_content(self, article: NewsArticle, max_tokens: int) -> str:
+        """본문을 토큰 예산에 맞춤 (초과 시 정보량 높은 문장만 선택)"""
+        fitted = fit_to_budget(article.content, max_tokens)
+        if fitted.truncated:
+            print(f"[INFO] 본문 축약: {fitted.original_tokens} → {fitted.tokens} 토큰 (예산 {max_tokens})")
+        return fitted.text
+
+    def _generation_config(self, json_mode: bool) -> dict:
+        return {'response_mime_type': 'application/json'} if json_mode else None
+
+    # ===== 프롬프트 =====
+
+    def _summarize_prompt(self, article: NewsArticle, num_sentences: int) -> str:
+        return f"""
 다음 뉴스 기사를 정확히 {num_sentences}문장으로 요약해주세요.
 핵심 내용만 간결하게 담아주세요.
 
 제목: {article.title}
 
 본문:
-{article.content}
+{self._fit_content(article, Config.PROMPT_TOKENS_SUMMARY)}
 
 요약 ({num_sentences}문장):
         """.strip()
 
-        try:
-            response = self.model.generate_content(
-                prompt,
-                safety_settings=self.safety_settings
-            )
-            summary = response.text.strip()
-            return summary
+    def _explain_prompt(self, article: NewsArticle) -> str:
+        return f"""
+당신은 경제 뉴스를 투자 인사이트로 변환하는 전문 애널리스트입니다.
+독자가 10초 안에 핵심을 이해하고, "아 그래서 이게 중요하구나", "내 투자에 이렇게 적용하면 되겠네"를 느끼도록 작성하세요.
 
-        except Exception as e:
-            raise Exception(f"요약 생성 실패: {e}")
+**출력 형식**: 정확히 아래 3개 질문에 대한 답변만 작성하세요.
 
-    def explain_simple(self, article: NewsArticle) -> str:
-        """
-        기사를 핵심 3줄 Q&A 형식으로 인사이트 있게 설명
+{self.EXPLAIN_FORMAT}
 
-        Args:
-            article: 뉴스 기사 객체
+제목: {article.title}
 
-        Returns:
-            Q&A 형식 핵심 3줄 설명
-        """
-        prompt = f"""
+본문:
+{self._fit_content(article, Config.PROMPT_TOKENS_EXPLAIN)}
+
+핵심 3줄:
+        """.strip()
+
+    def _keywords_prompt(self, article: NewsArticle, max_keywords: int) -> str:
+        return f"""
+다음 뉴스 기사에서 핵심 키워드를 {max_keywords}개 추출해주세요.
+
+{self.KEYWORD_GUIDE}
+
+제목: {article.title}
+
+본문:
+{self._fit_content(article, Config.PROMPT_TOKENS_KEYWORDS)}
+
+답변 형식 (쉼표로 구분):
+키워드1, 키워드2, 키워드3, ...
+        """.strip()
+
+    def _analyze_all_prompt(self, article: NewsArticle, num_sentences: int, max_keywords: int) -> str:
+        return f"""
 당신은 경제 뉴스를 투자 인사이트로 변환하는 전문 애널리스트입니다.
-독자가 10초 안에 핵심을 이해하고, "아 그래서 이게 중요하구나", "내 투자에 이렇게 적용하면 되겠네"를 느끼도록 작성하세요.
+다음 뉴스 기사를 분석하여 아래 3가지 항목을 JSON으로 작성해주세요.
 
-**출력 형식**: 정확히 아래 3개 질문에 대한 답변만 작성하세요.
+1. summary: 기사를 정확히 {num_sentences}문장으로 요약 (핵심 내용만 간결하게)
 
-Q. 무슨 일이야?
-A. [2-3문장으로 핵심 요약 + 왜 중요한지]
-   - 첫 문장: 한 마디로 무슨 일인지 (중학생도 이해 가능하게)
-   - 둘째 문장: 구체적 숫자/규모 (예: "코스피 1.73% 급등", "외국인 1조원 매수")
-   - 셋째 문장: 왜 이 뉴스가 중요한지 (시장 의미, 시그널)
+2. easy_explanation: 독자가 10초 안에 핵심을 이해하고 "내 투자에 이렇게 적용하면 되겠네"를 느끼도록,
+   정확히 아래 3개 질문에 대한 답변 (줄바꿈 포함 하나의 문자열)
 
-Q. 내 투자엔 어떤 영향?
-A. [3-4문장으로 실전 투자 전략 + 과거 사례 비교]
-   - 첫 문장: 수혜 종목/섹터 (구체적 종목명, 예: "삼성전자, SK하이닉스 같은 반도체주")
-   - 둘째 문장: 타격 종목/섹터 (반대 케이스, 예: "배터리, 전기차 관련주는 소외")
-   - 셋째 문장: 과거 비슷한 상황 때 어땠는지 (연도 + 구체적 수치, 예: "2020년 AI 붐 때 반도체주 30% 급등")
-   - 넷째 문장: 환율/금리/원자재 등 연관 자산 영향 (있다면)
+{self.EXPLAIN_FORMAT}
 
-Q. 뭘 주목해야 해?
-A. [2-3문장으로 앞으로의 경제 흐름 + 관련주 등락 포인트]
-   - 첫 문장: 다음 주목 이벤트/지표 (예: "다음 주 미국 CPI 발표", "삼성전자 실적 발표")
-   - 둘째 문장: 기관/외국인 투자자들의 시각 (예: "외국인은 반도체 쏠림 지속 전망")
-   - 셋째 문장: 관련주 등락 시나리오 (예: "상승 지속 시 장비주도 동반 상승, 조정 시 5% 하락 가능")
-   - 알아두면 폼 나는 인사이트 하나 (있다면 자연스럽게 포함)
+3. keywords: 핵심 키워드 {max_keywords}개 (문자열 배열)
 
-**작성 원칙:**
-1. 구체적 숫자 필수 (%, 금액, 비율 등)
-2. 고유명사 명확히 (기업명, 지수명, 지표명)
-3. 과거 사례는 연도 + 구체적 수치와 함께
-4. "예상", "전망" 등 추측 표현은 근거와 함께
-5. 문장 끝은 명사형 종결어미 ("~한 상황", "~인 셈", "~로 분석", "~될 전망")
-6. 전문 용어는 괄호로 쉽게 풀어쓰기 (예: "KOSPI(한국종합주가지수)")
-7. 각 답변은 간결하지만 인사이트 풍부하게
+{self.KEYWORD_GUIDE}
 
 제목: {article.title}
 
 본문:
-{article.content[:1500]}
+{self._fit_content(article, Config.PROMPT_TOKENS_ANALYZE_ALL)}
 
-핵심 3줄:
+**출력 형식** (JSON만 출력):
+{{"summary": "...", "easy_explanation": "Q. 무슨 일이야?\\nA. ...", "keywords": ["키워드1", "키워드2"]}}
         """.strip()
 
+    # ===== 분석 (동기) =====
+
+    def summarize(self, article: NewsArticle, num_sentences: int = 3) -> str:
+        """
+        기사를 지정된 문장 수로 요약
+
+        Args:
+            article: 뉴스 기사 객체
+            num_sentences: 요약 문장 수 (기본 3)
+
+        Returns:
+            요약문
+        """
         try:
-            response = self.model.generate_content(
-                prompt,
-                safety_settings=self.safety_settings
-            )
-            explanation = response.text.strip()
+            summary = self._generate('summarize', self._summarize_prompt(article, num_sentences))
+            return summary
+
+        except Exception as e:
+            raise Exception(f"요약 생성 실패: {e}")
+
+    def explain_simple(self, article: NewsArticle) -> str:
+        """
+        기사를 핵심 3줄 Q&A 형식으로 인사이트 있게 설명
+
+        Args:
+            article: 뉴스 기사 객체
+
+        Returns:
+            Q&A 형식 핵심 3줄 설명
+        """
+        try:
+            explanation = self._generate('explain_simple', self._explain_prompt(article))
             return explanation
 
         except Exception as e:
@@ -149,43 +275,139 @@ A. [2-3문장으로 앞으로의 경제 흐름 + 관련주 등락 포인트]
         Returns:
             키워드 리스트
         """
-        prompt = f"""
-다음 뉴스 기사에서 핵심 키워드를 {max_keywords}개 추출해주세요.
+        try:
+            keywords_text = self._generate('extract_keywords', self._keywords_prompt(article, max_keywords))
+            return self._parse_keywords(keywords_text, max_keywords)
 
-**중요**: 키워드는 보편적인 카테고리로 작성하세요. 고유명사보다는 일반 명사를 사용하세요.
+        except Exception as e:
+            raise Exception(f"키워드 추출 실패: {e}")
 
-예시:
-- ❌ "최창걸 명예회장", "고려아연" (너무 specific)
-- ✅ "기업", "경영", "비철금속산업" (보편적 카테고리)
+    def analyze_all(self, article: NewsArticle, num_sentences: int = 3, max_keywords: int = 5) -> dict:
+        """
+        요약 + 쉬운 설명 + 키워드를 한 번의 호출로 생성 (JSON 응답)
 
-- ❌ "연준 의장", "제롬 파월" (너무 specific)
-- ✅ "금리", "통화정책", "미국경제" (보편적 카테고리)
+        응답에서 누락/형식 오류인 항목만 개별 메서드로 다시 생성
 
-뉴스를 모아볼 수 있는 태그로 사용될 키워드를 추출하세요.
+        Args:
+            article: 뉴스 기사 객체
+            num_sentences: 요약 문장 수
+            max_keywords: 최대 키워드 수
 
-제목: {article.title}
+        Returns:
+            {'summary': str, 'easy_explanation': str, 'keywords': list[str]}
+        """
+        result = {}
+        try:
+            prompt = self._analyze_all_prompt(article, num_sentences, max_keywords)
+            response_text = self._generate('analyze_all', prompt, json_mode=True)
+            result = self._parse_analysis(response_text, max_keywords)
+        except Exception as e:
+            print(f"[WARNING] 통합 분석 실패, 개별 분석으로 대체: {e}")
 
-본문:
-{article.content[:1000]}
+        # 항목별 폴백
+        if not result.get('summary'):
+            print("[WARNING] 통합 분석에 요약 누락 → summarize() 호출")
+            result['summary'] = self.summarize(article, num_sentences)
+        if not result.get('easy_explanation'):
+            print("[WARNING] 통합 분석에 쉬운 설명 누락 → explain_simple() 호출")
+            result['easy_explanation'] = self.explain_simple(article)
+        if not result.get('keywords'):
+            print("[WARNING] 통합 분석에 키워드 누락 → extract_keywords() 호출")
+            result['keywords'] = self.extract_keywords(article, max_keywords)
 
-답변 형식 (쉼표로 구분):
-키워드1, 키워드2, 키워드3, ...
-        """.strip()
+        return result
 
+    # ===== 분석 (비동기) =====
+
+    async def summarize_async(self, article: NewsArticle, num_sentences: int = 3) -> str:
+        """summarize()의 비동기 버전"""
         try:
-            response = self.model.generate_content(
-                prompt,
-                safety_settings=self.safety_settings
-            )
-            keywords_text = response.text.strip()
+            return await self._generate_async('summarize', self._summarize_prompt(article, num_sentences))
+        except Exception as e:
+            raise Exception(f"요약 생성 실패: {e}")
 
-            # 쉼표로 분리하여 리스트로 변환
-            keywords = [kw.strip() for kw in keywords_text.split(',')]
-            return keywords[:max_keywords]
+    async def explain_simple_async(self, article: NewsArticle) -> str:
+        """explain_simple()의 비동기 버전"""
+        try:
+            return await self._generate_async('explain_simple', self._explain_prompt(article))
+        except Exception as e:
+            raise Exception(f"쉬운 설명 생성 실패: {e}")
 
+    async def extract_keywords_async(self, article: NewsArticle, max_keywords: int = 5) -> list[str]:
+        """extract_keywords()의 비동기 버전"""
+        try:
+            keywords_text = await self._generate_async('extract_keywords', self._keywords_prompt(article, max_keywords))
+            return self._parse_keywords(keywords_text, max_keywords)
         except Exception as e:
             raise Exception(f"키워드 추출 실패: {e}")
 
+    async def analyze_all_async(self, article: NewsArticle, num_sentences: int = 3, max_keywords: int = 5) -> dict:
+        """
+        analyze_all()의 비동기 버전
+
+        누락 항목 폴백 호출은 서로 독립적이므로 동시에 실행
+        """
+        result = {}
+        try:
+            prompt = self._analyze_all_prompt(article, num_sentences, max_keywords)
+            response_text = await self._generate_async('analyze_all', prompt, json_mode=True)
+            result = self._parse_analysis(response_text, max_keywords)
+        except Exception as e:
+            print(f"[WARNING] 통합 분석 실패, 개별 분석으로 대체: {e}")
+
+        fallbacks = {}
+        if not result.get('summary'):
+            fallbacks['summary'] = self.summarize_async(article, num_sentences)
+        if not result.get('easy_explanation'):
+            fallbacks['easy_explanation'] = self.explain_simple_async(article)
+        if not result.get('keywords'):
+            fallbacks['keywords'] = self.extract_keywords_async(article, max_keywords)
+
+        if fallbacks:
+            print(f"[WARNING] 통합 분석 누락 항목 개별 생성: {', '.join(fallbacks)}")
+            values = await asyncio.gather(*fallbacks.values())
+            result.update(zip(fallbacks.keys(), values))
+
+        return result
+
+    # ===== 응답 파싱 =====
+
+    def _parse_keywords(self, keywords_text: str, max_keywords: int) -> list[str]:
+        # 쉼표로 분리하여 리스트로 변환
+        keywords = [kw.strip() for kw in keywords_text.split(',')]
+        return keywords[:max_keywords]
+
+    def _parse_analysis(self, response_text: str, max_keywords: int) -> dict:
+        """
+        analyze_all 응답 JSON 검증
+
+        Returns:
+            형식이 올바른 항목만 담은 딕셔너리
+        """
+        data = extract_json(response_text)
+        if not isinstance(data, dict):
+            raise ValueError("JSON 객체가 아닙니다.")
+
+        result = {}
+
+        summary = data.get('summary')
+        if isinstance(summary, str) and summary.strip():
+            result['summary'] = summary.strip()
+
+        explanation = data.get('easy_explanation')
+        if isinstance(explanation, str) and 'Q.' in explanation:
+            result['easy_explanation'] = explanation.strip()
+
+        keywords = data.get('keywords')
+        if isinstance(keywords, str):
+            keywords = keywords.split(',')
+        if isinstance(keywords, list):
+            keywords = [str(kw).strip() for kw in keywords if str(kw).strip()]
+            if keywords:
+                result['keywords'] = keywords[:max_keywords]
+
+        return result
+
     def test_connection(self) -> bool:
         """
         API 연결 테스트
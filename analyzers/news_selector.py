@@ -3,34 +3,28 @@
 CONTENT_STRATEGY.md의 선정 기준을 구현
 """
 
-from datetime import datetime
+from datetime import datetime, timedelta
+import numpy as np
 from models.news_article import NewsArticle
+from utils import economy_keywords
+from utils.keyword_matcher import KeywordMatcher
 import re
 
 
+# 통계 수치 패턴 ("3.5%", "10조", "5억") - 한 번의 findall로 개수 계산
+STAT_PATTERN = re.compile(r'\d+\.?\d*%|\d+조|\d+억')
+
+# 시의성 구간 경계 (마이크로초 정수로 비교해 calculate_score의 시간 계산과 동일한 결과 보장)
+_ONE_US = timedelta(microseconds=1)
+_HOUR_US = 3600 * 1_000_000
+
+
 class NewsSelector:
     """뉴스 자동 선정 시스템"""
 
     # 우선순위 키워드 (CONTENT_STRATEGY.md 기준) - 실질적 경제 뉴스
-    PRIORITY_KEYWORDS = [
-        # 금융/통화 (최우선)
-        "금리", "환율", "달러", "원화", "연준", "Fed", "한국은행", "기준금리",
-        "통화정책", "양적완화", "긴축",
-        # 무역/관세 (최우선)
-        "관세", "무역", "수출", "수입", "무역수지", "통상",
-        # 부동산
-        "부동산", "아파트", "전세", "집값", "대출", "주택담보대출", "LTV", "DTI",
-        # 물가/세금
-        "물가", "인플레이션", "CPI", "소비자물가", "생산자물가", "세금", "세제", "감세", "증세",
-        # 투자/증시
-        "주식", "코스피", "다우", "나스닥", "S&P", "채권", "국채", "회사채",
-        # 정책 (경제 정책만)
-        "경기부양", "재정", "예산", "경제정책", "법안", "규제완화", "개정",
-        # 산업/경기
-        "GDP", "경제성장률", "실업률", "고용", "경기", "경기침체", "불황",
-        # 국제경제
-        "중국", "일본", "미국 경제", "유럽", "OPEC", "유가"
-    ]
+    # 프롬프트 문장 선택(utils.prompt_builder)과 같은 목록을 공유
+    PRIORITY_KEYWORDS = economy_keywords.PRIORITY_KEYWORDS
 
     # 제외 키워드 (부고, 인사 등 비경제 뉴스)
     EXCLUDE_KEYWORDS = [
@@ -47,6 +41,29 @@ class NewsSelector:
         "한겨레", "경향신문", "서울경제", "뉴시스"
     ]
 
+    # 컴파일된 키워드 매처 캐시 ((우선순위, 제외) 키워드 튜플, 우선순위 매처, 제외 매처)
+    _matcher_cache = None
+
+    @classmethod
+    def _keyword_matchers(cls) -> tuple[KeywordMatcher, KeywordMatcher]:
+        """우선순위/제외 키워드 매처 (키워드 변경 시 재컴파일)"""
+        key = (tuple(cls.PRIORITY_KEYWORDS), tuple(cls.EXCLUDE_KEYWORDS))
+        cache = cls._matcher_cache
+        if cache is None or cache[0] != key:
+            cache = (key, KeywordMatcher(cls.PRIORITY_KEYWORDS), KeywordMatcher(cls.EXCLUDE_KEYWORDS))
+            cls._matcher_cache = cache
+        return cache[1], cache[2]
+
+    def match_keywords(self, text: str) -> set[int]:
+        """등장한 우선순위 키워드 ID 집합"""
+        priority_matcher, _ = self._keyword_matchers()
+        return priority_matcher.find_all(text)
+
+    def is_excluded(self, *texts: str) -> bool:
+        """제외 키워드(부고, 인사 등) 포함 여부 (첫 매칭에서 중단)"""
+        _, exclude_matcher = self._keyword_matchers()
+        return any(exclude_matcher.contains_any(text) for text in texts)
+
     def calculate_score(self, article: NewsArticle) -> float:
         """
         뉴스 점수 계산 (0~100)
@@ -59,23 +76,148 @@ class NewsSelector:
         - 통계 포함: 10점
         - 제외 키워드 페널티: -50점
         """
+        return self._score(article, datetime.now())
+
+    def score_many(self, articles: list[NewsArticle]) -> list[float]:
+        """
+        여러 기사 점수 일괄 계산 (calculate_score와 같은 값, 기준 시각은 1회만 계산)
+
+        Args:
+            articles: 후보 기사 리스트
+
+        Returns:
+            입력 순서대로의 점수 리스트
+        """
+        return self.score_batch(articles).tolist()
+
+    def score_batch(self, articles: list[NewsArticle], now: datetime = None) -> np.ndarray:
+        """
+        여러 기사 점수를 NumPy 배열로 계산
+
+        기사별 특징(키워드 수, 경과 시간, 신뢰도, 길이, 통계 수)만 파이썬으로 추출하고
+        배점 계산은 배열 연산으로 한 번에 처리
+
+        Args:
+            articles: 후보 기사 리스트
+            now: 기준 시각 (None이면 현재)
+
+        Returns:
+            입력 순서대로의 점수 배열 (int64)
+        """
+        return self.score_features(self.extract_features(articles, now))
+
+    def extract_features(self, articles: list[NewsArticle], now: datetime = None) -> dict[str, np.ndarray]:
+        """
+        점수 계산용 특징 배열 추출
+
+        Returns:
+            {'excluded', 'title_keywords', 'content_keywords', 'age_us', 'trusted', 'length', 'data_count'}
+            (제외 기사는 키워드/통계 항목을 계산하지 않음)
+        """
+        now = now or datetime.now()
+
+        excluded, title_keywords, content_keywords = [], [], []
+        age_us, trusted, length, data_count = [], [], [], []
+
+        for article in articles:
+            age_us.append((now - article.published_at) // _ONE_US)
+            trusted.append(any(src in article.source for src in self.TRUSTED_SOURCES))
+            length.append(len(article.content))
+
+            if self.is_excluded(article.title, article.content):
+                excluded.append(True)
+                title_keywords.append(0)
+                content_keywords.append(0)
+                data_count.append(0)
+                continue
+
+            excluded.append(False)
+            title_keywords.append(len(self.match_keywords(article.title)))
+            content_keywords.append(len(self.match_keywords(article.content)))
+            data_count.append(len(STAT_PATTERN.findall(article.content)))
+
+        return {
+            'excluded': np.array(excluded, dtype=bool),
+            'title_keywords': np.array(title_keywords, dtype=np.int64),
+            'content_keywords': np.array(content_keywords, dtype=np.int64),
+            'age_us': np.array(age_us, dtype=np.int64),
+            'trusted': np.array(trusted, dtype=bool),
+            'length': np.array(length, dtype=np.int64),
+            'data_count': np.array(data_count, dtype=np.int64),
+        }
+
+    def score_features(self, features: dict[str, np.ndarray]) -> np.ndarray:
+        """특징 배열 → 점수 배열 (calculate_score와 같은 배점)"""
+        age = features['age_us']
+        length = features['length']
+        data = features['data_count']
+
+        # 1. 키워드 매칭 (40점)
+        score = np.minimum(40, features['title_keywords'] * 10 + features['content_keywords'] * 2)
+
+        # 2. 시의성 (20점)
+        score += np.select(
+            [age < 6 * _HOUR_US, age < 24 * _HOUR_US, age < 48 * _HOUR_US, age < 72 * _HOUR_US],
+            [20, 15, 10, 5],
+            default=0
+        )
+
+        # 3. 신뢰도 (20점)
+        score += np.where(features['trusted'], 20, 0)
+
+        # 4. 본문 길이 (10점)
+        score += np.select(
+            [
+                (500 <= length) & (length <= 3000),
+                ((300 <= length) & (length < 500)) | ((3000 < length) & (length <= 4000)),
+                ((200 <= length) & (length < 300)) | ((4000 < length) & (length <= 5000)),
+            ],
+            [10, 7, 5],
+            default=0
+        )
+
+        # 5. 통계 포함 (10점)
+        score += np.select([data >= 5, data >= 3, data >= 1], [10, 7, 5], default=0)
+
+        # 0. 제외 키워드 페널티
+        return np.where(features['excluded'], -50, score)
+
+    @staticmethod
+    def top_indices(scores: np.ndarray, n: int) -> np.ndarray:
+        """
+        점수 상위 N개 인덱스 (점수 내림차순, 동점은 입력 순서)
+
+        전체 정렬 없이 argpartition 기준값으로 후보를 추린 뒤 N개만 정렬
+        """
+        total = len(scores)
+        if n <= 0 or total == 0:
+            return np.array([], dtype=np.int64)
+        if n >= total:
+            return np.lexsort((np.arange(total), -scores))
+
+        threshold = np.partition(scores, total - n)[total - n]
+        above = np.flatnonzero(scores > threshold)
+        ties = np.flatnonzero(scores == threshold)[:n - len(above)]
+        candidates = np.concatenate([above, ties])
+        return candidates[np.lexsort((candidates, -scores[candidates]))]
+
+    def _score(self, article: NewsArticle, now: datetime) -> float:
         score = 0
 
         # 0. 제외 키워드 체크 (즉시 탈락)
-        for exclude_kw in self.EXCLUDE_KEYWORDS:
-            if exclude_kw in article.title or exclude_kw in article.content:
-                return -50  # 부고/인사 등은 즉시 낮은 점수
+        if self.is_excluded(article.title, article.content):
+            return -50  # 부고/인사 등은 즉시 낮은 점수
 
         # 1. 키워드 매칭 (40점)
-        title_keywords = sum(1 for kw in self.PRIORITY_KEYWORDS if kw in article.title)
-        content_keywords = sum(1 for kw in self.PRIORITY_KEYWORDS if kw in article.content)
+        title_keywords = len(self.match_keywords(article.title))
+        content_keywords = len(self.match_keywords(article.content))
 
         # 제목에 키워드 있으면 가중치 높임
         keyword_score = (title_keywords * 10) + (content_keywords * 2)
         score += min(40, keyword_score)
 
         # 2. 시의성 (20점) - 최근 기사일수록 높은 점수
-        hours_old = (datetime.now() - article.published_at).total_seconds() / 3600
+        hours_old = (now - article.published_at).total_seconds() / 3600
         if hours_old < 6:
             score += 20
         elif hours_old < 24:
@@ -100,10 +242,7 @@ class NewsSelector:
 
         # 5. 숫자/통계 포함 여부 (10점) - 데이터 기반 뉴스
         # "3.5%", "10조원", "5년" 등의 패턴 찾기
-        numbers = re.findall(r'\d+\.?\d*%', article.content)
-        currency = re.findall(r'\d+조|\d+억', article.content)
-
-        data_count = len(numbers) + len(currency)
+        data_count = len(STAT_PATTERN.findall(article.content))
         if data_count >= 5:
             score += 10
         elif data_count >= 3:
@@ -113,6 +252,58 @@ class NewsSelector:
 
         return round(score, 2)
 
+    def calculate_metadata_score(self, metadata: dict) -> float:
+        """
+        메타데이터(제목+요약) 점수 계산 - 본문 스크래핑 전 1차 선별용
+
+        본문/날짜/언론사가 없으므로 calculate_score()의 키워드·통계 항목만 사용
+
+        배점:
+        - 키워드 매칭: 40점 (제목 10점, 요약 2점)
+        - 통계 포함: 10점
+        - 제외 키워드 페널티: -50점
+        """
+        title = metadata.get('title') or ''
+        summary = metadata.get('summary') or ''
+
+        # 0. 제외 키워드 체크
+        if self.is_excluded(title, summary):
+            return -50
+
+        score = 0
+
+        # 1. 키워드 매칭 (40점)
+        title_keywords = len(self.match_keywords(title))
+        summary_keywords = len(self.match_keywords(summary))
+        score += min(40, (title_keywords * 10) + (summary_keywords * 2))
+
+        # 2. 숫자/통계 포함 여부 (10점)
+        data_count = len(STAT_PATTERN.findall(f"{title} {summary}"))
+        if data_count >= 3:
+            score += 10
+        elif data_count >= 1:
+            score += 5
+
+        return round(score, 2)
+
+    def rank_metadata(self, metadata_list: list[dict], top_k: int = None) -> list[dict]:
+        """
+        메타데이터를 점수 순으로 정렬하여 상위 K개 반환
+
+        동점이면 원래 순서(수집 순서 = 최신/우선 섹션) 유지
+
+        Args:
+            metadata_list: [{'url': ..., 'title': ..., 'summary': ...}, ...]
+            top_k: 반환할 개수 (None이면 전체)
+
+        Returns:
+            정렬된 메타데이터 리스트
+        """
+        scored = [(self.calculate_metadata_score(meta), i, meta) for i, meta in enumerate(metadata_list)]
+        scored.sort(key=lambda x: (-x[0], x[1]))
+        ranked = [meta for _, _, meta in scored]
+        return ranked[:top_k] if top_k else ranked
+
     def select_top_news(
         self,
         articles: list[NewsArticle],
@@ -133,14 +324,10 @@ class NewsSelector:
         if not articles:
             return []
 
-        # 점수 계산
-        scored = []
-        for article in articles:
-            score = self.calculate_score(article)
-            scored.append((article, score))
-
-        # 점수 내림차순 정렬
-        scored.sort(key=lambda x: x[1], reverse=True)
+        # 점수 계산 (배열 연산) → 상위만 부분 정렬
+        scores = self.score_batch(articles)
+        order = self.top_indices(scores, max(top_n, 10) if verbose else top_n)
+        scored = [(articles[i], scores[i].item()) for i in order]
 
         if verbose:
             print(f"\n[뉴스 선정] 총 {len(articles)}개 기사 분석 완료")
@@ -172,7 +359,9 @@ class NewsSelector:
         """점수 산출 근거 설명"""
 
         # 키워드 체크
-        keywords_found = [kw for kw in self.PRIORITY_KEYWORDS if kw in article.title or kw in article.content]
+        priority_matcher, _ = self._keyword_matchers()
+        found_ids = self.match_keywords(article.title) | self.match_keywords(article.content)
+        keywords_found = [kw for kw in self.PRIORITY_KEYWORDS if priority_matcher.index_of(kw) in found_ids]
         if keywords_found:
             print(f"  [+] 우선순위 키워드 포함: {', '.join(keywords_found[:5])}")
 
@@ -190,9 +379,7 @@ class NewsSelector:
         print(f"  [+] 적절한 본문 길이 ({content_length}자)")
 
         # 통계 포함
-        numbers = re.findall(r'\d+\.?\d*%', article.content)
-        currency = re.findall(r'\d+조|\d+억', article.content)
-        data_count = len(numbers) + len(currency)
+        data_count = len(STAT_PATTERN.findall(article.content))
         if data_count > 0:
             print(f"  [+] 데이터 기반 ({data_count}개 통계/수치 포함)")
 
@@ -209,15 +396,14 @@ class NewsSelector:
 
         for article in articles:
             # 영향력: 키워드 체크
-            has_keyword = any(kw in article.title or kw in article.content
-                            for kw in self.PRIORITY_KEYWORDS)
+            has_keyword = bool(self.match_keywords(article.title) or
+                               self.match_keywords(article.content))
 
             # 실천 가능성: 본문 길이
             has_enough_content = len(article.content) >= 200
 
             # 학습 가치: 숫자/통계 포함
-            numbers = re.findall(r'\d+\.?\d*%|\d+조|\d+억', article.content)
-            has_data = len(numbers) >= 1
+            has_data = STAT_PATTERN.search(article.content) is not None
 
             # 모든 기준 통과
             if has_keyword and has_enough_content and has_data:
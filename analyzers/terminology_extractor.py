@@ -3,10 +3,13 @@
 CONTENT_STRATEGY.md의 "5️⃣ 어떤 용어를 쉽게 전달할 것인가?" 구현
 """
 
-import json
-import os
+import threading
 from models.news_article import NewsArticle
 from analyzers.gemini_analyzer import GeminiAnalyzer
+from database.term_store import TermStore
+from utils.config import Config
+from utils.data_loader import get_data_file
+from utils.keyword_matcher import load_automaton
 
 
 class TerminologyExtractor:
@@ -18,16 +21,33 @@ class TerminologyExtractor:
             db_path: 용어 데이터베이스 JSON 파일 경로
         """
         self.db_path = db_path
-        self.term_database = self._load_database()
+        self.db_file = get_data_file(db_path, required=True)
+
+        # 전체 용어 검색 인덱스 (본문 1회 탐색, 디스크 캐시) - 용어 DB가 바뀌면 재생성
+        self.terms: list[str] = []
+        self.term_index = None
+        self._indexed_db = None
+        self._refresh_index()
+
         self.gemini = GeminiAnalyzer()
 
-    def _load_database(self) -> dict:
-        """용어 데이터베이스 로드"""
-        if not os.path.exists(self.db_path):
-            raise FileNotFoundError(f"용어 데이터베이스를 찾을 수 없습니다: {self.db_path}")
+        # DB에 없는 용어의 생성 설명 저장소
+        self.term_store = TermStore()
+        self._warmup_thread = None
 
-        with open(self.db_path, 'r', encoding='utf-8') as f:
-            return json.load(f)
+    @property
+    def term_database(self) -> dict:
+        """용어 데이터베이스 (파일 수정 시 자동 재로드)"""
+        return self.db_file.load()
+
+    def _refresh_index(self):
+        """용어 DB가 다시 로드되었으면 검색 인덱스 재생성"""
+        database = self.term_database
+        if database is self._indexed_db:
+            return
+        self.terms = list(database.keys())
+        self.term_index = load_automaton(self.terms, Config.TERM_INDEX_PATH)
+        self._indexed_db = database
 
     def extract_terms(self, article: NewsArticle, max_terms: int = 1) -> list[dict]:
         """
@@ -40,23 +60,27 @@ class TerminologyExtractor:
         Returns:
             용어 정보 리스트 [{'term': '용어', 'tier': 1, 'count': 3}, ...]
         """
+        self._refresh_index()
         found_terms = []
 
-        # 데이터베이스에 등록된 용어 찾기
-        for term, info in self.term_database.items():
-            # 제목과 본문에서 용어 검색
-            title_count = article.title.count(term)
-            content_count = article.content.count(term)
-            total_count = title_count + content_count
-
-            if total_count > 0:
-                found_terms.append({
-                    'term': term,
-                    'tier': info['tier'],
-                    'category': info['category'],
-                    'count': total_count,
-                    'in_title': title_count > 0
-                })
+        # 제목/본문을 한 번씩만 탐색해 전체 용어의 등장 횟수 계산
+        title_counts = self.term_index.count_all(article.title)
+        content_counts = self.term_index.count_all(article.content)
+
+        # 데이터베이스 순서대로 (정렬 시 동순위는 등록 순서 유지)
+        for term_id in sorted(title_counts.keys() | content_counts.keys()):
+            term = self.terms[term_id]
+            info = self._indexed_db[term]
+            title_count = title_counts.get(term_id, 0)
+            total_count = title_count + content_counts.get(term_id, 0)
+
+            found_terms.append({
+                'term': term,
+                'tier': info['tier'],
+                'category': info['category'],
+                'count': total_count,
+                'in_title': title_count > 0
+            })
 
         # 정렬 우선순위:
         # 1. Tier 낮을수록 (1 > 2 > 3) - 중요도 높음
@@ -88,8 +112,66 @@ class TerminologyExtractor:
                 'why_important': info['why_important']
             }
 
-        # 데이터베이스에 없으면 Gemini에게 요청
-        return self._generate_with_gemini(term)
+        # 이전에 생성해둔 설명이 있으면 재사용
+        stored = self.term_store.get(term)
+        if stored:
+            return stored
+
+        # 데이터베이스에 없으면 Gemini에게 요청 후 저장
+        try:
+            explanation = self._generate_with_gemini(term)
+        except Exception:
+            self.term_store.record_miss(term)  # warm-up에서 재시도
+            raise
+        return self.term_store.save(explanation, model=self.gemini.model_name)
+
+    def note_unknown_terms(self, terms: list[str]):
+        """
+        설명이 없는 용어 등장 기록 (warm-up 대상 선정용)
+
+        Args:
+            terms: 기사 키워드 등 설명이 필요할 수 있는 용어
+        """
+        for term in terms:
+            if term and term not in self.term_database and term not in self.term_store:
+                self.term_store.record_miss(term)
+
+    def warm_up(self, min_count: int = None, limit: int = None) -> int:
+        """
+        자주 등장한 미등록 용어의 설명을 미리 생성
+
+        Args:
+            min_count: 최소 등장 횟수 (None이면 Config.TERM_WARMUP_MIN_MISSES)
+            limit: 최대 생성 수 (None이면 Config.TERM_WARMUP_LIMIT)
+
+        Returns:
+            생성한 용어 수
+        """
+        min_count = min_count or Config.TERM_WARMUP_MIN_MISSES
+        limit = limit or Config.TERM_WARMUP_LIMIT
+
+        generated = 0
+        for term in self.term_store.frequent_misses(min_count, limit):
+            try:
+                self.term_store.save(self._generate_with_gemini(term), model=self.gemini.model_name)
+                generated += 1
+            except Exception as e:
+                print(f"[WARNING] 용어 설명 미리 생성 실패 ({term}): {e}")
+        return generated
+
+    def start_warm_up(self) -> bool:
+        """
+        백그라운드 스레드로 warm_up() 실행 (이미 실행 중이면 무시)
+
+        Returns:
+            새로 시작했으면 True
+        """
+        if self._warmup_thread and self._warmup_thread.is_alive():
+            return False
+
+        self._warmup_thread = threading.Thread(target=self.warm_up, name='term-warmup', daemon=True)
+        self._warmup_thread.start()
+        return True
 
     def _generate_with_gemini(self, term: str) -> dict:
         """Gemini로 새로운 용어 설명 생성"""
@@ -170,6 +252,12 @@ class TerminologyExtractor:
         Returns:
             설명이 포함된 용어 정보 리스트
         """
+        # 기사 키워드 중 설명이 없는 용어 기록 (설정 시 백그라운드로 미리 생성)
+        if article.keywords:
+            self.note_unknown_terms(article.keywords)
+            if Config.TERM_WARMUP_ENABLED:
+                self.start_warm_up()
+
         # 용어 추출
         found_terms = self.extract_terms(article, max_terms)
 
@@ -0,0 +1,127 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+HTML 파싱 벤치마크
+
+저장된 네이버 페이지(fixture)로 파싱 방식별 시간/최대 메모리 비교
+- html.parser 전체 파싱 (기존 방식)
+- lxml 전체 파싱
+- lxml + SoupStrainer 선택적 파싱 (현재 방식)
+
+사용법:
+    python benchmarks/bench_html_parser.py --save   # 실제 페이지를 fixture로 저장
+    python benchmarks/bench_html_parser.py          # 저장된 fixture로 벤치마크
+"""
+
+import argparse
+import glob
+import os
+import statistics
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bs4 import BeautifulSoup  # noqa: E402
+from scrapers.naver_scraper import NaverScraper  # noqa: E402
+from utils.html_parser import parse_html, HTML_PARSER  # noqa: E402
+from utils.http_client import http_get  # noqa: E402
+
+
+FIXTURE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures')
+
+SECTION_URL = 'https://news.naver.com/section/101'
+EXCHANGE_URL = 'https://finance.naver.com/marketindex/exchangeDetail.naver?marketindexCd=FX_USDKRW'
+
+# fixture 파일명 접두어 → 선택적 파싱 대상 (ids, classes)
+PAGE_TARGETS = {
+    'section': ((), NaverScraper.METADATA_PARSE_CLASSES),
+    'article': (NaverScraper.ARTICLE_PARSE_IDS, NaverScraper.ARTICLE_PARSE_CLASSES),
+    'exchange': ((), ('rate_value', 'change_value')),
+}
+
+
+def save_fixtures(num_articles: int = 3):
+    """실제 페이지를 받아 fixture로 저장"""
+    os.makedirs(FIXTURE_DIR, exist_ok=True)
+    scraper = NaverScraper()
+
+    pages = {'section_101.html': SECTION_URL, 'exchange_usdkrw.html': EXCHANGE_URL}
+    for i, meta in enumerate(scraper.get_article_metadata(limit=num_articles), 1):
+        pages[f'article_{i}.html'] = meta['url']
+
+    for filename, url in pages.items():
+        response = http_get(url, headers=scraper.headers)
+        response.raise_for_status()
+        with open(os.path.join(FIXTURE_DIR, filename), 'wb') as f:
+            f.write(response.content)
+        print(f"[OK] {filename} ({len(response.content):,} bytes)")
+
+
+def measure(func, markup: str, repeat: int) -> tuple[float, float]:
+    """(중앙값 ms, 최대 메모리 MB)"""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(markup)
+        times.append((time.perf_counter() - start) * 1000)
+
+    tracemalloc.start()
+    func(markup)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return statistics.median(times), peak / (1024 * 1024)
+
+
+def run_benchmark(repeat: int):
+    """fixture별 파싱 방식 비교"""
+    files = sorted(glob.glob(os.path.join(FIXTURE_DIR, '*.html')))
+    if not files:
+        print(f"[ERROR] fixture가 없습니다: {FIXTURE_DIR}")
+        print("먼저 --save 옵션으로 페이지를 저장하세요.")
+        return
+
+    print(f"파서: {HTML_PARSER} / 반복: {repeat}회")
+    print("=" * 78)
+    print(f"{'파일':<24} {'방식':<22} {'시간(ms)':>10} {'메모리(MB)':>12} {'배속':>6}")
+    print("=" * 78)
+
+    for path in files:
+        filename = os.path.basename(path)
+        prefix = filename.split('_')[0]
+        ids, classes = PAGE_TARGETS.get(prefix, ((), ()))
+
+        with open(path, 'r', encoding='utf-8', errors='replace') as f:
+            markup = f.read()
+
+        cases = [
+            ('html.parser (전체)', lambda m: BeautifulSoup(m, 'html.parser')),
+            (f'{HTML_PARSER} (전체)', lambda m: BeautifulSoup(m, HTML_PARSER)),
+            (f'{HTML_PARSER} + strainer', lambda m: parse_html(m, ids=ids, classes=classes)),
+        ]
+
+        baseline = None
+        for name, func in cases:
+            elapsed, peak = measure(func, markup, repeat)
+            baseline = baseline or elapsed
+            print(f"{filename:<24} {name:<22} {elapsed:>10.2f} {peak:>12.2f} {baseline / elapsed:>5.1f}x")
+        print("-" * 78)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='HTML 파싱 벤치마크')
+    parser.add_argument('--save', action='store_true', help='실제 페이지를 fixture로 저장')
+    parser.add_argument('--articles', type=int, default=3, help='저장할 기사 페이지 수')
+    parser.add_argument('--repeat', type=int, default=20, help='측정 반복 횟수')
+    args = parser.parse_args()
+
+    if args.save:
+        save_fixtures(args.articles)
+    else:
+        run_benchmark(args.repeat)
+
+
+if __name__ == '__main__':
+    main()
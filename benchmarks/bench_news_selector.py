@@ -0,0 +1,133 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+뉴스 점수 계산 벤치마크
+
+합성 기사 코퍼스(기본 10만 건)로 점수 계산 방식별 시간 비교
+- calculate_score 기사별 호출 (기존 방식)
+- score_batch: 특징 추출(파이썬) + 배점 계산(NumPy 배열 연산)
+- 상위 N개 선정: 전체 정렬 vs argpartition
+두 방식의 점수/상위 N개가 같은지도 함께 검증
+
+사용법:
+    python benchmarks/bench_news_selector.py
+    python benchmarks/bench_news_selector.py --size 20000 --top 10
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np  # noqa: E402
+from analyzers.news_selector import NewsSelector  # noqa: E402
+from models.news_article import NewsArticle  # noqa: E402
+
+
+# 본문 생성용 일반 어절 (경제 기사에 흔한 표현)
+FILLER_WORDS = [
+    '정부는', '이번', '발표에서', '시장', '전문가들은', '올해', '지난해', '대비', '증가했다', '감소했다',
+    '관계자는', '밝혔다', '전망이다', '예상된다', '따르면', '기업들의', '투자', '확대', '우려가', '커지고',
+    '있다', '것으로', '나타났다', '분기', '실적', '하반기', '상반기', '업계', '소비자', '가격',
+]
+SOURCES = NewsSelector.TRUSTED_SOURCES + ['이데일리', '머니투데이', '파이낸셜뉴스', '연합인포맥스']
+
+
+def build_corpus(size: int, seed: int) -> list[NewsArticle]:
+    """재현 가능한 합성 기사 코퍼스"""
+    rng = random.Random(seed)
+    now = datetime.now()
+    priority = NewsSelector.PRIORITY_KEYWORDS
+    exclude = NewsSelector.EXCLUDE_KEYWORDS
+
+    def sentence() -> str:
+        words = rng.choices(FILLER_WORDS, k=rng.randint(6, 14))
+        if rng.random() < 0.4:
+            words.insert(rng.randrange(len(words)), rng.choice(priority))
+        if rng.random() < 0.3:
+            words.insert(rng.randrange(len(words)), rng.choice([
+                f"{rng.randint(1, 99)}.{rng.randint(0, 9)}%",
+                f"{rng.randint(1, 999)}조원",
+                f"{rng.randint(1, 9999)}억원",
+            ]))
+        return ' '.join(words) + '.'
+
+    articles = []
+    for i in range(size):
+        title_words = rng.choices(FILLER_WORDS, k=4) + rng.choices(priority, k=rng.randint(0, 2))
+        rng.shuffle(title_words)
+        body = ' '.join(sentence() for _ in range(rng.randint(3, 40)))
+        if rng.random() < 0.05:
+            body += ' ' + rng.choice(exclude)
+
+        articles.append(NewsArticle(
+            url=f"https://example.com/{i}",
+            title=' '.join(title_words),
+            content=body,
+            published_at=now - timedelta(minutes=rng.randint(0, 96 * 60)),
+            source=rng.choice(SOURCES)
+        ))
+    return articles
+
+
+def timed(func):
+    start = time.perf_counter()
+    result = func()
+    return result, time.perf_counter() - start
+
+
+def run_benchmark(size: int, top_n: int, seed: int):
+    print(f"코퍼스 생성 중... ({size:,}건)")
+    articles, elapsed = timed(lambda: build_corpus(size, seed))
+    avg_length = sum(len(a.content) for a in articles) / len(articles)
+    print(f"  생성 {elapsed:.1f}s / 평균 본문 {avg_length:,.0f}자")
+
+    selector = NewsSelector()
+    now = datetime.now()
+
+    # 1. 기존 방식: 기사별 점수 + 전체 정렬
+    baseline, t_baseline = timed(lambda: [selector._score(a, now) for a in articles])
+    baseline_top, t_sort = timed(lambda: [
+        i for i, _ in sorted(enumerate(baseline), key=lambda x: x[1], reverse=True)[:top_n]
+    ])
+
+    # 2. 배치 방식: 특징 추출 + 배열 연산 + argpartition
+    features, t_extract = timed(lambda: selector.extract_features(articles, now))
+    scores, t_vector = timed(lambda: selector.score_features(features))
+    batch_top, t_top = timed(lambda: selector.top_indices(scores, top_n))
+
+    same_scores = np.array_equal(scores, np.array(baseline))
+    same_top = list(batch_top) == baseline_top
+
+    print("=" * 60)
+    print(f"{'단계':<34} {'시간(s)':>10} {'건/초':>12}")
+    print("=" * 60)
+    print(f"{'calculate_score (기사별)':<34} {t_baseline:>10.3f} {size / t_baseline:>12,.0f}")
+    print(f"{'  + 전체 정렬 후 상위 N':<34} {t_sort:>10.3f}")
+    print("-" * 60)
+    print(f"{'extract_features (파이썬)':<34} {t_extract:>10.3f} {size / t_extract:>12,.0f}")
+    print(f"{'score_features (NumPy)':<34} {t_vector:>10.4f} {size / t_vector:>12,.0f}")
+    print(f"{'  + top_indices (argpartition)':<34} {t_top:>10.4f}")
+    print("=" * 60)
+    print(f"점수 일치: {same_scores} / 상위 {top_n}개 일치: {same_top}")
+
+    if not (same_scores and same_top):
+        sys.exit(1)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='뉴스 점수 계산 벤치마크')
+    parser.add_argument('--size', type=int, default=100_000, help='합성 기사 수')
+    parser.add_argument('--top', type=int, default=10, help='선정할 상위 기사 수')
+    parser.add_argument('--seed', type=int, default=42, help='코퍼스 난수 시드')
+    args = parser.parse_args()
+
+    run_benchmark(args.size, args.top, args.seed)
+
+
+if __name__ == '__main__':
+    main()
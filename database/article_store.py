@@ -0,0 +1,219 @@
+"""
+발행 기사 저장소
+
+이미 분석/발송한 기사를 기록하여
+- 다음 실행에서 같은 기사를 후보에서 제외 (중복 발송 방지)
+- 분석만 끝나고 발송에 실패한 기사는 LLM 재호출 없이 분석 결과 재사용
+"""
+
+import hashlib
+import json
+from datetime import datetime
+from typing import Optional
+
+from database.connection import connect
+from models.news_article import NewsArticle
+from utils.naver_url import parse_article_id
+
+
+class ArticleStore:
+    """SQLite 기반 발행 기사 기록"""
+
+    STATUS_ANALYZED = 'analyzed'  # 분석 완료, 발송 전
+    STATUS_SENT = 'sent'          # 발송 완료
+    STATUS_FAILED = 'failed'      # 발송 실패 (재시도 대상)
+
+    def __init__(self, db_path: str = None):
+        """
+        Args:
+            db_path: DB 파일 경로 (None이면 Config.DATABASE_PATH)
+        """
+        self.db_path = db_path
+        self._init_schema()
+
+    def _init_schema(self):
+        with connect(self.db_path) as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS articles (
+                    article_key TEXT PRIMARY KEY,
+                    url TEXT NOT NULL,
+                    title TEXT,
+                    content_hash TEXT,
+                    summary TEXT,
+                    easy_explanation TEXT,
+                    keywords TEXT,
+                    recommendations TEXT,
+                    status TEXT NOT NULL,
+                    error TEXT,
+                    created_at TEXT NOT NULL,
+                    updated_at TEXT NOT NULL,
+                    sent_at TEXT
+                )
+            """)
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_articles_content_hash ON articles(content_hash)"
+            )
+
+    # ===== 키 =====
+
+    @staticmethod
+    def article_key(url: str) -> str:
+        """기사 식별 키 (정규 oid/aid, 인식 불가 시 URL)"""
+        return parse_article_id(url) or url
+
+    @staticmethod
+    def content_hash(content: str) -> str:
+        """본문 해시 (공백 차이 무시)"""
+        normalized = ' '.join(content.split())
+        return hashlib.sha256(normalized.encode('utf-8')).hexdigest()
+
+    # ===== 조회 =====
+
+    def get(self, url: str) -> Optional[dict]:
+        """기사 기록 조회 (없으면 None)"""
+        with connect(self.db_path) as conn:
+            row = conn.execute(
+                "SELECT * FROM articles WHERE article_key = ?",
+                (self.article_key(url),)
+            ).fetchone()
+
+        if not row:
+            return None
+
+        record = dict(row)
+        record['keywords'] = json.loads(record['keywords']) if record['keywords'] else []
+        record['recommendations'] = json.loads(record['recommendations']) if record['recommendations'] else []
+        return record
+
+    def is_published(self, url: str) -> bool:
+        """이미 발송한 기사인지 여부"""
+        record = self.get(url)
+        return bool(record and record['status'] == self.STATUS_SENT)
+
+    def is_duplicate_content(self, article: NewsArticle) -> bool:
+        """다른 URL로 이미 발송된 같은 본문인지 여부"""
+        with connect(self.db_path) as conn:
+            row = conn.execute(
+                "SELECT 1 FROM articles WHERE content_hash = ? AND status = ? AND article_key != ?",
+                (self.content_hash(article.content), self.STATUS_SENT, self.article_key(article.url))
+            ).fetchone()
+        return row is not None
+
+    def filter_unpublished(self, metadata_list: list[dict]) -> list[dict]:
+        """
+        후보 메타데이터에서 이미 발송한 기사 제외
+
+        Args:
+            metadata_list: [{'url': ..., 'title': ..., ...}, ...]
+
+        Returns:
+            발송 이력이 없는 후보 (순서 유지)
+        """
+        if not metadata_list:
+            return []
+
+        keys = [meta.get('article_id') or self.article_key(meta['url']) for meta in metadata_list]
+
+        with connect(self.db_path) as conn:
+            placeholders = ','.join('?' * len(keys))
+            rows = conn.execute(
+                f"SELECT article_key FROM articles WHERE status = ? AND article_key IN ({placeholders})",
+                (self.STATUS_SENT, *keys)
+            ).fetchall()
+
+        published = {row['article_key'] for row in rows}
+        return [meta for meta, key in zip(metadata_list, keys) if key not in published]
+
+    def get_reusable_analysis(self, article: NewsArticle) -> Optional[dict]:
+        """
+        발송 전/실패 상태로 남은 같은 본문의 분석 결과 반환
+
+        본문이 바뀌었으면 None (재분석 필요)
+        """
+        record = self.get(article.url)
+        if not record or record['status'] == self.STATUS_SENT:
+            return None
+        if record['content_hash'] != self.content_hash(article.content):
+            return None
+        if not record['summary'] or not record['easy_explanation']:
+            return None
+        return record
+
+    # ===== 저장 =====
+
+    def save_analysis(self, article: NewsArticle, recommendations: list = None):
+        """분석 결과 저장 (상태: analyzed)"""
+        now = datetime.now().isoformat()
+
+        with connect(self.db_path) as conn:
+            conn.execute("""
+                INSERT INTO articles (
+                    article_key, url, title, content_hash, summary, easy_explanation,
+                    keywords, recommendations, status, created_at, updated_at
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(article_key) DO UPDATE SET
+                    url = excluded.url,
+                    title = excluded.title,
+                    content_hash = excluded.content_hash,
+                    summary = excluded.summary,
+                    easy_explanation = excluded.easy_explanation,
+                    keywords = excluded.keywords,
+                    recommendations = excluded.recommendations,
+                    status = excluded.status,
+                    error = NULL,
+                    updated_at = excluded.updated_at
+            """, (
+                self.article_key(article.url),
+                article.url,
+                article.title,
+                self.content_hash(article.content),
+                article.summary,
+                article.easy_explanation,
+                json.dumps(article.keywords or [], ensure_ascii=False),
+                json.dumps(recommendations or [], ensure_ascii=False),
+                self.STATUS_ANALYZED,
+                now,
+                now
+            ))
+
+    def mark_sent(self, url: str):
+        """발송 완료 처리"""
+        now = datetime.now().isoformat()
+        with connect(self.db_path) as conn:
+            conn.execute(
+                "UPDATE articles SET status = ?, error = NULL, sent_at = ?, updated_at = ? WHERE article_key = ?",
+                (self.STATUS_SENT, now, now, self.article_key(url))
+            )
+
+    def mark_failed(self, url: str, error: str = None):
+        """발송 실패 처리 (다음 실행에서 분석 결과 재사용)"""
+        now = datetime.now().isoformat()
+        with connect(self.db_path) as conn:
+            conn.execute(
+                "UPDATE articles SET status = ?, error = ?, updated_at = ? WHERE article_key = ?",
+                (self.STATUS_FAILED, error, now, self.article_key(url))
+            )
+
+    def mark_duplicate(self, article: NewsArticle):
+        """같은 본문이 이미 발송된 기사 → 발송 완료로 기록하여 이후 후보에서 제외"""
+        now = datetime.now().isoformat()
+        with connect(self.db_path) as conn:
+            conn.execute("""
+                INSERT INTO articles (
+                    article_key, url, title, content_hash, status, error, created_at, updated_at, sent_at
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(article_key) DO UPDATE SET
+                    status = excluded.status,
+                    error = excluded.error,
+                    updated_at = excluded.updated_at
+            """, (
+                self.article_key(article.url),
+                article.url,
+                article.title,
+                self.content_hash(article.content),
+                self.STATUS_SENT,
+                'duplicate content',
+                now,
+                now,
+                now
+            ))
@@ -0,0 +1,43 @@
+"""
+SQLite 연결 헬퍼
+
+모든 로컬 저장소가 공유하는 연결 설정
+- WAL 모드: 읽기와 쓰기가 서로 막지 않음 (스케줄러 + 수동 실행 동시 접근)
+- busy_timeout: 잠금 충돌 시 즉시 실패하지 않고 대기
+"""
+
+import os
+import sqlite3
+from contextlib import contextmanager
+from typing import Iterator
+
+from utils.config import Config
+
+
+@contextmanager
+def connect(db_path: str = None) -> Iterator[sqlite3.Connection]:
+    """
+    SQLite 연결 (with 블록 종료 시 커밋 후 닫음, 예외 시 롤백)
+
+    Args:
+        db_path: DB 파일 경로 (None이면 Config.DATABASE_PATH)
+
+    Yields:
+        sqlite3.Connection (row_factory=sqlite3.Row)
+    """
+    db_path = db_path or Config.DATABASE_PATH
+    if db_path != ':memory:':
+        os.makedirs(os.path.dirname(db_path) or '.', exist_ok=True)
+
+    conn = sqlite3.connect(db_path, timeout=30)
+    conn.row_factory = sqlite3.Row
+    try:
+        conn.execute('PRAGMA journal_mode=WAL')
+        conn.execute('PRAGMA synchronous=NORMAL')
+        yield conn
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        conn.close()
@@ -0,0 +1,128 @@
+"""
+LLM 응답 캐시
+
+(메서드, 모델명, 프롬프트 해시)를 키로 응답 텍스트를 SQLite에 저장
+같은 기사 재실행/텔레그램 실패 후 재시도 시 LLM 호출 없이 즉시 반환
+- TTL: 오래된 응답은 만료
+- LRU: 항목 수가 상한을 넘으면 가장 오래 사용하지 않은 항목부터 삭제
+"""
+
+import hashlib
+import sqlite3
+import time
+from typing import Optional
+
+from database.connection import connect
+from utils.config import Config
+
+
+class LLMCache:
+    """SQLite 기반 LLM 응답 캐시"""
+
+    def __init__(self, db_path: str = None, ttl_hours: float = None, max_entries: int = None):
+        """
+        Args:
+            db_path: DB 파일 경로 (None이면 Config.DATABASE_PATH)
+            ttl_hours: 응답 유효 기간 (시간, None이면 Config.LLM_CACHE_TTL_HOURS)
+            max_entries: 최대 항목 수 (None이면 Config.LLM_CACHE_MAX_ENTRIES)
+        """
+        self.db_path = db_path
+        self.ttl = (ttl_hours or Config.LLM_CACHE_TTL_HOURS) * 3600
+        self.max_entries = max_entries or Config.LLM_CACHE_MAX_ENTRIES
+        self.enabled = Config.LLM_CACHE_ENABLED
+        self._init_schema()
+
+    def _init_schema(self):
+        with connect(self.db_path) as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS llm_cache (
+                    cache_key TEXT PRIMARY KEY,
+                    method TEXT NOT NULL,
+                    model TEXT NOT NULL,
+                    response TEXT NOT NULL,
+                    created_at REAL NOT NULL,
+                    accessed_at REAL NOT NULL
+                )
+            """)
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_llm_cache_accessed ON llm_cache(accessed_at)"
+            )
+
+    @staticmethod
+    def make_key(method: str, model: str, prompt: str) -> str:
+        """캐시 키 (메서드 + 모델 + 프롬프트 해시)"""
+        prompt_hash = hashlib.sha256(prompt.encode('utf-8')).hexdigest()
+        return f"{method}:{model}:{prompt_hash}"
+
+    def get(self, method: str, model: str, prompt: str) -> Optional[str]:
+        """
+        캐시된 응답 조회
+
+        Returns:
+            응답 텍스트 (없거나 만료되었으면 None)
+        """
+        if not self.enabled:
+            return None
+
+        key = self.make_key(method, model, prompt)
+        now = time.time()
+
+        try:
+            with connect(self.db_path) as conn:
+                row = conn.execute(
+                    "SELECT response, created_at FROM llm_cache WHERE cache_key = ?",
+                    (key,)
+                ).fetchone()
+
+                if not row:
+                    return None
+
+                if now - row['created_at'] > self.ttl:
+                    conn.execute("DELETE FROM llm_cache WHERE cache_key = ?", (key,))
+                    return None
+
+                conn.execute(
+                    "UPDATE llm_cache SET accessed_at = ? WHERE cache_key = ?",
+                    (now, key)
+                )
+                return row['response']
+
+        except sqlite3.Error as e:
+            print(f"[WARNING] LLM 캐시 조회 실패: {e}")
+            return None
+
+    def set(self, method: str, model: str, prompt: str, response: str):
+        """응답 저장 (상한 초과 시 LRU 삭제)"""
+        if not self.enabled or not response:
+            return
+
+        key = self.make_key(method, model, prompt)
+        now = time.time()
+
+        try:
+            with connect(self.db_path) as conn:
+                conn.execute("""
+                    INSERT OR REPLACE INTO llm_cache
+                        (cache_key, method, model, response, created_at, accessed_at)
+                    VALUES (?, ?, ?, ?, ?, ?)
+                """, (key, method, model, response, now, now))
+
+                conn.execute("DELETE FROM llm_cache WHERE created_at < ?", (now - self.ttl,))
+                conn.execute("""
+                    DELETE FROM llm_cache WHERE cache_key IN (
+                        SELECT cache_key FROM llm_cache
+                        ORDER BY accessed_at DESC
+                        LIMIT -1 OFFSET ?
+                    )
+                """, (self.max_entries,))
+
+        except sqlite3.Error as e:
+            print(f"[WARNING] LLM 캐시 저장 실패: {e}")
+
+    def clear(self, method: str = None):
+        """캐시 삭제 (method 지정 시 해당 메서드만)"""
+        with connect(self.db_path) as conn:
+            if method:
+                conn.execute("DELETE FROM llm_cache WHERE method = ?", (method,))
+            else:
+                conn.execute("DELETE FROM llm_cache")
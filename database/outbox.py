@@ -0,0 +1,232 @@
+"""
+텔레그램 발송 outbox
+
+포맷팅이 끝난 메시지를 먼저 SQLite에 저장하고, 전송할 때마다 하나씩 완료 표시
+- 발송 도중 프로세스가 죽어도 다음 실행에서 첫 미전송 메시지부터 이어서 전송 (스크래핑/LLM 분석 재실행 없음)
+- (묶음 키, 채팅, 순번)이 같으면 다시 넣어도 무시 → 같은 기사를 다시 enqueue해도 중복 없음
+- 전송 직후 완료 표시 전에 죽은 경우 그 메시지 1개만 다시 전송될 수 있음 (최소 1회 전송)
+"""
+
+import sqlite3
+from datetime import datetime, timedelta
+from typing import Optional
+
+from database.connection import connect
+from utils.config import Config
+
+
+class Outbox:
+    """SQLite 기반 텔레그램 발송 대기열"""
+
+    STATUS_PENDING = 'pending'  # 전송 대기 (실패 후 재시도 포함)
+    STATUS_SENT = 'sent'        # 전송 완료
+    STATUS_FAILED = 'failed'    # 재시도 한도 초과 (이후 메시지도 함께 중단)
+
+    def __init__(self, db_path: str = None):
+        """
+        Args:
+            db_path: DB 파일 경로 (None이면 Config.DATABASE_PATH)
+        """
+        self.db_path = db_path
+        self._init_schema()
+
+    def _init_schema(self):
+        with connect(self.db_path) as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS telegram_outbox (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    batch_key TEXT NOT NULL,
+                    chat_id TEXT NOT NULL,
+                    seq INTEGER NOT NULL,
+                    text TEXT NOT NULL,
+                    parse_mode TEXT,
+                    status TEXT NOT NULL,
+                    attempts INTEGER NOT NULL DEFAULT 0,
+                    message_id INTEGER,
+                    error TEXT,
+                    created_at TEXT NOT NULL,
+                    sent_at TEXT,
+                    UNIQUE (batch_key, chat_id, seq)
+                )
+            """)
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_outbox_status ON telegram_outbox(status, batch_key)"
+            )
+
+    # ===== 저장 =====
+
+    def enqueue(self, batch_key: str, chat_ids: list[str], texts: list[str], parse_mode: str = None) -> int:
+        """
+        메시지 묶음 저장 (채팅마다 같은 순서)
+
+        이미 저장된 (묶음 키, 채팅, 순번)은 그대로 두므로 재실행 시 처음 포맷팅한 메시지가 유지됨
+
+        Args:
+            batch_key: 묶음 키 (예: 기사 URL)
+            chat_ids: 발송 대상 채팅
+            texts: 메시지 목록
+            parse_mode: 텔레그램 parse_mode
+
+        Returns:
+            새로 저장된 메시지 수
+        """
+        now = datetime.now().isoformat()
+        rows = [
+            (batch_key, str(chat_id), seq, text, parse_mode, self.STATUS_PENDING, now)
+            for chat_id in dict.fromkeys(chat_ids)
+            for seq, text in enumerate(texts)
+        ]
+
+        with connect(self.db_path) as conn:
+            before = conn.total_changes
+            conn.executemany(
+                """
+                INSERT OR IGNORE INTO telegram_outbox
+                    (batch_key, chat_id, seq, text, parse_mode, status, created_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+                """,
+                rows
+            )
+            return conn.total_changes - before
+
+    def mark_sent(self, message_row_id: int, message_id: int = None):
+        """메시지 전송 완료"""
+        try:
+            with connect(self.db_path) as conn:
+                conn.execute(
+                    """
+                    UPDATE telegram_outbox
+                    SET status = ?, message_id = ?, error = NULL, attempts = attempts + 1, sent_at = ?
+                    WHERE id = ?
+                    """,
+                    (self.STATUS_SENT, message_id, datetime.now().isoformat(), message_row_id)
+                )
+        except sqlite3.Error as e:
+            # 완료 표시 실패 → 다음 재개 시 이 메시지만 다시 전송될 수 있음
+            print(f"[WARNING] outbox 전송 완료 기록 실패: {e}")
+
+    def mark_error(self, message_row_id: int, error: str, max_attempts: int = None):
+        """
+        메시지 전송 실패 기록 (전달 1회당 한 번, 발송 큐가 재시도를 포기한 뒤 호출)
+
+        시도 횟수가 max_attempts에 도달하면 실패 처리하고,
+        같은 묶음/채팅의 이후 메시지도 순서를 지킬 수 없으므로 함께 실패 처리
+
+        Args:
+            max_attempts: 최대 시도 횟수 (None이면 Config.OUTBOX_MAX_ATTEMPTS)
+        """
+        max_attempts = max_attempts or Config.OUTBOX_MAX_ATTEMPTS
+
+        with connect(self.db_path) as conn:
+            conn.execute(
+                "UPDATE telegram_outbox SET attempts = attempts + 1, error = ? WHERE id = ?",
+                (error, message_row_id)
+            )
+            row = conn.execute(
+                "SELECT batch_key, chat_id, seq, attempts FROM telegram_outbox WHERE id = ?",
+                (message_row_id,)
+            ).fetchone()
+
+            if row and row['attempts'] >= max_attempts:
+                conn.execute(
+                    """
+                    UPDATE telegram_outbox SET status = ?,
+                        error = CASE WHEN id = ? THEN error ELSE 'previous message failed' END
+                    WHERE batch_key = ? AND chat_id = ? AND seq >= ? AND status = ?
+                    """,
+                    (self.STATUS_FAILED, message_row_id, row['batch_key'], row['chat_id'], row['seq'],
+                     self.STATUS_PENDING)
+                )
+
+    def retry_failed(self, batch_key: str) -> int:
+        """
+        재시도 한도를 넘긴 메시지를 다시 대기 상태로 (시도 횟수 초기화)
+
+        Returns:
+            다시 대기 상태가 된 메시지 수
+        """
+        with connect(self.db_path) as conn:
+            cursor = conn.execute(
+                "UPDATE telegram_outbox SET status = ?, attempts = 0 WHERE batch_key = ? AND status = ?",
+                (self.STATUS_PENDING, batch_key, self.STATUS_FAILED)
+            )
+            return cursor.rowcount
+
+    # ===== 조회 =====
+
+    def pending(self, batch_key: str) -> dict[str, list[dict]]:
+        """
+        묶음의 미전송 메시지
+
+        Returns:
+            {채팅 ID: [메시지 행 (순번 순)]}
+        """
+        with connect(self.db_path) as conn:
+            rows = conn.execute(
+                """
+                SELECT id, chat_id, seq, text, parse_mode, attempts FROM telegram_outbox
+                WHERE batch_key = ? AND status = ?
+                ORDER BY chat_id, seq
+                """,
+                (batch_key, self.STATUS_PENDING)
+            ).fetchall()
+
+        pending: dict[str, list[dict]] = {}
+        for row in rows:
+            pending.setdefault(row['chat_id'], []).append(dict(row))
+        return pending
+
+    def pending_batches(self) -> list[str]:
+        """미전송 메시지가 남은 묶음 키 (먼저 저장된 순)"""
+        with connect(self.db_path) as conn:
+            rows = conn.execute(
+                """
+                SELECT batch_key FROM telegram_outbox WHERE status = ?
+                GROUP BY batch_key ORDER BY MIN(id)
+                """,
+                (self.STATUS_PENDING,)
+            ).fetchall()
+        return [row['batch_key'] for row in rows]
+
+    def stats(self, batch_key: str) -> dict[str, int]:
+        """묶음의 상태별 메시지 수 ({'pending': n, 'sent': n, 'failed': n})"""
+        with connect(self.db_path) as conn:
+            rows = conn.execute(
+                "SELECT status, COUNT(*) AS n FROM telegram_outbox WHERE batch_key = ? GROUP BY status",
+                (batch_key,)
+            ).fetchall()
+        stats = {self.STATUS_PENDING: 0, self.STATUS_SENT: 0, self.STATUS_FAILED: 0}
+        stats.update({row['status']: row['n'] for row in rows})
+        return stats
+
+    def is_complete(self, batch_key: str) -> bool:
+        """미전송 메시지가 없고 한 건 이상 전송됨"""
+        stats = self.stats(batch_key)
+        return stats[self.STATUS_PENDING] == 0 and stats[self.STATUS_SENT] > 0
+
+    # ===== 정리 =====
+
+    def purge(self, retention_days: Optional[float] = None) -> int:
+        """
+        오래된 완료/실패 묶음 삭제 (미전송 메시지가 남은 묶음은 유지)
+
+        Args:
+            retention_days: 보관 기간 (None이면 Config.OUTBOX_RETENTION_DAYS)
+
+        Returns:
+            삭제된 메시지 수
+        """
+        days = Config.OUTBOX_RETENTION_DAYS if retention_days is None else retention_days
+        cutoff = (datetime.now() - timedelta(days=days)).isoformat()
+
+        with connect(self.db_path) as conn:
+            cursor = conn.execute(
+                """
+                DELETE FROM telegram_outbox
+                WHERE created_at < ? AND batch_key NOT IN (
+                    SELECT batch_key FROM telegram_outbox WHERE status = ?
+                )
+                """,
+                (cutoff, self.STATUS_PENDING)
+            )
+            return cursor.rowcount
@@ -0,0 +1,131 @@
+"""
+텔레그램 파일 ID 캐시
+
+이미지 내용 해시 → 텔레그램 file_id를 SQLite에 저장
+같은 차트/카드를 다시 보낼 때 파일을 업로드하지 않고 file_id로 전송
+- file_id는 봇마다 다르므로 (봇 ID, 내용 해시)를 키로 사용
+- 텔레그램이 file_id를 거부하면 해당 항목을 지우고 다시 업로드
+- LRU: 항목 수가 상한을 넘으면 가장 오래 사용하지 않은 항목부터 삭제
+"""
+
+import hashlib
+import sqlite3
+import time
+from typing import Optional
+
+from database.connection import connect
+from utils.config import Config
+
+
+class TelegramFileCache:
+    """SQLite 기반 텔레그램 file_id 캐시"""
+
+    def __init__(self, db_path: str = None, max_entries: int = None):
+        """
+        Args:
+            db_path: DB 파일 경로 (None이면 Config.DATABASE_PATH)
+            max_entries: 최대 항목 수 (None이면 Config.TELEGRAM_FILE_CACHE_MAX_ENTRIES)
+        """
+        self.db_path = db_path
+        self.max_entries = max_entries or Config.TELEGRAM_FILE_CACHE_MAX_ENTRIES
+        self.enabled = Config.TELEGRAM_FILE_CACHE_ENABLED
+        self._init_schema()
+
+    def _init_schema(self):
+        with connect(self.db_path) as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS telegram_file_cache (
+                    bot_id TEXT NOT NULL,
+                    content_hash TEXT NOT NULL,
+                    file_id TEXT NOT NULL,
+                    created_at REAL NOT NULL,
+                    accessed_at REAL NOT NULL,
+                    PRIMARY KEY (bot_id, content_hash)
+                )
+            """)
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_telegram_file_cache_accessed "
+                "ON telegram_file_cache(accessed_at)"
+            )
+
+    @staticmethod
+    def bot_id(token: str) -> str:
+        """봇 토큰의 봇 ID 부분 ('123456:ABC...' → '123456')"""
+        return token.split(':', 1)[0]
+
+    @staticmethod
+    def content_hash(data: bytes) -> str:
+        """파일 내용 해시"""
+        return hashlib.sha256(data).hexdigest()
+
+    def get(self, bot_id: str, content_hash: str) -> Optional[str]:
+        """
+        저장된 file_id 조회
+
+        Returns:
+            file_id (없으면 None)
+        """
+        if not self.enabled:
+            return None
+
+        try:
+            with connect(self.db_path) as conn:
+                row = conn.execute(
+                    "SELECT file_id FROM telegram_file_cache WHERE bot_id = ? AND content_hash = ?",
+                    (bot_id, content_hash)
+                ).fetchone()
+
+                if not row:
+                    return None
+
+                conn.execute(
+                    "UPDATE telegram_file_cache SET accessed_at = ? WHERE bot_id = ? AND content_hash = ?",
+                    (time.time(), bot_id, content_hash)
+                )
+                return row['file_id']
+
+        except sqlite3.Error as e:
+            print(f"[WARNING] 텔레그램 파일 캐시 조회 실패: {e}")
+            return None
+
+    def set(self, bot_id: str, content_hash: str, file_id: str):
+        """file_id 저장 (상한 초과 시 LRU 삭제)"""
+        if not self.enabled or not file_id:
+            return
+
+        now = time.time()
+
+        try:
+            with connect(self.db_path) as conn:
+                conn.execute("""
+                    INSERT OR REPLACE INTO telegram_file_cache
+                        (bot_id, content_hash, file_id, created_at, accessed_at)
+                    VALUES (?, ?, ?, ?, ?)
+                """, (bot_id, content_hash, file_id, now, now))
+
+                conn.execute("""
+                    DELETE FROM telegram_file_cache WHERE rowid IN (
+                        SELECT rowid FROM telegram_file_cache
+                        ORDER BY accessed_at DESC
+                        LIMIT -1 OFFSET ?
+                    )
+                """, (self.max_entries,))
+
+        except sqlite3.Error as e:
+            print(f"[WARNING] 텔레그램 파일 캐시 저장 실패: {e}")
+
+    def invalidate(self, bot_id: str, content_hash: str):
+        """텔레그램이 거부한 file_id 삭제"""
+        try:
+            with connect(self.db_path) as conn:
+                conn.execute(
+                    "DELETE FROM telegram_file_cache WHERE bot_id = ? AND content_hash = ?",
+                    (bot_id, content_hash)
+                )
+        except sqlite3.Error as e:
+            print(f"[WARNING] 텔레그램 파일 캐시 삭제 실패: {e}")
+
+    def clear(self):
+        """캐시 전체 삭제"""
+        with connect(self.db_path) as conn:
+            conn.execute("DELETE FROM telegram_file_cache")
@@ -0,0 +1,166 @@
+"""
+LLM 생성 용어 설명 저장소
+
+용어 DB(JSON)에 없는 용어는 Gemini로 설명을 생성하는데,
+한 번 생성한 설명은 SQLite에 저장해 다음 조회부터 LLM 호출 없이 반환
+- 프로세스 내 메모리 캐시 → SQLite 순으로 조회
+- 설명이 없는 용어의 조회 횟수(miss)를 기록해 자주 나오는 용어를 미리 생성(warm-up)
+"""
+
+import sqlite3
+import threading
+from datetime import datetime
+from typing import Optional
+
+from database.connection import connect
+
+
+class TermStore:
+    """SQLite 기반 용어 설명 캐시"""
+
+    def __init__(self, db_path: str = None):
+        """
+        Args:
+            db_path: DB 파일 경로 (None이면 Config.DATABASE_PATH)
+        """
+        self.db_path = db_path
+        self._memory: dict[str, dict] = {}
+        self._lock = threading.Lock()
+        self._init_schema()
+
+    def _init_schema(self):
+        with connect(self.db_path) as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS term_explanations (
+                    term TEXT PRIMARY KEY,
+                    tier INTEGER NOT NULL,
+                    category TEXT,
+                    definition TEXT NOT NULL,
+                    example TEXT,
+                    why_important TEXT,
+                    model TEXT,
+                    created_at TEXT NOT NULL
+                )
+            """)
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS term_misses (
+                    term TEXT PRIMARY KEY,
+                    count INTEGER NOT NULL,
+                    last_seen TEXT NOT NULL
+                )
+            """)
+
+    # ===== 조회 =====
+
+    def get(self, term: str) -> Optional[dict]:
+        """
+        저장된 설명 조회
+
+        Returns:
+            {'term', 'tier', 'category', 'definition', 'example', 'why_important'} (없으면 None)
+        """
+        with self._lock:
+            cached = self._memory.get(term)
+        if cached is not None:
+            return dict(cached)
+
+        try:
+            with connect(self.db_path) as conn:
+                row = conn.execute(
+                    """
+                    SELECT term, tier, category, definition, example, why_important
+                    FROM term_explanations WHERE term = ?
+                    """,
+                    (term,)
+                ).fetchone()
+        except sqlite3.Error as e:
+            print(f"[WARNING] 용어 설명 조회 실패: {e}")
+            return None
+
+        if not row:
+            return None
+
+        explanation = dict(row)
+        with self._lock:
+            self._memory[term] = explanation
+        return dict(explanation)
+
+    def __contains__(self, term: str) -> bool:
+        return self.get(term) is not None
+
+    def frequent_misses(self, min_count: int = 2, limit: int = 10) -> list[str]:
+        """설명 없이 자주 조회된 용어 (조회 횟수 내림차순)"""
+        with connect(self.db_path) as conn:
+            rows = conn.execute(
+                """
+                SELECT m.term FROM term_misses m
+                LEFT JOIN term_explanations e ON e.term = m.term
+                WHERE e.term IS NULL AND m.count >= ?
+                ORDER BY m.count DESC, m.last_seen DESC
+                LIMIT ?
+                """,
+                (min_count, limit)
+            ).fetchall()
+        return [row['term'] for row in rows]
+
+    # ===== 저장 =====
+
+    def save(self, explanation: dict, model: str = None) -> dict:
+        """
+        생성한 설명 저장
+
+        같은 용어를 동시에 생성한 경우 먼저 저장된 설명을 유지하고 그 설명을 반환
+
+        Returns:
+            저장소에 남은 설명
+        """
+        term = explanation['term']
+
+        try:
+            with connect(self.db_path) as conn:
+                conn.execute(
+                    """
+                    INSERT OR IGNORE INTO term_explanations
+                        (term, tier, category, definition, example, why_important, model, created_at)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                    """,
+                    (
+                        term,
+                        explanation.get('tier', 3),
+                        explanation.get('category'),
+                        explanation['definition'],
+                        explanation.get('example'),
+                        explanation.get('why_important'),
+                        model,
+                        datetime.now().isoformat()
+                    )
+                )
+                conn.execute("DELETE FROM term_misses WHERE term = ?", (term,))
+        except sqlite3.Error as e:
+            print(f"[WARNING] 용어 설명 저장 실패: {e}")
+            return explanation
+
+        return self.get(term) or explanation
+
+    def record_miss(self, term: str):
+        """설명이 없는 용어 조회 기록"""
+        try:
+            with connect(self.db_path) as conn:
+                conn.execute(
+                    """
+                    INSERT INTO term_misses (term, count, last_seen) VALUES (?, 1, ?)
+                    ON CONFLICT(term) DO UPDATE SET
+                        count = count + 1,
+                        last_seen = excluded.last_seen
+                    """,
+                    (term, datetime.now().isoformat())
+                )
+        except sqlite3.Error as e:
+            print(f"[WARNING] 용어 조회 기록 실패: {e}")
+
+    def delete(self, term: str):
+        """저장된 설명 삭제 (잘못 생성된 설명 재생성용)"""
+        with connect(self.db_path) as conn:
+            conn.execute("DELETE FROM term_explanations WHERE term = ?", (term,))
+        with self._lock:
+            self._memory.pop(term, None)
@@ -9,6 +9,7 @@ import os
 from openai import OpenAI
 from typing import List, Dict
 from utils.config import Config
+from utils.http_client import http_get
 
 
 class ImageCardGenerator:
@@ -213,9 +214,7 @@ MOOD: Informative, professional, approachable
         Returns:
             저장된 파일 경로
         """
-        import requests
-
-        response = requests.get(url)
+        response = http_get(url)
         response.raise_for_status()
 
         with open(save_path, 'wb') as f:
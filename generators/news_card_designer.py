@@ -7,10 +7,10 @@
 
 import os
 import platform
-import requests
 from PIL import Image, ImageDraw, ImageFont, ImageFilter
 from io import BytesIO
 from typing import List, Tuple, Optional
+from utils.http_client import http_get
 
 
 class NewsCardDesigner:
@@ -77,7 +77,7 @@ class NewsCardDesigner:
         url = f"https://source.unsplash.com/1080x1080/?{keyword},business,finance"
 
         try:
-            response = requests.get(url, timeout=10)
+            response = http_get(url)
             response.raise_for_status()
             img = Image.open(BytesIO(response.content))
             return img.resize(self.card_size)
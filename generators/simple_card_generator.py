@@ -8,12 +8,12 @@
 
 import os
 import platform
-import requests
 from PIL import Image, ImageDraw, ImageFont
 from io import BytesIO
 from typing import List
 from openai import OpenAI
 from utils.config import Config
+from utils.http_client import http_get
 
 
 class SimpleCardGenerator:
@@ -113,7 +113,7 @@ Important: NO TEXT or LETTERS visible anywhere in the image."""
             image_url = response.data[0].url
             print(f"   [OK] DALL-E 이미지 생성 완료")
 
-            image_response = requests.get(image_url)
+            image_response = http_get(image_url)
             image_response.raise_for_status()
 
             img = Image.open(BytesIO(image_response.content))
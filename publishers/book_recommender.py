@@ -1,43 +1,181 @@
 # -*- coding: utf-8 -*-
-import json
+import heapq
+from collections import defaultdict
 from pathlib import Path
 from typing import List, Dict
 
+import numpy as np
+
+from utils.config import Config
+from utils.data_loader import get_data_file
+from utils.keyword_matcher import KeywordMatcher
+from utils.tfidf_index import TfidfIndex
+
 
 class BookRecommender:
-    def __init__(self, books_db_path: str = './data/recommended_books.json'):
+    def __init__(self, books_db_path: str = './data/recommended_books.json', index_dir: str = None):
         self.books_db_path = Path(books_db_path)
-        self.books_db = self._load_books()
+        # 처음 접근 시 로드, 파일 수정 시 자동 재로드
+        self.books_data = get_data_file(str(self.books_db_path), default={})
+        self._indexed_db = None
+        # 도서 설명 TF-IDF 인덱스 (tfidf 모드에서 처음 사용할 때 빌드/로드)
+        self._tfidf = TfidfIndex(index_dir or Config.BOOK_INDEX_DIR)
+        self._tfidf_db = None
+
+    @property
+    def books_db(self) -> Dict:
+        return self.books_data.load()
+
+    # ===== 인덱스 =====
+
+    def _ensure_index(self):
+        """도서 DB가 (다시) 로드되었으면 키워드 인덱스 재생성"""
+        books_db = self.books_db
+        if self._indexed_db is books_db:
+            return
+
+        # 도서 목록 (원래 순회 순서 = 동점 시 우선순위)
+        self._books = [
+            (category, book)
+            for category, books in books_db.items()
+            for book in books
+        ]
+
+        # 정규화 키워드 → [(도서 번호, 해당 도서에서의 등장 횟수)]
+        postings = defaultdict(lambda: defaultdict(int))
+        for book_id, (_, book) in enumerate(self._books):
+            for kw in book.get('keywords', []):
+                postings[kw.lower()][book_id] += 1
+
+        self._empty_postings = list(postings.pop('', {}).items())  # 빈 키워드는 모든 문자열에 포함
+        self._vocab = list(postings.keys())
+        self._postings = [list(postings[kw].items()) for kw in self._vocab]
+        self._matcher = KeywordMatcher(self._vocab)
+
+        # 부분 문자열 역검색용 (글자/bigram → 키워드 ID)
+        self._ngram_index = defaultdict(set)
+        for term_id, kw in enumerate(self._vocab):
+            for ch in kw:
+                self._ngram_index[ch].add(term_id)
+            for i in range(len(kw) - 1):
+                self._ngram_index[kw[i:i + 2]].add(term_id)
+
+        self._indexed_db = books_db
+
+    def _ensure_tfidf(self):
+        """도서 DB가 바뀌었으면 TF-IDF 인덱스 갱신 (바뀐 도서만 다시 토큰화)"""
+        self._ensure_index()
+        if self._tfidf_db is self._indexed_db:
+            return
+
+        self._tfidf.build([self._book_text(book) for _, book in self._books])
+        self._tfidf_db = self._indexed_db
+
+    @staticmethod
+    def _book_text(book: Dict) -> str:
+        return ' '.join([
+            book.get('title', ''),
+            book.get('description', ''),
+            ' '.join(book.get('keywords', [])),
+        ])
+
+    def _terms_containing(self, text: str) -> set[int]:
+        """text를 부분 문자열로 포함하는 키워드 ID (bigram posting 교집합 후 검증)"""
+        if not text:
+            return set(range(len(self._vocab)))
+
+        grams = [text] if len(text) == 1 else [text[i:i + 2] for i in range(len(text) - 1)]
+        postings = [self._ngram_index.get(gram) for gram in set(grams)]
+        if not all(postings):
+            return set()
+
+        candidates = set.intersection(*sorted(postings, key=len))
+        return {term_id for term_id in candidates if text in self._vocab[term_id]}
+
+    # ===== 추천 =====
+
+    def recommend(self, article_data: dict, max_books: int = 2, mode: str = None) -> List[Dict]:
+        """
+        기사와 관련된 도서 추천
+
+        Args:
+            article_data: {'title', 'keywords', 'content'}
+            max_books: 최대 추천 수
+            mode: 'keyword' (키워드 배점) / 'tfidf' (문자 n-gram 유사도), None이면 Config.BOOK_RECOMMENDER_MODE
+        """
+        if (mode or Config.BOOK_RECOMMENDER_MODE) == 'tfidf':
+            return self._recommend_tfidf(article_data, max_books)
 
-    def _load_books(self) -> Dict:
-        try:
-            with open(self.books_db_path, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        except FileNotFoundError:
-            print(f"[WARNING] Books DB not found: {self.books_db_path}")
-            return {}
+        self._ensure_index()
 
-    def recommend(self, article_data: dict, max_books: int = 2) -> List[Dict]:
         keywords = article_data.get('keywords', [])
         title = article_data.get('title', '')
         content = article_data.get('content', '')
-        
+
         all_text = f"{title} {' '.join(keywords)} {content}".lower()
-        
-        scored_books = []
-        
-        for category, books in self.books_db.items():
-            for book in books:
-                score = self._calculate_score(book, all_text, keywords)
-                if score > 0:
-                    book_copy = book.copy()
-                    book_copy['score'] = score
-                    book_copy['category'] = category
-                    scored_books.append(book_copy)
-        
-        scored_books.sort(key=lambda x: x['score'], reverse=True)
-        
-        return scored_books[:max_books]
+        article_keywords = [kw.lower() for kw in keywords]
+
+        # 도서별 점수 (_calculate_score와 같은 배점)
+        scores = defaultdict(int)
+
+        # 1. 도서 키워드가 기사 본문에 등장: +10
+        for term_id in self._matcher.find_all(all_text):
+            for book_id, count in self._postings[term_id]:
+                scores[book_id] += 10 * count
+
+        # 2. 도서 키워드와 기사 키워드가 서로 포함 관계: 기사 키워드마다 +20
+        for article_kw in article_keywords:
+            matched = self._matcher.find_all(article_kw) | self._terms_containing(article_kw)
+            for term_id in matched:
+                for book_id, count in self._postings[term_id]:
+                    scores[book_id] += 20 * count
+
+        for book_id, count in self._empty_postings:
+            scores[book_id] += (10 + 20 * len(article_keywords)) * count
+
+        # 상위 K개 (동점이면 DB 순서)
+        top = heapq.nlargest(
+            max_books,
+            ((score, book_id) for book_id, score in scores.items() if score > 0),
+            key=lambda item: (item[0], -item[1])
+        )
+
+        recommendations = []
+        for score, book_id in top:
+            category, book = self._books[book_id]
+            book_copy = book.copy()
+            book_copy['score'] = score
+            book_copy['category'] = category
+            recommendations.append(book_copy)
+
+        return recommendations
+
+    def _recommend_tfidf(self, article_data: dict, max_books: int) -> List[Dict]:
+        """기사 텍스트와 도서 설명의 코사인 유사도 상위 도서"""
+        self._ensure_tfidf()
+
+        keywords = article_data.get('keywords', [])
+        text = f"{article_data.get('title', '')} {' '.join(keywords)} {article_data.get('content', '')}"
+        scores = self._tfidf.query(text, len(self._books))
+
+        top = heapq.nlargest(
+            max_books,
+            (
+                (float(scores[book_id]), int(book_id))
+                for book_id in np.flatnonzero(scores >= Config.BOOK_TFIDF_MIN_SCORE)
+            ),
+            key=lambda item: (item[0], -item[1])
+        )
+
+        recommendations = []
+        for score, book_id in top:
+            category, book = self._books[book_id]
+            book_copy = book.copy()
+            book_copy['score'] = round(score, 4)
+            book_copy['category'] = category
+            recommendations.append(book_copy)
+
+        return recommendations
 
     def _calculate_score(self, book: Dict, text: str, keywords: List[str]) -> int:
         score = 0
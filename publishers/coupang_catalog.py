@@ -0,0 +1,107 @@
+# -*- coding: utf-8 -*-
+"""
+쿠팡 추천 카테고리 카탈로그
+
+data/coupang_catalog.json의 카테고리별 키워드를 기사 키워드/제목/본문과 매칭해
+LLM 호출 없이 추천 카테고리 선정
+- 기사 키워드(extract_keywords 결과)와 포함 관계: +3
+- 제목에 등장: +2 / 본문에 등장: +1
+카테고리 점수 = 카테고리 키워드별 점수 합 (동점이면 카탈로그 순서)
+"""
+
+from collections import defaultdict
+from typing import Dict, List
+
+from utils.data_loader import get_data_file
+from utils.keyword_matcher import KeywordMatcher
+
+
+class CoupangCatalog:
+    """키워드 기반 로컬 추천 인덱스"""
+
+    KEYWORD_SCORE = 3
+    TITLE_SCORE = 2
+    CONTENT_SCORE = 1
+
+    def __init__(self, catalog_path: str = './data/coupang_catalog.json'):
+        # 처음 접근 시 로드, 파일 수정 시 자동 재로드
+        self.catalog_data = get_data_file(catalog_path, key='categories', default=[])
+        self._indexed = None
+
+    @property
+    def categories(self) -> List[Dict]:
+        return self.catalog_data.load()
+
+    def _ensure_index(self):
+        """카탈로그가 (다시) 로드되었으면 키워드 인덱스 재생성"""
+        categories = self.categories
+        if self._indexed is categories:
+            return
+
+        # 정규화 키워드 → 카테고리 번호 목록
+        postings = defaultdict(list)
+        for entry_id, entry in enumerate(categories):
+            for kw in {kw.lower() for kw in entry.get('keywords', []) if kw}:
+                postings[kw].append(entry_id)
+
+        self._vocab = list(postings.keys())
+        self._postings = [postings[kw] for kw in self._vocab]
+        self._matcher = KeywordMatcher(self._vocab)
+        self._indexed = categories
+
+    def score(self, article_data: dict) -> Dict[int, int]:
+        """
+        카테고리별 매칭 점수
+
+        Returns:
+            {카테고리 번호: 점수} (0점 카테고리 제외)
+        """
+        self._ensure_index()
+
+        title = article_data.get('title', '').lower()
+        content = article_data.get('content', '').lower()
+        # 한 글자 키워드는 포함 관계가 너무 넓어 제외
+        article_keywords = [kw.lower() for kw in article_data.get('keywords', []) if len(kw) >= 2]
+
+        term_scores = defaultdict(int)
+        for term_id in self._matcher.find_all(title):
+            term_scores[term_id] += self.TITLE_SCORE
+        for term_id in self._matcher.find_all(content):
+            term_scores[term_id] += self.CONTENT_SCORE
+        for term_id, kw in enumerate(self._vocab):
+            if any(kw in akw or akw in kw for akw in article_keywords):
+                term_scores[term_id] += self.KEYWORD_SCORE
+
+        scores = defaultdict(int)
+        for term_id, score in term_scores.items():
+            for entry_id in self._postings[term_id]:
+                scores[entry_id] += score
+        return dict(scores)
+
+    def match(self, article_data: dict, max_items: int = 3, min_score: int = 1) -> List[Dict]:
+        """
+        점수 상위 카테고리
+
+        Args:
+            article_data: {'title', 'content', 'keywords'}
+            max_items: 최대 개수
+            min_score: 최소 점수 (미만이면 제외)
+
+        Returns:
+            [{'category', 'hook_title', 'score'}] (점수 내림차순)
+        """
+        scores = self.score(article_data)
+        ranked = sorted(
+            (entry_id for entry_id, score in scores.items() if score >= min_score),
+            key=lambda entry_id: (-scores[entry_id], entry_id)
+        )
+
+        categories = self.categories
+        return [
+            {
+                'category': categories[entry_id]['category'],
+                'hook_title': categories[entry_id].get('hook_title', ''),
+                'score': scores[entry_id],
+            }
+            for entry_id in ranked[:max_items]
+        ]
@@ -1,9 +1,16 @@
 # -*- coding: utf-8 -*-
+import json
 import re
 import os
 from typing import Dict, List
 import google.generativeai as genai
 
+from database.llm_cache import LLMCache
+from publishers.coupang_catalog import CoupangCatalog
+from utils.config import Config
+from utils.llm_concurrency import llm_semaphore
+from utils.llm_response import extract_json
+
 
 class CoupangPartners:
     """
@@ -19,13 +26,14 @@ class CoupangPartners:
        - 모든 제휴 링크 사용 시 공정거래위원회 가이드라인에 따른 대가성 문구 필수
 
     3. 추천 프로세스:
-       - 뉴스 내용 분석 → Gemini로 관련 상품/카테고리 선정
-       - Gemini로 후킹 가능한 강렬한 한줄 타이틀 생성
+       - 기사 키워드를 카테고리 카탈로그(data/coupang_catalog.json)와 매칭 → 확신도가 충분하면 바로 사용
+       - 아니면 같은 키워드 조합의 이전 LLM 추천 재사용 (LLM 캐시)
+       - 둘 다 없을 때만 Gemini로 관련 상품/카테고리 + 후킹 타이틀 생성
        - 파트너스 링크 + 준수사항 포함
 
     사용 방법:
         partners = CoupangPartners(api_key=GEMINI_API_KEY)
-        recommendations = partners.generate_recommendations(article_data, max_items=3)
+        recommendations = partners.analyze_and_recommend(article_data, max_items=3)
     """
 
     # 공정거래위원회 권장 대가성 문구
@@ -35,28 +43,41 @@ class CoupangPartners:
     # TODO: API 승인 후 상품별 동적 링크 생성으로 변경
     DEFAULT_PARTNER_LINK = "https://link.coupang.com/a/cVz6PI"
 
-    def __init__(self, api_key: str = None, disclosure_text: str = None, partner_link: str = None):
+    MODEL_NAME = 'gemini-2.0-flash-lite'
+
+    def __init__(
+        self,
+        api_key: str = None,
+        disclosure_text: str = None,
+        partner_link: str = None,
+        catalog_path: str = './data/coupang_catalog.json'
+    ):
         """
         Args:
             api_key: Gemini API 키 (선택사항, 환경변수에서 자동 로드)
             disclosure_text: 사용자 정의 대가성 문구 (선택사항, 기본값 사용 권장)
             partner_link: 사용할 파트너스 링크 (선택사항, 기본값 사용)
+            catalog_path: 로컬 추천용 카테고리 카탈로그 경로
         """
         self.disclosure_text = disclosure_text or self.DEFAULT_DISCLOSURE
         self.partner_link = partner_link or self.DEFAULT_PARTNER_LINK
+        self.catalog = CoupangCatalog(catalog_path)
+        self.cache = LLMCache()
 
         # Gemini API 설정
         self.api_key = api_key or os.getenv('GEMINI_API_KEY')
         if self.api_key:
             genai.configure(api_key=self.api_key)
-            self.model = genai.GenerativeModel('gemini-2.0-flash-lite')
+            self.model = genai.GenerativeModel(self.MODEL_NAME)
         else:
             self.model = None
             print("[WARNING] Gemini API key not found. AI features disabled.")
 
     def analyze_and_recommend(self, article_data: dict, max_items: int = 3) -> List[Dict]:
         """
-        뉴스 내용을 분석하여 쿠팡 파트너스 추천 생성 (AI 기반)
+        뉴스 내용을 분석하여 쿠팡 파트너스 추천 생성
+
+        로컬 카탈로그 매칭 → 키워드 조합별 LLM 캐시 → Gemini 순으로 시도
 
         Args:
             article_data: 뉴스 기사 데이터 (title, content, keywords 등)
@@ -65,15 +86,118 @@ class CoupangPartners:
         Returns:
             추천 목록 [{'category': '카테고리', 'hook_title': '후킹 타이틀', 'affiliate_link': '링크'}]
         """
+        recommendations = self._recommend_without_llm(article_data, max_items)
+        if recommendations is not None:
+            return recommendations
+
         if not self.model:
             print("[ERROR] Gemini API not configured. Cannot generate recommendations.")
             return []
 
+        try:
+            response = self.model.generate_content(self._build_prompt(article_data, max_items))
+            recommendations = self._parse_recommendations(response.text.strip(), max_items)
+            self._cache_recommendations(article_data, max_items, recommendations)
+            return recommendations
+
+        except Exception as e:
+            print(f"[ERROR] Failed to generate recommendations: {e}")
+            return []
+
+    async def analyze_and_recommend_async(self, article_data: dict, max_items: int = 3) -> List[Dict]:
+        """
+        analyze_and_recommend()의 비동기 버전
+
+        Gemini 분석과 동시에 실행할 수 있도록 SDK의 비동기 호출 사용 (전역 동시 호출 수 제한 적용)
+        """
+        recommendations = self._recommend_without_llm(article_data, max_items)
+        if recommendations is not None:
+            return recommendations
+
+        if not self.model:
+            print("[ERROR] Gemini API not configured. Cannot generate recommendations.")
+            return []
+
+        try:
+            async with llm_semaphore():
+                response = await self.model.generate_content_async(self._build_prompt(article_data, max_items))
+            recommendations = self._parse_recommendations(response.text.strip(), max_items)
+            self._cache_recommendations(article_data, max_items, recommendations)
+            return recommendations
+
+        except Exception as e:
+            print(f"[ERROR] Failed to generate recommendations: {e}")
+            return []
+
+    # ===== LLM 없이 추천 =====
+
+    def recommend_local(self, article_data: dict, max_items: int = 3, min_score: int = None) -> List[Dict]:
+        """
+        카탈로그 매칭 추천 (확신도가 min_score 이상인 카테고리만)
+
+        Args:
+            min_score: 최소 매칭 점수 (None이면 Config.COUPANG_LOCAL_MIN_SCORE)
+        """
+        if min_score is None:
+            min_score = Config.COUPANG_LOCAL_MIN_SCORE
+
+        return [
+            {
+                'category': match['category'],
+                'hook_title': match['hook_title'],
+                'affiliate_link': self.partner_link,
+            }
+            for match in self.catalog.match(article_data, max_items, min_score)
+        ]
+
+    def _recommend_without_llm(self, article_data: dict, max_items: int):
+        """로컬 매칭 → 캐시 순으로 조회 (둘 다 없으면 None)"""
+        recommendations = self.recommend_local(article_data, max_items)
+        if recommendations:
+            print(f"[INFO] 쿠팡 추천: 로컬 카탈로그 매칭 ({recommendations[0]['category']})")
+            return recommendations
+
+        cache_prompt = self._cache_prompt(article_data, max_items)
+        if cache_prompt is None:
+            return None
+
+        cached = self.cache.get('coupang_recommend', self.MODEL_NAME, cache_prompt)
+        if cached is None:
+            return None
+
+        try:
+            recommendations = self._parse_recommendations(cached, max_items)
+        except ValueError:
+            return None
+        print("[INFO] 쿠팡 추천: 같은 키워드 조합의 캐시 사용")
+        return recommendations
+
+    def _cache_recommendations(self, article_data: dict, max_items: int, recommendations: List[Dict]):
+        cache_prompt = self._cache_prompt(article_data, max_items)
+        if cache_prompt is None or not recommendations:
+            return
+
+        response = json.dumps(
+            [{'category': rec.get('category'), 'hook_title': rec.get('hook_title')} for rec in recommendations],
+            ensure_ascii=False
+        )
+        self.cache.set('coupang_recommend', self.MODEL_NAME, cache_prompt, response)
+
+    @staticmethod
+    def _cache_prompt(article_data: dict, max_items: int):
+        """캐시 키용 문자열 (키워드 집합 + 개수, 키워드가 없으면 None)"""
+        keywords = sorted({kw.strip().lower() for kw in article_data.get('keywords', []) if kw.strip()})
+        if not keywords:
+            return None
+        return f"{max_items}\n" + '\n'.join(keywords)
+
+    def _build_prompt(self, article_data: dict, max_items: int) -> str:
+        """추천 생성 프롬프트"""
         title = article_data.get('title', '')
         content = article_data.get('content', '')
         keywords = article_data.get('keywords', [])
 
-        prompt = f"""
+        return f"""
 당신은 쿠팡 파트너스 마케팅 전문가입니다.
 다음 뉴스 기사를 읽은 독자가 관심 가질 만한 쿠팡 상품을 {max_items}개 추천하고, 각각에 대해 클릭을 유도하는 강렬한 한 줄 타이틀을 작성해주세요.
 
@@ -105,28 +229,20 @@ class CoupangPartners:
 JSON만 출력하세요. 다른 설명은 넣지 마세요.
         """.strip()
 
-        try:
-            response = self.model.generate_content(prompt)
-            result_text = response.text.strip()
-
-            # JSON 추출 (```json 태그 제거)
-            if '```json' in result_text:
-                result_text = result_text.split('```json')[1].split('```')[0].strip()
-            elif '```' in result_text:
-                result_text = result_text.split('```')[1].split('```')[0].strip()
-
-            import json
-            recommendations = json.loads(result_text)
+    def _parse_recommendations(self, result_text: str, max_items: int) -> List[Dict]:
+        """응답 JSON을 추천 목록으로 변환 (affiliate_link 추가)"""
+        # 코드 블록/끝 쉼표/잘린 출력 등 보정 후 파싱
+        recommendations = extract_json(result_text)
+        if isinstance(recommendations, dict):
+            # {"recommendations": [...]} 처럼 감싸서 응답한 경우
+            recommendations = next((v for v in recommendations.values() if isinstance(v, list)), [recommendations])
+        recommendations = [rec for rec in recommendations if isinstance(rec, dict) and rec.get('category')]
 
-            # affiliate_link 추가
-            for rec in recommendations:
-                rec['affiliate_link'] = self.partner_link
+        # affiliate_link 추가
+        for rec in recommendations:
+            rec['affiliate_link'] = self.partner_link
 
-            return recommendations[:max_items]
-
-        except Exception as e:
-            print(f"[ERROR] Failed to generate recommendations: {e}")
-            return []
+        return recommendations[:max_items]
 
     def get_disclosure_text(self) -> str:
         """대가성 문구 반환"""
@@ -7,12 +7,12 @@
 """
 
 import asyncio
-import json
 import os
 from datetime import datetime
 from typing import Optional, Dict
 import pytz
 from publishers.telegram_publisher import TelegramPublisher
+from utils.data_loader import get_data_file
 
 
 class DailyTipPublisher:
@@ -25,45 +25,19 @@ class DailyTipPublisher:
         self.terms_file = os.path.join('data', 'economic_terms.json')
         self.tips_file = os.path.join('data', 'investment_tips.json')
 
-        # 데이터 로드
-        self.terms = self._load_terms()
-        self.tips = self._load_tips()
+        # 데이터 파일 (처음 접근 시 로드, 파일 수정 시 자동 재로드)
+        self.terms_data = get_data_file(self.terms_file, key='terms', default=[])
+        self.tips_data = get_data_file(self.tips_file, key='tips', default=[])
 
-    def _load_terms(self) -> list:
-        """경제 용어 JSON 로드"""
-        try:
-            with open(self.terms_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                return data.get('terms', [])
-        except Exception as e:
-            print(f"[ERROR] Failed to load economic terms: {e}")
-            return []
+    @property
+    def terms(self) -> list:
+        """경제 용어 목록"""
+        return self.terms_data.load()
 
-    def _load_tips(self) -> list:
-        """투자 꿀팁 JSON 로드"""
-        try:
-            with open(self.tips_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                return data.get('tips', [])
-        except Exception as e:
-            print(f"[ERROR] Failed to load investment tips: {e}")
-            return []
-
-    def _get_daily_index(self, total: int) -> int:
-        """
-        날짜 기반 순환 인덱스 계산
-
-        Args:
-            total: 전체 아이템 개수
-
-        Returns:
-            오늘의 인덱스 (0 ~ total-1)
-        """
-        now = datetime.now(self.kst)
-        # 연도의 몇 번째 날인지 (1-365/366)
-        day_of_year = now.timetuple().tm_yday
-        # 순환 인덱스
-        return (day_of_year - 1) % total
+    @property
+    def tips(self) -> list:
+        """투자 꿀팁 목록"""
+        return self.tips_data.load()
 
     def format_economic_term(self, term: Dict) -> str:
         """
@@ -119,13 +93,12 @@ class DailyTipPublisher:
             print(f"[{current_time}] Sending daily economic term...")
             print(f"{'='*70}\n")
 
-            if not self.terms:
+            # 오늘의 용어 선택 (순환)
+            selected = self.terms_data.get_for_date(datetime.now(self.kst))
+            if not selected:
                 print("[ERROR] No economic terms available")
                 return False
-
-            # 오늘의 용어 선택 (순환)
-            index = self._get_daily_index(len(self.terms))
-            term = self.terms[index]
+            index, term = selected
 
             print(f"[INFO] Selected term #{index + 1}/{len(self.terms)}: {term['term']}")
 
@@ -136,7 +109,7 @@ class DailyTipPublisher:
             # 텔레그램 전송
             print("[Step] Sending to Telegram...")
             publisher = TelegramPublisher()
-            success = await publisher.send_text(message)
+            success = await publisher.send_simple_message(message)
 
             if success:
                 print(f"\n{'='*70}")
@@ -168,13 +141,12 @@ class DailyTipPublisher:
             print(f"[{current_time}] Sending daily investment tip...")
             print(f"{'='*70}\n")
 
-            if not self.tips:
+            # 오늘의 팁 선택 (순환)
+            selected = self.tips_data.get_for_date(datetime.now(self.kst))
+            if not selected:
                 print("[ERROR] No investment tips available")
                 return False
-
-            # 오늘의 팁 선택 (순환)
-            index = self._get_daily_index(len(self.tips))
-            tip = self.tips[index]
+            index, tip = selected
 
             print(f"[INFO] Selected tip #{index + 1}/{len(self.tips)}: {tip['title']}")
 
@@ -185,7 +157,7 @@ class DailyTipPublisher:
             # 텔레그램 전송
             print("[Step] Sending to Telegram...")
             publisher = TelegramPublisher()
-            success = await publisher.send_text(message)
+            success = await publisher.send_simple_message(message)
 
             if success:
                 print(f"\n{'='*70}")
@@ -0,0 +1,184 @@
+# -*- coding: utf-8 -*-
+"""
+공유 텔레그램 봇 클라이언트
+
+모든 퍼블리셔(뉴스/시장 현황/차트/꿀팁)가 하나의 Bot과 HTTP 연결 풀을 재사용
+- 봇 초기화(get_me)와 TLS 연결을 발송마다 반복하지 않음
+- httpx 연결 풀은 생성된 이벤트 루프에 묶이므로 (봇 토큰, 이벤트 루프)별로 하나씩 유지
+- 오래 쉬었다가 사용할 때 헬스 체크(get_me), 실패하면 클라이언트 재생성
+- 연결 풀 고갈(Pool timeout)/닫힌 연결 오류는 클라이언트를 재생성하고 한 번 재시도
+
+사용 예:
+    client = get_client(token)
+    await client.run(lambda bot: bot.send_message(chat_id=chat_id, text=text))
+"""
+
+import asyncio
+import time
+import weakref
+from typing import Awaitable, Callable, Optional, TypeVar
+
+from telegram import Bot
+from telegram.error import NetworkError, TimedOut
+from telegram.request import HTTPXRequest
+
+from utils.config import Config
+
+
+T = TypeVar('T')
+
+
+class TelegramClient:
+    """장기 실행용 봇 클라이언트 (이벤트 루프 1개 전용)"""
+
+    def __init__(self, token: str):
+        """
+        Args:
+            token: 봇 토큰
+        """
+        self.token = token
+        self.bot: Optional[Bot] = None
+        self._initialized = False
+        self._last_ok = 0.0  # 마지막으로 정상 응답을 받은 시각 (monotonic)
+        self._lock = asyncio.Lock()
+        self._create_bot()
+
+    def _create_bot(self):
+        request = HTTPXRequest(
+            connection_pool_size=Config.TELEGRAM_POOL_SIZE,
+            pool_timeout=Config.TELEGRAM_POOL_TIMEOUT,
+            connect_timeout=Config.TELEGRAM_CONNECT_TIMEOUT,
+            read_timeout=Config.TELEGRAM_READ_TIMEOUT,
+            write_timeout=Config.TELEGRAM_READ_TIMEOUT,
+        )
+        self.bot = Bot(token=self.token, request=request)
+        self._initialized = False
+
+    # ===== 연결 관리 =====
+
+    async def get_bot(self) -> Bot:
+        """
+        사용 가능한 Bot 반환
+
+        처음 사용하거나 TELEGRAM_HEALTHCHECK_INTERVAL 이상 쉬었으면 get_me로 상태 확인,
+        실패하면 클라이언트를 새로 만들어 한 번 더 확인
+        """
+        async with self._lock:
+            idle = time.monotonic() - self._last_ok
+            if self._initialized and idle < Config.TELEGRAM_HEALTHCHECK_INTERVAL:
+                return self.bot
+
+            try:
+                await self._check()
+            except (NetworkError, RuntimeError) as e:
+                print(f"[WARNING] 텔레그램 연결 상태 확인 실패, 클라이언트 재생성: {e}")
+                await self._recreate()
+                await self._check()
+
+            return self.bot
+
+    async def _check(self):
+        if not self._initialized:
+            await self.bot.initialize()  # get_me 포함
+            self._initialized = True
+        else:
+            await self.bot.get_me()
+        self._last_ok = time.monotonic()
+
+    async def _recreate(self):
+        old_bot = self.bot
+        self._create_bot()
+        try:
+            await old_bot.shutdown()
+        except Exception as e:
+            print(f"[WARNING] 이전 텔레그램 클라이언트 종료 실패: {e}")
+
+    async def reset(self, failed_bot: Optional[Bot] = None):
+        """
+        연결 풀을 버리고 새로 생성
+
+        Args:
+            failed_bot: 오류가 난 Bot (이미 다른 요청이 재생성했으면 현재 Bot을 그대로 사용)
+        """
+        async with self._lock:
+            if failed_bot is None or self.bot is failed_bot:
+                await self._recreate()
+
+    async def shutdown(self):
+        """연결 풀 종료"""
+        async with self._lock:
+            if self._initialized:
+                await self.bot.shutdown()
+            self._initialized = False
+
+    # ===== 호출 =====
+
+    async def run(self, request: Callable[[Bot], Awaitable[T]]) -> T:
+        """
+        봇 API 호출 (연결 문제 시 클라이언트 재생성 후 1회 재시도)
+
+        Args:
+            request: Bot을 받아 API를 호출하는 함수 (재시도 시 다시 호출되므로 파일은 함수 안에서 열 것)
+
+        Raises:
+            telegram.error.TelegramError: 재시도 후에도 실패하거나 재시도 대상이 아닌 오류
+        """
+        bot = await self.get_bot()
+        try:
+            result = await request(bot)
+        except (TimedOut, NetworkError, RuntimeError) as e:
+            if not self._is_connection_error(e):
+                raise
+            print(f"[WARNING] 텔레그램 연결 오류, 클라이언트 재생성 후 재시도: {e}")
+            # 동시에 실패한 요청들이 서로 새로 만든 Bot을 닫지 않도록 실패한 Bot일 때만 재생성
+            await self.reset(bot)
+            result = await request(await self.get_bot())
+
+        self._last_ok = time.monotonic()
+        return result
+
+    @staticmethod
+    def _is_connection_error(error: Exception) -> bool:
+        """클라이언트를 새로 만들면 해결되는 오류인지 (풀 고갈/닫힌 연결)"""
+        message = str(error)
+        if isinstance(error, RuntimeError):
+            return 'not initialized' in message or 'closed' in message.lower()
+        if isinstance(error, TimedOut):
+            return 'Pool timeout' in message
+        # 요청 자체가 잘못된 경우(BadRequest/Forbidden 등)는 재시도해도 같은 결과
+        return type(error) is NetworkError
+
+
+# (이벤트 루프 → {봇 토큰: 클라이언트}), 루프가 사라지면 함께 정리
+_clients: 'weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, dict[str, TelegramClient]]' = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def get_client(token: str = None) -> TelegramClient:
+    """
+    현재 이벤트 루프의 공유 클라이언트 (실행 중인 루프 안에서 호출)
+
+    Args:
+        token: 봇 토큰 (None이면 Config.TELEGRAM_BOT_TOKEN)
+    """
+    token = token or Config.TELEGRAM_BOT_TOKEN
+    if not token:
+        raise ValueError("TELEGRAM_BOT_TOKEN not set")
+
+    loop = asyncio.get_running_loop()
+    clients = _clients.setdefault(loop, {})
+    client = clients.get(token)
+    if client is None:
+        client = clients[token] = TelegramClient(token)
+    return client
+
+
+async def shutdown_clients():
+    """현재 이벤트 루프의 클라이언트 모두 종료 (프로세스/루프 종료 전 호출)"""
+    clients = _clients.pop(asyncio.get_running_loop(), {})
+    for client in clients.values():
+        try:
+            await client.shutdown()
+        except Exception as e:
+            print(f"[WARNING] 텔레그램 클라이언트 종료 실패: {e}")
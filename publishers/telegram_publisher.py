@@ -1,12 +1,34 @@
 # -*- coding: utf-8 -*-
 import os
-import asyncio
-from telegram import Bot
+from typing import List, Optional
+
+from telegram import Bot, InputMediaPhoto
+from telegram.error import BadRequest, RetryAfter
+from database.outbox import Outbox
+from database.telegram_file_cache import TelegramFileCache
+from publishers.telegram_client import TelegramClient, get_client
+from publishers.telegram_send_queue import DeliveryReport, SendQueue, get_send_queue
+from utils.config import Config
 from publishers.telegram_formatters import get_formatter
 
 
 class TelegramPublisher:
-    def __init__(self, bot_token: str = None, chat_id: str = None, format_version: str = None):
+    MEDIA_GROUP_SIZE = 10  # 텔레그램 앨범 1개 최대 사진 수
+    # 저장된 file_id를 더 쓸 수 없을 때 텔레그램 오류 메시지 (그 외 "file is too big" 등은 다시 올려도 같은 결과)
+    STALE_FILE_ERRORS = (
+        'wrong file identifier',
+        'wrong remote file id',
+        'file reference expired',
+        'wrong type of the web page content',
+    )
+
+    def __init__(
+        self,
+        bot_token: str = None,
+        chat_id: str = None,
+        format_version: str = None,
+        chat_ids: List[str] = None
+    ):
         """
         텔레그램 퍼블리셔
 
@@ -14,83 +36,253 @@ class TelegramPublisher:
             bot_token: 봇 토큰 (None이면 환경변수 사용)
             chat_id: 채팅 ID (None이면 환경변수 사용)
             format_version: 포맷 버전 ('v1', 'v2', etc. None이면 환경변수 또는 기본값)
+            chat_ids: 기사 동시 발송 대상 (None이면 chat_id 인자 → TELEGRAM_CHAT_IDS → TELEGRAM_CHAT_ID 순)
         """
         self.bot_token = bot_token or os.getenv('TELEGRAM_BOT_TOKEN')
-        self.chat_id = chat_id or os.getenv('TELEGRAM_CHAT_ID')
+
+        if chat_ids:
+            self.chat_ids = [str(c) for c in chat_ids]
+        elif chat_id:
+            self.chat_ids = [str(chat_id)]
+        else:
+            env_chat_id = os.getenv('TELEGRAM_CHAT_ID')
+            self.chat_ids = Config.TELEGRAM_CHAT_IDS or ([env_chat_id] if env_chat_id else [])
+        # 단일 발송(send_message/send_photo) 대상
+        self.chat_id = chat_id or (self.chat_ids[0] if self.chat_ids else None)
 
         if not self.bot_token:
             raise ValueError("TELEGRAM_BOT_TOKEN not set")
         if not self.chat_id:
             raise ValueError("TELEGRAM_CHAT_ID not set")
 
-        self.bot = Bot(token=self.bot_token)
+        self.last_report: Optional[DeliveryReport] = None
+        self._outbox: Optional[Outbox] = None
+        self._file_cache: Optional[TelegramFileCache] = None
+
+        # 봇/연결 풀은 퍼블리셔 간 공유 (발송 시점의 이벤트 루프 기준으로 재사용)
 
         # 버전별 포맷터 선택
         self.format_version = format_version or os.getenv('TELEGRAM_FORMAT_VERSION', 'v1')
         self.formatter = get_formatter(self.format_version)
         print(f"Using Telegram Format: {self.format_version}")
+
+    @property
+    def client(self) -> TelegramClient:
+        """현재 이벤트 루프의 공유 클라이언트"""
+        return get_client(self.bot_token)
+
+    @property
+    def bot(self) -> Bot:
+        return self.client.bot
     
-    async def send_article(self, article_data: dict, delay: float = 1.0) -> bool:
+    @property
+    def outbox(self) -> Outbox:
+        """발송 대기열 (처음 사용할 때 생성)"""
+        if self._outbox is None:
+            self._outbox = Outbox()
+        return self._outbox
+
+    @property
+    def file_cache(self) -> TelegramFileCache:
+        """이미지 file_id 캐시 (처음 사용할 때 생성)"""
+        if self._file_cache is None:
+            self._file_cache = TelegramFileCache()
+        return self._file_cache
+
+    @property
+    def queue(self) -> SendQueue:
+        """현재 이벤트 루프의 공유 발송 큐 (속도 제한/순서 보장)"""
+        return get_send_queue(self.bot_token)
+
+    async def send_article(self, article_data: dict, delay: float = None) -> bool:
+        """
+        기사 메시지 연속 전송
+
+        Args:
+            article_data: 기사 데이터
+            delay: (사용 안 함, 호환성 유지용 - 전송 간격은 발송 큐가 조절)
+        """
         try:
             messages = self.formatter.format_article(article_data)
             print(f"Sending {len(messages)} messages...")
-
-            for i, message in enumerate(messages, 1):
-                await self.send_message(message, parse_mode=None)
-                print(f"Message {i}/{len(messages)} sent")
-                if i < len(messages):
-                    await asyncio.sleep(delay)
-
+            await self._send_texts(messages, label="Message")
             print("All messages sent!")
             return True
         except Exception as e:
             print(f"Error: {e}")
             return False
 
-    async def send_article_with_image(self, article_data: dict, title_image_path: str = None, delay: float = 3.0) -> bool:
+    async def send_article_with_image(
+        self,
+        article_data: dict,
+        title_image_path: str = None,
+        delay: float = None,
+        outbox_key: str = None
+    ) -> bool:
         """
         타이틀 메시지 → 텍스트 내용 순서로 전송 (이미지 제거됨)
 
         Args:
             article_data: 기사 데이터
             title_image_path: (사용 안 함, 호환성 유지용)
-            delay: 메시지 간 딜레이 (초, 기본 3초)
+            delay: (사용 안 함, 호환성 유지용 - 전송 간격은 발송 큐가 조절)
+            outbox_key: 지정하면 메시지를 outbox에 먼저 저장 후 전송 (중단 시 deliver_outbox로 이어서 전송)
+
+        발송 대상이 여러 채팅이면 broadcast()로 동시 전송 (채팅별 결과는 self.last_report)
 
         Returns:
-            성공 여부
+            성공 여부 (중간에 실패하면 이후 메시지는 보내지 않고 False,
+            여러 채팅이면 한 곳 이상 전송 완료 시 True)
         """
         try:
-            # 1. 타이틀 메시지 전송
-            print("Step 1: Sending title message...")
-            title_msg = self.formatter.format_title_message(article_data)
-            await self.send_message(title_msg, parse_mode=None)
-            print("  [OK] Title sent")
-            await asyncio.sleep(delay)
-
-            # 2. 텍스트 내용 전송
-            print("Step 2: Sending content...")
-            messages = self.formatter.format_article(article_data)
-            print(f"  Sending {len(messages)} text messages...")
+            texts = self._article_texts(article_data)
+
+            if outbox_key:
+                added = self.outbox.enqueue(outbox_key, self.chat_ids, texts)
+                print(f"Outbox: {added} messages queued ({outbox_key})")
+
+                if not added and not self.outbox.pending(outbox_key):
+                    # 이전에 재시도 한도를 넘긴 묶음 → 새 발송 요청이므로 처음부터 다시 시도
+                    retried = self.outbox.retry_failed(outbox_key)
+                    if retried:
+                        print(f"Outbox: retrying {retried} failed messages ({outbox_key})")
+                    elif self.outbox.is_complete(outbox_key):
+                        print(f"Outbox: nothing to send, already delivered ({outbox_key})")
+                        self.last_report = DeliveryReport()
+                        return True
 
-            for i, message in enumerate(messages, 1):
-                await self.send_message(message, parse_mode=None)
-                print(f"  [OK] Message {i}/{len(messages)} sent")
-                if i < len(messages):
-                    await asyncio.sleep(delay)
+                report = await self.deliver_outbox(outbox_key)
+                return bool(report.delivered)
+
+            if len(self.chat_ids) > 1:
+                report = await self.broadcast(texts)
+                # 일부 채팅 실패는 보고만 하고, 한 곳이라도 전송되었으면 발송 완료로 처리
+                return bool(report.delivered)
+
+            print(f"Sending title + {len(texts) - 1} text messages...")
+            await self._send_texts(texts, label="Message")
 
             print("\n[OK] All messages sent!")
             return True
         except Exception as e:
             print(f"[ERROR] {e}")
             return False
-    
+
+    def _article_texts(self, article_data: dict) -> list[str]:
+        """타이틀 메시지 + 본문 메시지 (한 번만 포맷팅)"""
+        return [self.formatter.format_title_message(article_data)] + self.formatter.format_article(article_data)
+
+    async def broadcast_article(self, article_data: dict, chat_ids: List[str] = None) -> DeliveryReport:
+        """
+        기사를 한 번 포맷팅해 여러 채팅에 동시 전송
+
+        Args:
+            article_data: 기사 데이터
+            chat_ids: 발송 대상 (None이면 self.chat_ids)
+
+        Returns:
+            DeliveryReport (채팅별 성공/실패)
+        """
+        return await self.broadcast(self._article_texts(article_data), chat_ids)
+
+    async def broadcast(self, texts: list[str], chat_ids: List[str] = None, parse_mode=None) -> DeliveryReport:
+        """
+        같은 메시지 묶음을 여러 채팅에 동시 전송 (채팅별 순서 보장, 전체 발송 제한 준수)
+
+        Args:
+            texts: 메시지 목록 (채팅마다 이 순서로 전송)
+            chat_ids: 발송 대상 (None이면 self.chat_ids)
+        """
+        chat_ids = chat_ids or self.chat_ids
+        print(f"Broadcasting {len(texts)} messages to {len(chat_ids)} chats...")
+
+        report = await self.queue.fan_out(
+            chat_ids,
+            lambda chat_id: [self._text_request(text, parse_mode, chat_id) for text in texts]
+        )
+        self.last_report = report
+
+        print(f"  [{'OK' if report.ok else 'WARNING'}] {report.summary()}")
+        for chat_id, error in list(report.failed.items())[:10]:
+            print(f"    - {chat_id}: {error}")
+        if len(report.failed) > 10:
+            print(f"    ... and {len(report.failed) - 10} more")
+        return report
+
+    async def deliver_outbox(self, batch_key: str) -> DeliveryReport:
+        """
+        outbox 묶음의 미전송 메시지 전송 (채팅별로 첫 미전송 메시지부터 순서대로)
+
+        Returns:
+            DeliveryReport (미전송 메시지가 있던 채팅 기준)
+        """
+        pending = self.outbox.pending(batch_key)
+        if not pending:
+            self.last_report = DeliveryReport()
+            return self.last_report
+
+        total = sum(len(rows) for rows in pending.values())
+        print(f"Outbox: delivering {total} pending messages to {len(pending)} chats...")
+
+        errors: dict[int, Exception] = {}  # 행 ID → 마지막 오류 (재시도로 성공하면 제거)
+        report = await self.queue.fan_out(
+            pending.keys(),
+            lambda chat_id: [self._outbox_request(row, errors) for row in pending[chat_id]]
+        )
+        self.last_report = report
+
+        # 발송 큐가 재시도를 포기한 메시지만 이번 전달에서 시도 1회로 기록
+        # (429 발송 제한은 텔레그램 쪽 일시 제한이므로 시도 횟수에 포함하지 않음)
+        for row_id, error in errors.items():
+            if not isinstance(error, RetryAfter):
+                self.outbox.mark_error(row_id, str(error))
+
+        print(f"  [{'OK' if report.ok else 'WARNING'}] {report.summary()}")
+        for chat_id, error in list(report.failed.items())[:10]:
+            print(f"    - {chat_id}: {error}")
+        return report
+
+    def _outbox_request(self, row: dict, errors: dict[int, Exception]):
+        """outbox 메시지 전송 함수 (성공 시 완료 기록, 실패 시 errors에 보관)"""
+        async def send(bot: Bot):
+            try:
+                message = await bot.send_message(
+                    chat_id=row['chat_id'],
+                    text=row['text'],
+                    parse_mode=row['parse_mode']
+                )
+            except Exception as e:
+                errors[row['id']] = e
+                raise
+            errors.pop(row['id'], None)
+            self.outbox.mark_sent(row['id'], getattr(message, 'message_id', None))
+            return message
+
+        return send
+
+    async def _send_texts(self, texts: list[str], parse_mode=None, label: str = "Message"):
+        """
+        텍스트 메시지 묶음을 순서대로 전송
+
+        Raises:
+            telegram.error.TelegramError: 중간에 실패한 경우 (이후 메시지는 전송 안 함)
+        """
+        def on_sent(index: int, _):
+            print(f"  [OK] {label} {index + 1}/{len(texts)} sent")
+
+        await self.queue.send_batch(
+            self.chat_id,
+            [self._text_request(text, parse_mode) for text in texts],
+            on_sent=on_sent
+        )
+
+    def _text_request(self, text: str, parse_mode=None, chat_id: str = None):
+        chat_id = chat_id or self.chat_id
+        return lambda bot: bot.send_message(chat_id=chat_id, text=text, parse_mode=parse_mode)
+
     async def send_message(self, text: str, parse_mode=None) -> bool:
         try:
-            await self.bot.send_message(
-                chat_id=self.chat_id,
-                text=text,
-                parse_mode=parse_mode
-            )
+            await self.queue.send(self.chat_id, self._text_request(text, parse_mode))
             return True
         except Exception as e:
             print(f"Send error: {e}")
@@ -101,7 +293,7 @@ class TelegramPublisher:
     
     async def send_photo(self, photo_path: str, caption: str = None) -> bool:
         """
-        사진 전송
+        사진 전송 (같은 이미지를 보낸 적 있으면 업로드 없이 file_id로 전송)
 
         Args:
             photo_path: 이미지 파일 경로
@@ -111,21 +303,144 @@ class TelegramPublisher:
             성공 여부
         """
         try:
-            with open(photo_path, 'rb') as photo:
-                await self.bot.send_photo(
-                    chat_id=self.chat_id,
-                    photo=photo,
-                    caption=caption,
-                    parse_mode='Markdown' if caption else None
-                )
+            photo = self._load_photo(photo_path)
+            await self.queue.send(self.chat_id, self._photo_request(photo, caption))
             return True
         except Exception as e:
             print(f"Photo send error: {e}")
             return False
 
+    async def send_media_group(self, photo_paths: List[str], caption: str = None) -> bool:
+        """
+        여러 사진을 앨범으로 전송 (예: NewsCardDesigner.generate_full_card_set() 카드 세트)
+
+        사진마다 메시지를 보내지 않고 10장씩 한 번에 전송, 캡션은 첫 장에만 표시
+        이미 보낸 적 있는 사진은 업로드 없이 file_id로 전송
+
+        Args:
+            photo_paths: 이미지 파일 경로 목록 (이 순서로 표시)
+            caption: 캡션 (선택사항)
+
+        Returns:
+            성공 여부 (중간에 실패하면 이후 앨범은 보내지 않고 False)
+        """
+        try:
+            photos = [self._load_photo(path) for path in photo_paths]
+            groups = [
+                photos[start:start + self.MEDIA_GROUP_SIZE]
+                for start in range(0, len(photos), self.MEDIA_GROUP_SIZE)
+            ]
+            requests = [
+                # 앨범은 2장 이상이어야 하므로 1장만 남으면 일반 사진으로 전송
+                self._media_group_request(group, caption if index == 0 else None)
+                if len(group) > 1 else
+                self._photo_request(group[0], caption if index == 0 else None)
+                for index, group in enumerate(groups)
+            ]
+
+            print(f"Sending {len(photos)} photos in {len(groups)} album(s)...")
+            await self.queue.send_batch(self.chat_id, requests)
+            return True
+        except Exception as e:
+            print(f"Media group send error: {e}")
+            return False
+
+    # ===== 사진 / file_id 캐시 =====
+
+    def _load_photo(self, photo_path: str) -> dict:
+        """사진 파일을 한 번 읽어 내용 해시와 저장된 file_id 조회 (재시도 시에도 같은 바이트 사용)"""
+        with open(photo_path, 'rb') as f:
+            data = f.read()
+
+        content_hash = TelegramFileCache.content_hash(data)
+        return {
+            'data': data,
+            'filename': os.path.basename(photo_path),
+            'hash': content_hash,
+            'file_id': self.file_cache.get(TelegramFileCache.bot_id(self.bot_token), content_hash),
+        }
+
+    def _remember_photo(self, photo: dict, message):
+        """업로드된 사진의 file_id 저장 (가장 큰 해상도)"""
+        sizes = getattr(message, 'photo', None)
+        if sizes and not photo['file_id']:
+            photo['file_id'] = sizes[-1].file_id
+            self.file_cache.set(TelegramFileCache.bot_id(self.bot_token), photo['hash'], photo['file_id'])
+
+    def _forget_photo(self, photo: dict):
+        if photo['file_id']:
+            self.file_cache.invalidate(TelegramFileCache.bot_id(self.bot_token), photo['hash'])
+            photo['file_id'] = None
+
+    @classmethod
+    def _is_stale_file_error(cls, error: BadRequest) -> bool:
+        """저장된 file_id를 텔레그램이 거부한 오류인지"""
+        message = str(error).lower()
+        return any(pattern in message for pattern in cls.STALE_FILE_ERRORS)
+
+    def _photo_request(self, photo: dict, caption: str = None):
+        parse_mode = 'Markdown' if caption else None
+
+        async def send(bot: Bot):
+            if photo['file_id']:
+                try:
+                    return await bot.send_photo(
+                        chat_id=self.chat_id,
+                        photo=photo['file_id'],
+                        caption=caption,
+                        parse_mode=parse_mode
+                    )
+                except BadRequest as e:
+                    if not self._is_stale_file_error(e):
+                        raise
+                    print(f"[WARNING] 저장된 file_id 사용 불가, 다시 업로드: {e}")
+                    self._forget_photo(photo)
+
+            message = await bot.send_photo(
+                chat_id=self.chat_id,
+                photo=photo['data'],
+                filename=photo['filename'],
+                caption=caption,
+                parse_mode=parse_mode
+            )
+            self._remember_photo(photo, message)
+            return message
+
+        return send
+
+    def _media_group_request(self, photos: list[dict], caption: str = None):
+        def build_media() -> list[InputMediaPhoto]:
+            return [
+                InputMediaPhoto(
+                    media=photo['file_id'] or photo['data'],
+                    filename=None if photo['file_id'] else photo['filename'],
+                    caption=caption if index == 0 else None,
+                    parse_mode='Markdown' if caption and index == 0 else None
+                )
+                for index, photo in enumerate(photos)
+            ]
+
+        async def send(bot: Bot):
+            try:
+                messages = await bot.send_media_group(chat_id=self.chat_id, media=build_media())
+            except BadRequest as e:
+                if not any(photo['file_id'] for photo in photos) or not self._is_stale_file_error(e):
+                    raise
+                # 어느 file_id가 거부됐는지 알 수 없으므로 앨범 전체를 다시 업로드
+                print(f"[WARNING] 저장된 file_id 사용 불가, 앨범 다시 업로드: {e}")
+                for photo in photos:
+                    self._forget_photo(photo)
+                messages = await bot.send_media_group(chat_id=self.chat_id, media=build_media())
+
+            for photo, message in zip(photos, messages):
+                self._remember_photo(photo, message)
+            return messages
+
+        return send
+
     async def test_connection(self) -> bool:
         try:
-            bot_info = await self.bot.get_me()
+            bot_info = await self.client.run(lambda bot: bot.get_me())
             print(f"Bot connected!")
             print(f"  Name: {bot_info.first_name}")
             print(f"  Username: @{bot_info.username}")
@@ -0,0 +1,260 @@
+# -*- coding: utf-8 -*-
+"""
+텔레그램 발송 큐
+
+고정 sleep 대신 텔레그램 발송 제한에 맞춰 보낼 수 있을 때 바로 전송
+- 토큰 버킷: 채팅별(기본 초당 1개, 5개까지 연속) + 봇 전체(기본 초당 25개)
+- 429 Flood control(RetryAfter): 서버가 알려준 시간만큼 봇 전체 발송을 멈췄다가 재시도
+- 같은 채팅의 메시지는 요청 순서대로 전송, send_batch()는 묶음 전체를 끼어들기 없이 순서대로 전송하고
+  중간에 실패하면 뒤 메시지는 보내지 않음
+- fan_out(): 같은 메시지 묶음을 여러 채팅에 동시 전송 (전체 속도 제한 안에서), 채팅별 결과 보고
+- 채팅별 버킷/잠금은 쉬고 있는 채팅 것부터 정리 (채팅 수가 많아도 메모리가 계속 늘지 않음)
+
+사용 예:
+    queue = get_send_queue(token)
+    await queue.send_batch(chat_id, [lambda bot, m=m: bot.send_message(chat_id=chat_id, text=m) for m in messages])
+"""
+
+import asyncio
+import time
+from contextlib import asynccontextmanager
+import weakref
+from dataclasses import dataclass, field
+from typing import Awaitable, Callable, Iterable, Optional, TypeVar
+
+from telegram import Bot
+from telegram.error import RetryAfter
+
+from publishers.telegram_client import TelegramClient, get_client
+from utils.config import Config
+from utils.rate_limiter import TokenBucket
+
+
+T = TypeVar('T')
+Request = Callable[[Bot], Awaitable[T]]
+
+
+@dataclass
+class DeliveryReport:
+    """여러 채팅 동시 전송 결과"""
+    total: int = 0
+    delivered: list[str] = field(default_factory=list)  # 모든 메시지 전송 완료한 채팅
+    failed: dict[str, str] = field(default_factory=dict)  # 채팅 ID → 오류 메시지
+    messages_sent: int = 0  # 실제 전송된 메시지 수 (실패한 채팅의 앞부분 포함)
+    elapsed: float = 0.0  # 초
+
+    @property
+    def ok(self) -> bool:
+        return not self.failed
+
+    def summary(self) -> str:
+        return (
+            f"{len(self.delivered)}/{self.total} chats delivered, "
+            f"{len(self.failed)} failed, {self.messages_sent} messages, {self.elapsed:.1f}s"
+        )
+
+
+class SendQueue:
+    """봇 1개(토큰)의 발송 순서/속도 관리 (이벤트 루프 1개 전용)"""
+
+    IDLE_SWEEP_THRESHOLD = 256  # 채팅 버킷이 이 수를 넘으면 쉬고 있는 채팅 정리
+
+    def __init__(self, client: TelegramClient):
+        """
+        Args:
+            client: 공유 봇 클라이언트
+        """
+        self.client = client
+        self.global_bucket = TokenBucket(Config.TELEGRAM_GLOBAL_RATE, Config.TELEGRAM_GLOBAL_RATE)
+        self._chat_buckets: dict[str, TokenBucket] = {}
+        self._chat_locks: dict[str, asyncio.Lock] = {}
+        self._chat_users: dict[str, int] = {}  # 채팅별 발송 중/대기 중인 요청 수
+        self._sweep_at = self.IDLE_SWEEP_THRESHOLD
+
+    def _bucket(self, chat_id: str) -> TokenBucket:
+        bucket = self._chat_buckets.get(chat_id)
+        if bucket is None:
+            bucket = self._chat_buckets[chat_id] = TokenBucket(
+                Config.TELEGRAM_CHAT_RATE, Config.TELEGRAM_CHAT_BURST
+            )
+        return bucket
+
+    def _lock(self, chat_id: str) -> asyncio.Lock:
+        # asyncio.Lock은 기다린 순서대로(FIFO) 획득 → 채팅별 요청 순서 보장
+        lock = self._chat_locks.get(chat_id)
+        if lock is None:
+            lock = self._chat_locks[chat_id] = asyncio.Lock()
+        return lock
+
+    @asynccontextmanager
+    async def _chat(self, chat_id: str):
+        """채팅 발송 구간 (순서 보장 잠금 + 사용 중 표시, 끝나면 필요 시 정리)"""
+        self._chat_users[chat_id] = self._chat_users.get(chat_id, 0) + 1
+        try:
+            async with self._lock(chat_id):
+                yield
+        finally:
+            self._chat_users[chat_id] -= 1
+            if not self._chat_users[chat_id]:
+                del self._chat_users[chat_id]
+            if len(self._chat_buckets) > self._sweep_at:
+                self.sweep_idle()
+
+    def sweep_idle(self) -> int:
+        """
+        쉬고 있는 채팅의 버킷/잠금 정리
+
+        사용 중이 아닌 채팅의 잠금은 삭제하고, 버킷은 토큰이 다시 가득 찬 경우만 삭제
+        (발송 직후 버킷을 지우면 속도 제한이 초기화되므로)
+
+        Returns:
+            삭제한 채팅 버킷 수
+        """
+        for chat_id in [c for c in self._chat_locks if c not in self._chat_users]:
+            del self._chat_locks[chat_id]
+
+        idle = [
+            chat_id for chat_id, bucket in self._chat_buckets.items()
+            if chat_id not in self._chat_users and bucket.is_full()
+        ]
+        for chat_id in idle:
+            del self._chat_buckets[chat_id]
+
+        # 아직 못 지운(최근 사용한) 버킷이 많으면 다음 정리 시점을 늦춰 매 발송마다 전체를 훑지 않음
+        self._sweep_at = max(self.IDLE_SWEEP_THRESHOLD, 2 * len(self._chat_buckets))
+        return len(idle)
+
+    # ===== 발송 =====
+
+    async def send(self, chat_id, request: Request) -> T:
+        """
+        메시지 1개 전송 (같은 채팅의 앞선 요청이 끝난 뒤 전송)
+
+        Args:
+            chat_id: 채팅 ID (속도 제한/순서 단위)
+            request: Bot을 받아 API를 호출하는 함수 (429 재시도 시 다시 호출됨)
+
+        Raises:
+            telegram.error.TelegramError: 재시도 후에도 실패한 경우
+        """
+        chat_id = str(chat_id)
+        async with self._chat(chat_id):
+            return await self._send(chat_id, request)
+
+    async def send_batch(
+        self,
+        chat_id,
+        requests: Iterable[Request],
+        on_sent: Optional[Callable[[int, object], None]] = None
+    ) -> list:
+        """
+        여러 메시지를 순서대로 연속 전송 (다른 발송이 중간에 끼어들지 않음)
+
+        Args:
+            chat_id: 채팅 ID
+            requests: 전송 함수 목록 (순서대로 전송)
+            on_sent: 메시지 하나가 전송될 때마다 (순번, 결과)로 호출
+
+        Returns:
+            전송 결과 목록
+
+        Raises:
+            telegram.error.TelegramError: 중간에 실패하면 이후 메시지는 보내지 않고 예외 전달
+        """
+        chat_id = str(chat_id)
+        results = []
+        async with self._chat(chat_id):
+            for index, request in enumerate(requests):
+                result = await self._send(chat_id, request)
+                results.append(result)
+                if on_sent:
+                    on_sent(index, result)
+        return results
+
+    async def fan_out(
+        self,
+        chat_ids: Iterable,
+        build_requests: Callable[[str], list[Request]],
+        concurrency: int = None
+    ) -> DeliveryReport:
+        """
+        여러 채팅에 동시 전송
+
+        채팅별로는 send_batch()와 같이 순서대로 전송하고, 채팅 간에는 동시에 진행
+        (전체 속도는 봇 전체 토큰 버킷이 제한하므로 채팅 수가 많으면 전체 제한 속도로 수렴)
+
+        Args:
+            chat_ids: 채팅 ID 목록 (중복 제거)
+            build_requests: 채팅 ID → 전송 함수 목록
+            concurrency: 동시에 전송 중인 채팅 수 상한 (None이면 Config.TELEGRAM_FANOUT_CONCURRENCY)
+
+        Returns:
+            DeliveryReport
+        """
+        chat_ids = list(dict.fromkeys(str(chat_id) for chat_id in chat_ids))
+        report = DeliveryReport(total=len(chat_ids))
+        self.sweep_idle()  # 이전 발송 후 쉬고 있던 채팅 정리
+        semaphore = asyncio.Semaphore(concurrency or Config.TELEGRAM_FANOUT_CONCURRENCY)
+        start = time.monotonic()
+
+        async def deliver(chat_id: str):
+            sent = 0
+
+            def on_sent(index: int, _):
+                nonlocal sent
+                sent += 1
+
+            async with semaphore:
+                try:
+                    await self.send_batch(chat_id, build_requests(chat_id), on_sent=on_sent)
+                    report.delivered.append(chat_id)
+                except Exception as e:
+                    report.failed[chat_id] = str(e)
+                finally:
+                    report.messages_sent += sent
+
+        await asyncio.gather(*(deliver(chat_id) for chat_id in chat_ids))
+        report.elapsed = time.monotonic() - start
+        return report
+
+    async def _send(self, chat_id: str, request: Request) -> T:
+        bucket = self._bucket(chat_id)
+
+        for attempt in range(Config.TELEGRAM_MAX_RETRIES + 1):
+            await bucket.wait_async()
+            await self.global_bucket.wait_async()
+
+            try:
+                return await self.client.run(request)
+            except RetryAfter as e:
+                if attempt == Config.TELEGRAM_MAX_RETRIES:
+                    raise
+                # 버전에 따라 초(int) 또는 timedelta
+                retry_after = e.retry_after
+                retry_after = retry_after.total_seconds() if hasattr(retry_after, 'total_seconds') else float(retry_after)
+                print(f"[WARNING] 텔레그램 발송 제한 (chat {chat_id}), {retry_after:.0f}초 후 재시도")
+                # 429가 채팅 단위인지 봇 전체 단위인지 구분할 수 없으므로 다른 채팅 발송도 함께 멈춤
+                # (봇 전체 제한이면 다른 채팅이 계속 보내 429를 더 받게 됨)
+                bucket.block(retry_after)
+                self.global_bucket.block(retry_after)
+
+
+# (이벤트 루프 → {봇 토큰: 큐})
+_queues: 'weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, dict[str, SendQueue]]' = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def get_send_queue(token: str = None) -> SendQueue:
+    """
+    현재 이벤트 루프의 공유 발송 큐 (실행 중인 루프 안에서 호출)
+
+    Args:
+        token: 봇 토큰 (None이면 Config.TELEGRAM_BOT_TOKEN)
+    """
+    client = get_client(token)
+    queues = _queues.setdefault(asyncio.get_running_loop(), {})
+    queue = queues.get(client.token)
+    if queue is None:
+        queue = queues[client.token] = SendQueue(client)
+    return queue
@@ -17,27 +17,40 @@ from datetime import datetime
 import pytz
 
 from scrapers.naver_scraper import NaverScraper
+from scrapers.naver_crawler import NaverCrawler, SeenIndex
 from analyzers.ai_news_selector import AINewsSelector
 from analyzers.gemini_analyzer import GeminiAnalyzer
 from publishers.coupang_partners import CoupangPartners
+from publishers.telegram_client import shutdown_clients
 from publishers.telegram_publisher import TelegramPublisher
 from publishers.market_status_publisher import MarketStatusPublisher
 from publishers.market_chart_publisher import MarketChartPublisher
 from publishers.daily_tip_publisher import DailyTipPublisher
+from database.article_store import ArticleStore
+from utils.config import Config
 
 
 class NewsScheduler:
     """뉴스 자동 스크래핑 및 발송 스케줄러"""
 
+    # 같은 본문이 이미 발송된 경우 재선정 최대 횟수
+    MAX_SELECTION_ATTEMPTS = 3
+
     def __init__(self):
         self.scraper = NaverScraper()
+        # 경제 메인 + 세부 섹션 후보 수집 (요청 간격/HTTP 캐시는 scraper와 공유)
+        self.crawler = NaverCrawler(scraper=self.scraper, seen_index=SeenIndex(), pages=Config.CRAWLER_PAGES)
         self.selector = AINewsSelector()
         self.gemini = GeminiAnalyzer()
         self.coupang = CoupangPartners()
         self.daily_tip_publisher = DailyTipPublisher()
-        # publisher는 매번 새로 생성 (연결 풀 문제 방지)
+        self.article_store = ArticleStore()  # 발행 이력 (중복 분석/발송 방지)
         self.kst = pytz.timezone('Asia/Seoul')
 
+        # 모든 작업이 같은 이벤트 루프에서 실행 → 텔레그램 연결 풀/LLM 동시성 제한을 작업 간 재사용
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+
     async def scrape_and_send(self):
         """뉴스 스크래핑 → AI 선택 → 분석 → 텔레그램 발송"""
         try:
@@ -46,46 +59,105 @@ class NewsScheduler:
             print(f"[{current_time}] Starting news scraping and sending...")
             print(f"{'='*70}\n")
 
-            # 1. 뉴스 메타데이터 수집 (빠름)
+            # 0. 이전 실행에서 중단된 발송부터 마무리
+            await self.resume_outbox()
+
+            # 1. 뉴스 메타데이터 수집 (경제 세부 섹션 병렬, 이전에 사용한 기사 제외)
             print("[Step 1] Collecting article metadata from Naver...")
-            metadata_list = self.scraper.get_article_metadata(limit=30)
+            metadata_list = self.crawler.collect(limit=Config.CRAWLER_CANDIDATE_LIMIT)
+            if not metadata_list:
+                # 세부 섹션 수집이 모두 실패하면 경제 메인 섹션만
+                metadata_list = self.scraper.get_article_metadata(limit=30)
             print(f"  [OK] Collected {len(metadata_list)} article metadata")
 
-            if not metadata_list:
+            # 이미 발송한 기사는 후보에서 제외
+            candidates = self.article_store.filter_unpublished(metadata_list)
+            if len(candidates) < len(metadata_list):
+                print(f"  [SKIP] {len(metadata_list) - len(candidates)} already published articles filtered out")
+
+            if not candidates:
                 print("  [WARNING] No articles found. Skipping...")
                 return
 
-            # 2. AI가 메타데이터에서 가장 중요한 뉴스 선택
-            print("\n[Step 2] AI selecting most important news from metadata...")
-            selected_url = self.selector.select_best_news_from_metadata(metadata_list, verbose=False)
-
-            if not selected_url:
-                print("  [ERROR] AI failed to select news. Skipping...")
+            selected_article = None
+            prefetched = {}  # URL → NewsArticle (선정 재시도 시 다시 받지 않음)
+            for _ in range(self.MAX_SELECTION_ATTEMPTS):
+                # 2. 규칙 기반 점수로 상위 K개 선별 → 본문 병렬 수집 → AI가 그중 가장 중요한 뉴스 선택
+                shortlist = self.selector.shortlist(candidates, top_k=Config.SELECTOR_TOP_K, verbose=False)
+                print(f"\n[Step 2] AI selecting most important news from top {len(shortlist)} candidates...")
+                await self._prefetch_articles(shortlist, prefetched)
+                selected_url = await self.selector.select_best_news_from_metadata_async(
+                    shortlist,
+                    verbose=False,
+                    top_k=0  # 이미 선별됨
+                )
+
+                if not selected_url:
+                    print("  [ERROR] AI failed to select news. Skipping...")
+                    return
+
+                # 3. 선택된 뉴스 본문 (미리 수집한 경우 재사용)
+                print("\n[Step 3] Scraping full article content...")
+                article = prefetched.get(selected_url)
+                if article is None:
+                    fetched = await self.scraper.scrape_articles_async([selected_url])
+                    if not fetched:
+                        print("  [SKIP] Article scraping failed, selecting again...")
+                        candidates = [meta for meta in candidates if meta['url'] != selected_url]
+                        if not candidates:
+                            break
+                        continue
+                    article = fetched[0]
+                print(f"  [OK] Article scraped: {article.title[:50]}...")
+
+                # 다른 URL로 이미 발송된 같은 본문이면 다시 선택
+                if not self.article_store.is_duplicate_content(article):
+                    selected_article = article
+                    break
+
+                print("  [SKIP] Same content already published, selecting again...")
+                self.article_store.mark_duplicate(article)
+                self.crawler.mark_seen([selected_url])
+                candidates = [meta for meta in candidates if meta['url'] != selected_url]
+                if not candidates:
+                    break
+
+            if not selected_article:
+                print("  [WARNING] No unpublished article available. Skipping...")
                 return
 
-            # 3. 선택된 뉴스만 본문 스크래핑
-            print("\n[Step 3] Scraping full article content...")
-            selected_article = self.scraper.scrape_article(selected_url)
-            print(f"  [OK] Article scraped: {selected_article.title[:50]}...")
-
-            # 4. Gemini 분석
-            print("\n[Step 4] Analyzing with Gemini...")
-            selected_article.summary = self.gemini.summarize(selected_article)
-            selected_article.easy_explanation = self.gemini.explain_simple(selected_article)
-            selected_article.keywords = self.gemini.extract_keywords(selected_article)
-            print(f"  [OK] Analysis done")
-            print(f"  Keywords: {', '.join(selected_article.keywords)}")
-
-            # 5. 쿠팡 파트너스 추천
-            print("\n[Step 5] Generating Coupang recommendations...")
-            coupang_data = {
-                'title': selected_article.title,
-                'content': selected_article.content[:1000],
-                'keywords': selected_article.keywords
-            }
-            recommendations = self.coupang.analyze_and_recommend(coupang_data, max_items=1)
+            previous = self.article_store.get_reusable_analysis(selected_article)
+            if previous:
+                # 4-5. 발송 전에 중단된 분석 결과 재사용 (LLM 재호출 없음)
+                print("\n[Step 4-5] Reusing previous analysis (not sent yet)...")
+                selected_article.summary = previous['summary']
+                selected_article.easy_explanation = previous['easy_explanation']
+                selected_article.keywords = previous['keywords']
+                recommendations = previous['recommendations']
+                print(f"  Keywords: {', '.join(selected_article.keywords)}")
+            else:
+                # 4. Gemini 분석(요약/설명/키워드 1회 호출)
+                print("\n[Step 4] Analyzing with Gemini...")
+                analysis = await self.gemini.analyze_all_async(selected_article)
+                selected_article.summary = analysis['summary']
+                selected_article.easy_explanation = analysis['easy_explanation']
+                selected_article.keywords = analysis['keywords']
+                print(f"  [OK] Analysis done")
+                print(f"  Keywords: {', '.join(selected_article.keywords)}")
+
+                # 5. 쿠팡 추천 (추출한 키워드로 로컬 카탈로그 매칭, 확신도가 낮을 때만 LLM 호출)
+                print("\n[Step 5] Generating Coupang recommendations...")
+                coupang_data = {
+                    'title': selected_article.title,
+                    'content': selected_article.content[:1000],
+                    'keywords': selected_article.keywords
+                }
+                recommendations = await self.coupang.analyze_and_recommend_async(coupang_data, max_items=1)
+                print(f"  [OK] {len(recommendations)} products recommended")
+
+                self.article_store.save_analysis(selected_article, recommendations)
+
             disclosure = self.coupang.disclosure_text
-            print(f"  [OK] {len(recommendations)} products recommended")
 
             # 5. 데이터 준비
             current_date = datetime.now(self.kst).strftime('%Y년 %m월 %d일')
@@ -99,18 +171,22 @@ class NewsScheduler:
                 'coupang_disclosure': disclosure
             }
 
-            # 6. 텔레그램 발송 (매번 새 인스턴스 생성)
+            # 6. 텔레그램 발송 (봇 연결은 공유 클라이언트 재사용)
             print("\n[Step 6] Sending to Telegram...")
-            publisher = TelegramPublisher()  # 연결 풀 문제 방지
-            success = await publisher.send_article_with_image(article_data)
+            publisher = TelegramPublisher()
+            # 메시지를 outbox에 먼저 저장 → 중간에 중단되어도 다음 실행에서 이어서 전송
+            success = await publisher.send_article_with_image(article_data, outbox_key=selected_article.url)
 
             if success:
+                self.article_store.mark_sent(selected_article.url)
+                self.crawler.mark_seen([selected_article.url])
                 print(f"\n{'='*70}")
                 print("[SUCCESS] News sent to Telegram!")
                 print(f"Time: {current_time}")
                 print(f"Title: {selected_article.title}")
                 print(f"{'='*70}\n")
             else:
+                self.article_store.mark_failed(selected_article.url, 'telegram send failed')
                 print(f"\n[ERROR] Failed to send to Telegram\n")
 
         except Exception as e:
@@ -118,6 +194,50 @@ class NewsScheduler:
             import traceback
             traceback.print_exc()
 
+    async def _prefetch_articles(self, shortlist: list, prefetched: dict):
+        """
+        1차 선별 후보의 본문을 병렬 수집해 메타데이터에 추가 (AI 선정이 요약 대신 본문을 보도록)
+
+        Args:
+            shortlist: 후보 메타데이터 (수집한 본문을 'content'로 추가)
+            prefetched: URL → NewsArticle (수집 결과 누적)
+        """
+        # 1차 선별을 끈 경우(SELECTOR_TOP_K=0)는 후보 전체를 받게 되므로 수집하지 않음
+        if not Config.SELECTOR_PREFETCH_CONTENT or not Config.SELECTOR_TOP_K:
+            return
+
+        urls = [meta['url'] for meta in shortlist if meta['url'] not in prefetched]
+        if urls:
+            articles = await self.scraper.scrape_articles_async(urls, concurrency=Config.SCRAPER_CONCURRENCY)
+            prefetched.update((article.url, article) for article in articles)
+            print(f"  [OK] Prefetched {len(articles)}/{len(urls)} article bodies")
+
+        for meta in shortlist:
+            article = prefetched.get(meta['url'])
+            if article:
+                meta['content'] = article.content
+
+    async def resume_outbox(self):
+        """outbox에 남은 미전송 메시지 전송 (스크래핑/LLM 분석 재실행 없이 첫 미전송 메시지부터)"""
+        try:
+            publisher = TelegramPublisher()
+            outbox = publisher.outbox
+            outbox.purge()
+
+            batch_keys = outbox.pending_batches()
+            if not batch_keys:
+                return
+
+            print(f"[Outbox] Resuming {len(batch_keys)} unfinished deliveries...")
+            for batch_key in batch_keys:
+                report = await publisher.deliver_outbox(batch_key)
+                # 묶음 키 = 기사 URL
+                if report.delivered or outbox.is_complete(batch_key):
+                    self.article_store.mark_sent(batch_key)
+
+        except Exception as e:
+            print(f"[ERROR] Outbox resume failed: {e}")
+
     async def send_market_status(self):
         """시장 현황 전송 (10시, 15시)"""
         try:
@@ -176,14 +296,14 @@ class NewsScheduler:
             import traceback
             traceback.print_exc()
 
+    def _run(self, coro):
+        """스케줄러 이벤트 루프에서 작업 실행"""
+        return self.loop.run_until_complete(coro)
+
     def run_job(self):
         """스케줄 작업 실행 (동기 래퍼) - 뉴스 발송"""
         try:
-            # 새로운 이벤트 루프 생성 (Pool timeout 방지)
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            loop.run_until_complete(self.scrape_and_send())
-            loop.close()
+            self._run(self.scrape_and_send())
         except Exception as e:
             print(f"[ERROR] Job execution failed: {e}")
             import traceback
@@ -192,10 +312,7 @@ class NewsScheduler:
     def run_market_status_job(self):
         """시장 현황 작업 실행 (동기 래퍼)"""
         try:
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            loop.run_until_complete(self.send_market_status())
-            loop.close()
+            self._run(self.send_market_status())
         except Exception as e:
             print(f"[ERROR] Market status job execution failed: {e}")
             import traceback
@@ -204,10 +321,7 @@ class NewsScheduler:
     def run_market_chart_job(self):
         """시장 차트 작업 실행 (동기 래퍼)"""
         try:
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            loop.run_until_complete(self.send_market_chart("daily"))
-            loop.close()
+            self._run(self.send_market_chart("daily"))
         except Exception as e:
             print(f"[ERROR] Market chart job execution failed: {e}")
             import traceback
@@ -234,10 +348,7 @@ class NewsScheduler:
     def run_economic_term_job(self):
         """경제 용어 작업 실행 (동기 래퍼)"""
         try:
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            loop.run_until_complete(self.send_economic_term())
-            loop.close()
+            self._run(self.send_economic_term())
         except Exception as e:
             print(f"[ERROR] Economic term job execution failed: {e}")
             import traceback
@@ -246,10 +357,7 @@ class NewsScheduler:
     def run_investment_tip_job(self):
         """투자 꿀팁 작업 실행 (동기 래퍼)"""
         try:
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            loop.run_until_complete(self.send_investment_tip())
-            loop.close()
+            self._run(self.send_investment_tip())
         except Exception as e:
             print(f"[ERROR] Investment tip job execution failed: {e}")
             import traceback
@@ -300,10 +408,17 @@ class NewsScheduler:
         print(f"Current time: {current_time}")
         print("Waiting for scheduled time...\n")
 
+        # 이전 실행에서 중단된 발송 마무리
+        self._run(self.resume_outbox())
+
         # 무한 루프로 스케줄 실행
-        while True:
-            schedule.run_pending()
-            time.sleep(60)  # 1분마다 체크
+        try:
+            while True:
+                schedule.run_pending()
+                time.sleep(60)  # 1분마다 체크
+        finally:
+            self._run(shutdown_clients())
+            self.loop.close()
 
 
 def main():
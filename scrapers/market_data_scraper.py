@@ -8,8 +8,8 @@
 import yfinance as yf
 from datetime import datetime, timedelta
 from typing import Dict, Optional
-import requests
-from bs4 import BeautifulSoup
+from utils.html_parser import parse_html
+from utils.http_client import http_get
 
 # pykrx 추가 (한국거래소 공식 데이터)
 try:
@@ -106,10 +106,10 @@ class MarketDataScraper:
             # 네이버 금융에서 환율 스크래핑 (더 안정적)
             try:
                 url = "https://finance.naver.com/marketindex/exchangeDetail.naver?marketindexCd=FX_USDKRW"
-                response = requests.get(url, headers=self.headers, timeout=10)
+                response = http_get(url, headers=self.headers)
                 response.raise_for_status()
 
-                soup = BeautifulSoup(response.text, 'html.parser')
+                soup = parse_html(response.text, classes=('rate_value', 'change_value'))
 
                 # 현재 환율
                 rate_elem = soup.select_one('.rate_value')
@@ -166,11 +166,9 @@ class MarketDataScraper:
         try:
             # 네이버 금융에서 기준금리 정보 스크래핑
             url = "https://finance.naver.com/marketindex/"
-            response = requests.get(url, headers=self.headers, timeout=10)
+            response = http_get(url, headers=self.headers)
             response.raise_for_status()
 
-            soup = BeautifulSoup(response.text, 'html.parser')
-
             # 기준금리는 고정값으로 반환 (실시간 API 없음)
             # 대신 최근 발표된 금리 사용
             # TODO: 한국은행 공식 API 연동 고려
@@ -0,0 +1,224 @@
+"""
+네이버 경제 섹션 멀티 페이지 크롤러
+
+경제 메인 + 세부 섹션(금융, 증권, 부동산 등)의 여러 페이지를 병렬로 수집하여
+기사 메타데이터를 제너레이터로 스트리밍
+정규 기사 ID(oid/aid)로 중복 제거 (메모리 + 디스크 seen-set)
+- seen-set에는 사용하는 쪽이 실제로 사용한 기사만 mark_seen()으로 등록
+  (후보로 보여주기만 하고 선택되지 않은 기사는 다음 실행에서도 후보로 유지)
+"""
+
+import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterator, Optional
+
+from scrapers.naver_scraper import NaverScraper
+from utils.config import Config
+from utils.naver_url import parse_article_id
+
+
+class SeenIndex:
+    """이미 본 기사 ID 집합 (JSON 파일로 영속화)"""
+
+    def __init__(self, path: str = None, retention_hours: float = None):
+        """
+        Args:
+            path: 저장 경로 (None이면 Config.CRAWLER_SEEN_PATH)
+            retention_hours: 보관 기간 (시간, 지난 ID는 로드 시 제거)
+        """
+        self.path = path or Config.CRAWLER_SEEN_PATH
+        self.retention_hours = retention_hours or Config.CRAWLER_SEEN_RETENTION_HOURS
+        self._seen: dict[str, float] = {}  # article_id → 처음 본 시각
+        self._lock = threading.Lock()
+        self._load()
+
+    def _load(self):
+        if not os.path.exists(self.path):
+            return
+
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if not isinstance(data, dict):
+                raise ValueError(f"expected object, got {type(data).__name__}")
+        except (OSError, ValueError) as e:
+            print(f"[WARNING] seen-set 로드 실패, 새로 시작합니다: {e}")
+            return
+
+        # 시각이 숫자가 아닌 항목은 버림 (손상된 파일이어도 크롤러 생성은 실패하지 않도록)
+        cutoff = time.time() - self.retention_hours * 3600
+        self._seen = {
+            article_id: ts for article_id, ts in data.items()
+            if isinstance(ts, (int, float)) and not isinstance(ts, bool) and ts >= cutoff
+        }
+
+    def __contains__(self, article_id: str) -> bool:
+        return article_id in self._seen
+
+    def __len__(self) -> int:
+        return len(self._seen)
+
+    def add(self, article_id: str) -> bool:
+        """ID 등록 (새로 추가되면 True, 이미 있으면 False)"""
+        with self._lock:
+            if article_id in self._seen:
+                return False
+            self._seen[article_id] = time.time()
+            return True
+
+    def save(self):
+        """디스크에 저장"""
+        with self._lock:
+            data = dict(self._seen)
+
+        os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f)
+        os.replace(tmp_path, self.path)
+
+
+class NaverCrawler:
+    """네이버 경제 세부 섹션 + 페이지네이션 병렬 크롤러"""
+
+    SECTION_URL = 'https://news.naver.com/section/101'
+    SUBSECTION_URL = 'https://news.naver.com/breakingnews/section/101/{sid2}?page={page}'
+
+    # 경제(101) 세부 섹션
+    ECONOMY_SUBSECTIONS = {
+        '259': '금융',
+        '258': '증권',
+        '261': '산업/재계',
+        '771': '중기/벤처',
+        '260': '부동산',
+        '262': '글로벌 경제',
+        '310': '생활경제',
+        '263': '경제 일반',
+    }
+
+    def __init__(
+        self,
+        scraper: NaverScraper = None,
+        seen_index: Optional[SeenIndex] = None,
+        subsections: list[str] = None,
+        pages: int = 2,
+        concurrency: int = 4
+    ):
+        """
+        Args:
+            scraper: 페이지 요청/파싱에 사용할 스크래퍼 (캐시·요청 간격 공유)
+            seen_index: 이전 실행에서 사용한 기사를 건너뛸 seen-set (None이면 이번 실행 내에서만 중복 제거)
+            subsections: 수집할 세부 섹션 sid2 목록 (None이면 전체)
+            pages: 세부 섹션별 수집 페이지 수
+            concurrency: 동시 요청 수
+        """
+        self.scraper = scraper or NaverScraper()
+        self.seen_index = seen_index
+        self.subsections = subsections or list(self.ECONOMY_SUBSECTIONS.keys())
+        self.pages = pages
+        self.concurrency = concurrency
+
+    def page_urls(self) -> list[tuple[str, str]]:
+        """
+        수집할 (URL, 섹션명) 목록
+
+        경제 메인 → 각 섹션 1페이지 → 각 섹션 2페이지 ... 순서 (앞쪽일수록 우선)
+        """
+        urls = [(self.SECTION_URL, '경제')]
+        for page in range(1, self.pages + 1):
+            for sid2 in self.subsections:
+                urls.append((
+                    self.SUBSECTION_URL.format(sid2=sid2, page=page),
+                    self.ECONOMY_SUBSECTIONS.get(sid2, sid2)
+                ))
+        return urls
+
+    def _fetch_page(self, url: str) -> list[dict]:
+        """섹션 페이지 1개 수집 (요청 간격 + 디스크 캐시 적용)"""
+        self.scraper.rate_limiter.wait(url)
+        response = self.scraper.http_cache.get(url, headers=self.scraper.headers)
+        return self.scraper.parse_metadata(response.text)
+
+    def crawl(self, limit: int = None) -> Iterator[dict]:
+        """
+        기사 메타데이터 스트리밍
+
+        페이지 요청은 병렬로 진행하되, 결과는 page_urls() 우선순위 순서대로 내보냄
+        limit에 도달하거나 제너레이터를 닫으면 남은 요청은 취소
+
+        Args:
+            limit: 최대 기사 수 (None이면 전체)
+
+        Yields:
+            {'url', 'title', 'summary', 'article_id', 'section'}
+        """
+        seen_this_run = set()
+        count = 0
+
+        executor = ThreadPoolExecutor(max_workers=self.concurrency)
+        try:
+            futures = [
+                (executor.submit(self._fetch_page, url), url, section)
+                for url, section in self.page_urls()
+            ]
+
+            for future, url, section in futures:
+                try:
+                    items = future.result()
+                except Exception as e:
+                    print(f"[WARNING] 섹션 페이지 수집 실패 ({url}): {e}")
+                    continue
+
+                for meta in items:
+                    article_id = meta.get('article_id') or parse_article_id(meta['url']) or meta['url']
+
+                    if article_id in seen_this_run:
+                        continue
+                    seen_this_run.add(article_id)
+
+                    if self.seen_index is not None and article_id in self.seen_index:
+                        continue
+
+                    meta['article_id'] = article_id
+                    meta['section'] = section
+                    yield meta
+
+                    count += 1
+                    if limit and count >= limit:
+                        return
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def mark_seen(self, article_ids: list[str]):
+        """
+        사용한 기사 등록 (다음 crawl()부터 제외, seen-set이 없으면 무시)
+
+        Args:
+            article_ids: 기사 ID (crawl() 결과의 'article_id') 또는 URL
+        """
+        if self.seen_index is None:
+            return
+
+        added = False
+        for article_id in article_ids:
+            added |= self.seen_index.add(parse_article_id(article_id) or article_id)
+        if added:
+            self.seen_index.save()
+
+    def collect(self, limit: int = None) -> list[dict]:
+        """crawl() 결과를 리스트로 반환"""
+        return list(self.crawl(limit=limit))
+
+
+if __name__ == '__main__':
+    crawler = NaverCrawler()
+
+    print("=" * 70)
+    print("Naver Economy Crawler Test")
+    print("=" * 70)
+
+    for i, meta in enumerate(crawler.crawl(limit=50), 1):
+        print(f"{i:>3}. [{meta['section']}] {meta['title'][:40]} ({meta['article_id']})")
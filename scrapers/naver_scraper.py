@@ -1,28 +1,128 @@
+import asyncio
 import requests
-from bs4 import BeautifulSoup
 from datetime import datetime
+from typing import Optional
 from .base_scraper import BaseScraper
 from models.news_article import NewsArticle
+from utils.config import Config
+from utils.http_cache import HttpCache
+from utils.html_parser import parse_html
+from utils.http_client import create_async_client
+from utils.naver_url import parse_article_id
+from utils.rate_limiter import HostRateLimiter
 
 
 class NaverScraper(BaseScraper):
     """네이버 뉴스 스크래퍼"""
 
+    # 선택적 파싱 대상 (선택자에 쓰이는 최상위 id/class)
+    ARTICLE_PARSE_IDS = ('title_area', 'articleTitle', 'dic_area', 'articeBody', 'newsct_article')
+    ARTICLE_PARSE_CLASSES = ('media_end_head_headline', 'media_end_head_info_datestamp_time', 'author_info', 't11')
+    METADATA_PARSE_CLASSES = ('sa_item', 'sa_item_inner')
+    LIST_PARSE_CLASSES = ('sa_text_title', 'news_tit')
+
     def __init__(self):
         self.headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
         }
+        # 호스트별 요청 간격 (Config.SCRAPING_DELAY)
+        self.rate_limiter = HostRateLimiter()
+        # 섹션/기사 페이지 디스크 캐시 (ETag/Last-Modified 재검증)
+        self.http_cache = HttpCache()
 
     def scrape_article(self, url: str) -> NewsArticle:
         """네이버 뉴스 기사 상세 정보 추출"""
         try:
-            # 페이지 요청
-            response = requests.get(url, headers=self.headers, timeout=10)
-            response.raise_for_status()
-            response.encoding = 'utf-8'
+            # 페이지 요청 (캐시 적중 시 네트워크 생략)
+            response = self.http_cache.get(
+                url,
+                headers=self.headers,
+                ttl=Config.HTTP_CACHE_ARTICLE_TTL,
+                encoding='utf-8'
+            )
+
+            return self._parse_article(url, response.text)
+
+        except requests.RequestException as e:
+            raise Exception(f"네트워크 오류: {e}")
 
-            # HTML 파싱 (html.parser 사용)
-            soup = BeautifulSoup(response.text, 'html.parser')
+    async def scrape_articles_async(self, urls: list[str], concurrency: int = 5) -> list[NewsArticle]:
+        """
+        여러 기사 본문을 병렬로 스크래핑 (비동기)
+
+        Args:
+            urls: 기사 URL 리스트
+            concurrency: 동시 요청 수 (연결 풀 크기)
+
+        Returns:
+            성공한 기사 리스트 (입력 순서 유지, 실패한 URL은 제외)
+        """
+        if not urls:
+            return []
+
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async with create_async_client(max_connections=concurrency, headers=self.headers) as client:
+
+            async def fetch(url: str) -> Optional[NewsArticle]:
+                async with semaphore:
+                    try:
+                        html = await self._fetch_article_html_async(client, url)
+                        return self._parse_article(url, html)
+                    except Exception as e:
+                        print(f"[WARNING] 기사 스크래핑 실패 ({url}): {e}")
+                        return None
+
+            results = await asyncio.gather(*(fetch(url) for url in urls))
+
+        return [article for article in results if article is not None]
+
+    async def _fetch_article_html_async(self, client, url: str) -> str:
+        """기사 HTML 비동기 요청 (디스크 캐시 + 조건부 요청)"""
+        ttl = Config.HTTP_CACHE_ARTICLE_TTL
+        meta = self.http_cache.lookup(url)
+
+        if meta and self.http_cache.is_fresh(meta, ttl):
+            cached = self.http_cache.load(url, meta, encoding='utf-8')
+            if cached:
+                return cached.text
+
+        await self.rate_limiter.wait_async(url)
+        response = await client.get(url, headers=self.http_cache.conditional_headers(meta))
+
+        if response.status_code == 304 and meta:
+            self.http_cache.revalidate(url, meta)
+            cached = self.http_cache.load(url, meta, encoding='utf-8')
+            if cached:
+                return cached.text
+            # 캐시 본문이 사라진 경우 → 요청 간격을 지켜 전체 다시 요청
+            await self.rate_limiter.wait_async(url)
+            response = await client.get(url)
+
+        response.raise_for_status()
+
+        stored = self.http_cache.store(
+            url,
+            response.content,
+            encoding='utf-8',
+            etag=response.headers.get('ETag'),
+            last_modified=response.headers.get('Last-Modified')
+        )
+        return stored.text
+
+    def scrape_articles(self, urls: list[str], concurrency: int = 5) -> list[NewsArticle]:
+        """
+        여러 기사 본문을 병렬로 스크래핑 (동기 래퍼)
+
+        이미 이벤트 루프 안에서는 scrape_articles_async()를 직접 await 할 것
+        """
+        return asyncio.run(self.scrape_articles_async(urls, concurrency=concurrency))
+
+    def _parse_article(self, url: str, html: str) -> NewsArticle:
+        """기사 HTML에서 제목/본문/날짜 추출"""
+        try:
+            # HTML 파싱 (제목/본문/날짜 영역만)
+            soup = parse_html(html, ids=self.ARTICLE_PARSE_IDS, classes=self.ARTICLE_PARSE_CLASSES)
 
             # 제목 추출
             title_elem = soup.select_one('#title_area span, #articleTitle, h2.media_end_head_headline')
@@ -81,58 +181,68 @@ class NaverScraper(BaseScraper):
                 source='네이버'
             )
 
-        except requests.RequestException as e:
-            raise Exception(f"네트워크 오류: {e}")
         except Exception as e:
             raise Exception(f"파싱 오류: {e}")
 
     def get_article_metadata(self, category_url: str = 'https://news.naver.com/section/101', limit: int = 30) -> list[dict]:
         """네이버 경제 섹션에서 기사 메타데이터(제목+요약+URL)만 빠르게 추출 - AI 선택용"""
         try:
-            response = requests.get(category_url, headers=self.headers, timeout=10)
-            response.raise_for_status()
-            soup = BeautifulSoup(response.text, 'html.parser')
+            response = self.http_cache.get(category_url, headers=self.headers)
+            return self.parse_metadata(response.text, limit=limit)
+
+        except Exception as e:
+            raise Exception(f"메타데이터 수집 오류: {e}")
 
-            articles_metadata = []
+    def parse_metadata(self, html: str, limit: int = None) -> list[dict]:
+        """
+        섹션 페이지 HTML에서 기사 메타데이터 추출
 
-            # 섹션별 기사 리스트 추출
-            for item in soup.select('.sa_item, .sa_item_inner'):
-                # 제목과 링크
-                title_elem = item.select_one('.sa_text_title, .sa_text_strong')
-                if not title_elem:
-                    continue
+        Args:
+            html: 섹션 페이지 HTML
+            limit: 최대 개수 (None이면 전체)
 
-                title = title_elem.get_text(strip=True)
-                url = title_elem.get('href', '')
+        Returns:
+            [{'url': ..., 'title': ..., 'summary': ..., 'article_id': ...}, ...]
+        """
+        soup = parse_html(html, classes=self.METADATA_PARSE_CLASSES)
 
-                if not url or 'news.naver.com' not in url:
-                    continue
+        articles_metadata = []
 
-                # 요약 (lede)
-                summary_elem = item.select_one('.sa_text_lede')
-                summary = summary_elem.get_text(strip=True) if summary_elem else ""
+        # 섹션별 기사 리스트 추출
+        for item in soup.select('.sa_item, .sa_item_inner'):
+            # 제목과 링크
+            title_elem = item.select_one('.sa_text_title, .sa_text_strong')
+            if not title_elem:
+                continue
 
-                articles_metadata.append({
-                    'url': url,
-                    'title': title,
-                    'summary': summary
-                })
+            title = title_elem.get_text(strip=True)
+            url = title_elem.get('href', '')
 
-                if len(articles_metadata) >= limit:
-                    break
+            if not url or 'news.naver.com' not in url:
+                continue
 
-            return articles_metadata
+            # 요약 (lede)
+            summary_elem = item.select_one('.sa_text_lede')
+            summary = summary_elem.get_text(strip=True) if summary_elem else ""
 
-        except Exception as e:
-            raise Exception(f"메타데이터 수집 오류: {e}")
+            articles_metadata.append({
+                'url': url,
+                'title': title,
+                'summary': summary,
+                'article_id': parse_article_id(url)
+            })
+
+            if limit and len(articles_metadata) >= limit:
+                break
+
+        return articles_metadata
 
     def get_article_list(self, category_url: str = 'https://news.naver.com/section/101', limit: int = 10) -> list[str]:
         """네이버 경제 섹션에서 기사 URL 리스트 추출"""
         try:
-            response = requests.get(category_url, headers=self.headers, timeout=10)
-            response.raise_for_status()
+            response = self.http_cache.get(category_url, headers=self.headers)
 
-            soup = BeautifulSoup(response.text, 'html.parser')
+            soup = parse_html(response.text, classes=self.LIST_PARSE_CLASSES)
 
             # 기사 링크 추출 (네이버 뉴스 구조에 따라 선택자 조정 필요)
             article_links = []
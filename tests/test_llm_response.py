@@ -0,0 +1,40 @@
+"""LLM 응답 JSON 보정 테스트"""
+
+import json
+
+import pytest
+
+from utils.llm_response import FieldStream, extract_json, parse_int, read_stream, repair_json
+
+
+@pytest.mark.parametrize('text, expected', [
+    # 문자열 안 스마트 따옴표는 그대로 유지하고 끝 쉼표만 제거
+    ('{"reason": "금리 “상승” 우려",}', {'reason': '금리 “상승” 우려'}),
+    ('[{"category": "도서", "reason": "‘가치 투자’ 입문서"},]',
+     [{'category': '도서', 'reason': '‘가치 투자’ 입문서'}]),
+    # 키/값을 감싼 스마트 따옴표는 일반 따옴표로
+    ('{“summary”: “금리 인상”, "keywords": ["금리",]}', {'summary': '금리 인상', 'keywords': ['금리']}),
+    ('{“reason”: "시장 “과열” 신호",}', {'reason': '시장 “과열” 신호'}),
+])
+def test_repair_keeps_smart_quotes_inside_strings(text, expected):
+    assert extract_json(text) == expected
+
+
+def test_extract_json_from_fenced_block_with_prose():
+    text = '분석 결과입니다.\n```json\n{"summary": "요약", "ok": True,}\n```\n참고하세요.'
+    assert extract_json(text) == {'summary': '요약', 'ok': True}
+
+
+def test_repair_closes_truncated_output():
+    repaired = repair_json('{"summary": "금리 “동결')
+    assert json.loads(repaired) == {'summary': '금리 “동결'}
+
+
+def test_field_stream_stops_when_fields_arrive():
+    chunks = [type('Chunk', (), {'text': text})() for text in ['선정 번호: [3', ']\n선정 이유: 중요\n', '나머지']]
+    stream = FieldStream(['선정 번호', '선정 이유'])
+
+    read_stream(chunks, stream, until=['선정 번호'])
+
+    assert parse_int(stream.get('선정 번호')) == 3
+    assert not stream.text.endswith('나머지')
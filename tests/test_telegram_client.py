@@ -0,0 +1,90 @@
+"""TelegramClient 연결 오류 복구 테스트 (가짜 Bot 사용, 네트워크 없음)"""
+
+import asyncio
+
+import pytest
+from telegram.error import TimedOut
+
+from publishers.telegram_client import TelegramClient
+
+
+class FakeBot:
+    """첫 번째 Bot은 동시 요청 전부 Pool timeout, 닫힌 Bot은 사용 시 오류"""
+
+    def __init__(self, generation: int, failing_requests: int):
+        self.generation = generation
+        self.closed = False
+        self._failing_requests = failing_requests
+        self._waiting = 0
+        self._all_waiting = asyncio.Event()
+
+    async def initialize(self):
+        self._check_open()
+
+    async def get_me(self):
+        self._check_open()
+
+    async def shutdown(self):
+        self.closed = True
+
+    async def send_message(self, chat_id, text):
+        self._check_open()
+        if self.generation == 0:
+            # 모든 요청이 같은 풀에서 동시에 실패하는 상황 재현
+            self._waiting += 1
+            if self._waiting >= self._failing_requests:
+                self._all_waiting.set()
+            await self._all_waiting.wait()
+            raise TimedOut("Pool timeout: All connections in the connection pool are occupied.")
+        return (self.generation, chat_id, text)
+
+    def _check_open(self):
+        if self.closed:
+            raise RuntimeError("This HTTPXRequest is not initialized or already closed")
+
+
+@pytest.fixture
+def fake_client(monkeypatch):
+    created = []
+    concurrency = 8
+
+    def create_bot(self):
+        bot = FakeBot(len(created), concurrency)
+        created.append(bot)
+        self.bot = bot
+        self._initialized = False
+
+    monkeypatch.setattr(TelegramClient, '_create_bot', create_bot)
+    return created, concurrency
+
+
+def test_concurrent_pool_timeouts_recreate_bot_once(fake_client):
+    created, concurrency = fake_client
+
+    async def main():
+        client = TelegramClient('123:token')
+        return await asyncio.gather(*(
+            client.run(lambda bot, i=i: bot.send_message(chat_id='chat', text=str(i)))
+            for i in range(concurrency)
+        ))
+
+    results = asyncio.run(main())
+
+    # 실패한 첫 Bot 대신 새 Bot 하나만 만들고, 모든 재시도가 그 Bot으로 성공
+    assert len(created) == 2
+    assert created[0].closed and not created[1].closed
+    assert sorted(text for _, _, text in results) == sorted(str(i) for i in range(concurrency))
+    assert {generation for generation, _, _ in results} == {1}
+
+
+def test_reset_without_failed_bot_always_recreates(fake_client):
+    created, _ = fake_client
+
+    async def main():
+        client = TelegramClient('123:token')
+        await client.reset()
+        await client.reset(created[0])  # 이미 교체된 Bot → 재생성 안 함
+
+    asyncio.run(main())
+
+    assert len(created) == 2
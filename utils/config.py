@@ -28,18 +28,56 @@ class Config:
     # ===== 텔레그램 =====
     TELEGRAM_BOT_TOKEN = os.getenv('TELEGRAM_BOT_TOKEN')
     TELEGRAM_CHAT_ID = os.getenv('TELEGRAM_CHAT_ID')
+    # 여러 채널/구독자에게 동시 발송 (쉼표 구분, 없으면 TELEGRAM_CHAT_ID만)
+    TELEGRAM_CHAT_IDS = [chat_id.strip() for chat_id in os.getenv('TELEGRAM_CHAT_IDS', '').split(',') if chat_id.strip()]
+    TELEGRAM_POOL_SIZE = int(os.getenv('TELEGRAM_POOL_SIZE', '8'))  # 공유 봇 클라이언트 연결 수
+    TELEGRAM_POOL_TIMEOUT = float(os.getenv('TELEGRAM_POOL_TIMEOUT', '5'))  # 빈 연결 대기 (초)
+    TELEGRAM_CONNECT_TIMEOUT = float(os.getenv('TELEGRAM_CONNECT_TIMEOUT', '10'))  # 초
+    TELEGRAM_READ_TIMEOUT = float(os.getenv('TELEGRAM_READ_TIMEOUT', '30'))  # 초
+    TELEGRAM_CHAT_RATE = float(os.getenv('TELEGRAM_CHAT_RATE', '1'))  # 채팅별 초당 발송 수
+    TELEGRAM_CHAT_BURST = int(os.getenv('TELEGRAM_CHAT_BURST', '5'))  # 채팅별 연속 발송 허용 수
+    TELEGRAM_GLOBAL_RATE = float(os.getenv('TELEGRAM_GLOBAL_RATE', '25'))  # 봇 전체 초당 발송 수
+    TELEGRAM_MAX_RETRIES = int(os.getenv('TELEGRAM_MAX_RETRIES', '3'))  # 429 발송 제한 시 재시도 횟수
+    TELEGRAM_FANOUT_CONCURRENCY = int(os.getenv('TELEGRAM_FANOUT_CONCURRENCY', '8'))  # 동시 발송 채팅 수 (연결 풀 크기 이하 권장)
+    TELEGRAM_HEALTHCHECK_INTERVAL = float(os.getenv('TELEGRAM_HEALTHCHECK_INTERVAL', '600'))  # 이 시간 이상 쉬면 사용 전 get_me 확인 (초)
+    TELEGRAM_FILE_CACHE_ENABLED = os.getenv('TELEGRAM_FILE_CACHE_ENABLED', 'true').lower() == 'true'  # 같은 이미지는 file_id로 재전송
+    TELEGRAM_FILE_CACHE_MAX_ENTRIES = int(os.getenv('TELEGRAM_FILE_CACHE_MAX_ENTRIES', '500'))
+    OUTBOX_MAX_ATTEMPTS = int(os.getenv('OUTBOX_MAX_ATTEMPTS', '5'))  # outbox 메시지 최대 전송 시도 (실행 간 누적)
+    OUTBOX_RETENTION_DAYS = float(os.getenv('OUTBOX_RETENTION_DAYS', '7'))  # 전송 끝난 outbox 보관 기간
 
     # ===== 쿠팡 파트너스 =====
     COUPANG_ACCESS_KEY = os.getenv('COUPANG_ACCESS_KEY')
     COUPANG_SECRET_KEY = os.getenv('COUPANG_SECRET_KEY')
     COUPANG_PARTNER_ID = os.getenv('COUPANG_PARTNER_ID')
+    COUPANG_LOCAL_MIN_SCORE = int(os.getenv('COUPANG_LOCAL_MIN_SCORE', '4'))  # 로컬 카탈로그 추천 최소 점수 (미만이면 LLM)
 
     # ===== 스크래핑 설정 =====
     MAX_ARTICLES_PER_SITE = int(os.getenv('MAX_ARTICLES_PER_SITE', '10'))
     SCRAPING_DELAY = float(os.getenv('SCRAPING_DELAY', '0.3'))  # 초
 
+    # ===== HTTP 설정 (공용 세션) =====
+    HTTP_TIMEOUT = float(os.getenv('HTTP_TIMEOUT', '10'))  # 초
+    HTTP_MAX_RETRIES = int(os.getenv('HTTP_MAX_RETRIES', '3'))
+    HTTP_BACKOFF_FACTOR = float(os.getenv('HTTP_BACKOFF_FACTOR', '0.5'))  # 재시도 간격 배수
+    HTTP_POOL_SIZE = int(os.getenv('HTTP_POOL_SIZE', '10'))  # 호스트당 keep-alive 연결 수
+
+    # ===== HTTP 캐시 (섹션/기사 페이지) =====
+    HTTP_CACHE_DIR = os.getenv('HTTP_CACHE_DIR', './data/http_cache')
+    HTTP_CACHE_TTL = float(os.getenv('HTTP_CACHE_TTL', '300'))  # 섹션 페이지 재검증 주기 (초)
+    HTTP_CACHE_ARTICLE_TTL = float(os.getenv('HTTP_CACHE_ARTICLE_TTL', '3600'))  # 기사 페이지 (초)
+    HTTP_CACHE_MAX_MB = int(os.getenv('HTTP_CACHE_MAX_MB', '50'))  # 디스크 용량 상한
+
+    # ===== 크롤러 (중복 제거 seen-set) =====
+    CRAWLER_SEEN_PATH = os.getenv('CRAWLER_SEEN_PATH', './data/crawler_seen.json')
+    CRAWLER_SEEN_RETENTION_HOURS = float(os.getenv('CRAWLER_SEEN_RETENTION_HOURS', '72'))
+    CRAWLER_PAGES = int(os.getenv('CRAWLER_PAGES', '1'))  # 세부 섹션별 수집 페이지 수
+    CRAWLER_CANDIDATE_LIMIT = int(os.getenv('CRAWLER_CANDIDATE_LIMIT', '100'))  # AI 선정 후보 최대 개수
+
     # ===== 데이터 경로 =====
     DATA_DIR = './data'
+    DATABASE_PATH = os.getenv('DATABASE_PATH', './data/spread_insight.db')  # SQLite (발행 이력 등)
+    TERM_INDEX_PATH = os.getenv('TERM_INDEX_PATH', './data/term_index.pkl')  # 용어 검색 오토마톤 캐시
+    BOOK_INDEX_DIR = os.getenv('BOOK_INDEX_DIR', './data/book_index')  # 도서 TF-IDF 인덱스 (mmap)
     RAW_DIR = './data/raw'
     PROCESSED_DIR = './data/processed'
     CHARTS_DIR = './data/charts'
@@ -49,6 +87,32 @@ class Config:
     # ===== AI 설정 =====
     SUMMARY_SENTENCES = int(os.getenv('SUMMARY_SENTENCES', '3'))  # 요약 문장 수
     MAX_TERMS_TO_EXPLAIN = int(os.getenv('MAX_TERMS_TO_EXPLAIN', '1'))  # 설명할 용어 수
+    LLM_MAX_CONCURRENCY = int(os.getenv('LLM_MAX_CONCURRENCY', '4'))  # 동시 LLM 호출 상한
+    LLM_STREAM_EARLY_STOP = os.getenv('LLM_STREAM_EARLY_STOP', 'true').lower() == 'true'  # 필요한 필드 수신 시 스트림 중단
+    SELECTOR_TOP_K = int(os.getenv('SELECTOR_TOP_K', '10'))  # AI 선정 전 규칙 기반 1차 선별 개수 (0이면 미사용)
+    SELECTOR_PREFETCH_CONTENT = os.getenv('SELECTOR_PREFETCH_CONTENT', 'true').lower() == 'true'  # 1차 선별 후보 본문을 병렬 수집해 AI 선정에 사용
+    SCRAPER_CONCURRENCY = int(os.getenv('SCRAPER_CONCURRENCY', '5'))  # 기사 본문 병렬 수집 수 (호스트별 요청 간격은 SCRAPING_DELAY)
+
+    # 프롬프트 본문 토큰 예산 (초과 시 정보량 높은 문장만 선택)
+    PROMPT_TOKENS_SUMMARY = int(os.getenv('PROMPT_TOKENS_SUMMARY', '1500'))
+    PROMPT_TOKENS_EXPLAIN = int(os.getenv('PROMPT_TOKENS_EXPLAIN', '1000'))
+    PROMPT_TOKENS_KEYWORDS = int(os.getenv('PROMPT_TOKENS_KEYWORDS', '700'))
+    PROMPT_TOKENS_ANALYZE_ALL = int(os.getenv('PROMPT_TOKENS_ANALYZE_ALL', '1500'))
+    PROMPT_TOKENS_SELECTOR_PREVIEW = int(os.getenv('PROMPT_TOKENS_SELECTOR_PREVIEW', '200'))  # 후보 기사 1개당
+
+    # ===== LLM 응답 캐시 =====
+    LLM_CACHE_ENABLED = os.getenv('LLM_CACHE_ENABLED', 'true').lower() == 'true'
+    LLM_CACHE_TTL_HOURS = float(os.getenv('LLM_CACHE_TTL_HOURS', '72'))
+    LLM_CACHE_MAX_ENTRIES = int(os.getenv('LLM_CACHE_MAX_ENTRIES', '1000'))
+
+    # ===== 도서 추천 =====
+    BOOK_RECOMMENDER_MODE = os.getenv('BOOK_RECOMMENDER_MODE', 'keyword')  # keyword: 키워드 배점 / tfidf: 문자 n-gram 유사도
+    BOOK_TFIDF_MIN_SCORE = float(os.getenv('BOOK_TFIDF_MIN_SCORE', '0.05'))  # tfidf 모드 최소 유사도
+
+    # ===== 용어 설명 미리 생성 (warm-up) =====
+    TERM_WARMUP_ENABLED = os.getenv('TERM_WARMUP_ENABLED', 'false').lower() == 'true'
+    TERM_WARMUP_MIN_MISSES = int(os.getenv('TERM_WARMUP_MIN_MISSES', '2'))  # 이 횟수 이상 나온 미등록 용어만
+    TERM_WARMUP_LIMIT = int(os.getenv('TERM_WARMUP_LIMIT', '5'))  # 1회 warm-up 최대 생성 수
 
     @classmethod
     def validate_gemini(cls) -> bool:
@@ -0,0 +1,137 @@
+"""
+JSON 콘텐츠 파일 로더
+
+경제 용어, 투자 꿀팁, 추천 도서, 용어 DB 등 data/*.json 파일을 공유 로드
+- 처음 접근할 때 로드 (lazy)
+- 파싱 결과를 (mtime, size) 기준으로 캐시, 파일이 바뀐 경우에만 다시 로드
+- 같은 파일은 프로세스 전체에서 한 번만 파싱 (인스턴스 간 공유)
+
+반환된 데이터는 여러 곳에서 공유하므로 수정하지 말고 필요하면 복사해서 사용
+"""
+
+import json
+import os
+import threading
+from datetime import date, datetime
+from typing import Any, Callable, Optional, Union
+
+
+class DataFile:
+    """변경 감지 JSON 파일"""
+
+    def __init__(
+        self,
+        path: str,
+        transform: Callable[[Any], Any] = None,
+        default: Any = None,
+        required: bool = False
+    ):
+        """
+        Args:
+            path: JSON 파일 경로
+            transform: 파싱 결과 가공 함수 (예: lambda d: d.get('terms', []))
+            default: 파일이 없거나 깨졌을 때 반환할 값
+            required: True면 파일이 없을 때 FileNotFoundError
+        """
+        self.path = path
+        self.transform = transform
+        self.default = default
+        self.required = required
+
+        self._signature: Optional[tuple[int, int]] = None  # (mtime_ns, size)
+        self._data: Any = None
+        self._lock = threading.Lock()
+
+    def load(self) -> Any:
+        """
+        데이터 반환 (파일이 바뀌었으면 다시 파싱)
+
+        Raises:
+            FileNotFoundError: required=True인데 파일이 없을 때
+        """
+        try:
+            stat = os.stat(self.path)
+        except FileNotFoundError:
+            if self.required:
+                raise FileNotFoundError(f"데이터 파일을 찾을 수 없습니다: {self.path}")
+            if self._signature != (-1, -1):
+                print(f"[WARNING] Data file not found: {self.path}")
+                self._signature, self._data = (-1, -1), self.default
+            return self._data
+
+        signature = (stat.st_mtime_ns, stat.st_size)
+        if signature == self._signature:
+            return self._data
+
+        with self._lock:
+            if signature != self._signature:
+                self._data = self._parse()
+                self._signature = signature
+        return self._data
+
+    def _parse(self) -> Any:
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"[ERROR] Failed to load {self.path}: {e}")
+            return self.default
+
+        return self.transform(data) if self.transform else data
+
+    def reload(self) -> Any:
+        """변경 여부와 관계없이 다시 로드"""
+        self._signature = None
+        return self.load()
+
+    # ===== 날짜 순환 조회 =====
+
+    @staticmethod
+    def index_for_date(day: Union[date, datetime], total: int) -> int:
+        """날짜 기반 순환 인덱스 (연중 일수 기준, 0 ~ total-1)"""
+        return (day.timetuple().tm_yday - 1) % total
+
+    def get_for_date(self, day: Union[date, datetime]) -> Optional[tuple[int, Any]]:
+        """
+        리스트 데이터에서 해당 날짜의 항목 (매일 순환)
+
+        Returns:
+            (인덱스, 항목) (데이터가 비어 있으면 None)
+        """
+        items = self.load()
+        if not items:
+            return None
+        index = self.index_for_date(day, len(items))
+        return index, items[index]
+
+
+_registry: dict[tuple, DataFile] = {}
+_registry_lock = threading.Lock()
+
+
+def get_data_file(path: str, key: str = None, **kwargs) -> DataFile:
+    """
+    경로별 공유 DataFile 반환 (같은 파일 + 같은 옵션은 한 번만 파싱)
+
+    옵션(default, required)이 다르면 호출한 쪽의 옵션대로 동작하도록 별도 인스턴스 사용
+
+    Args:
+        path: JSON 파일 경로
+        key: 최상위 dict에서 꺼낼 키 (예: 'terms'), None이면 전체
+        **kwargs: DataFile 옵션 (default, required)
+    """
+    # default는 dict/list일 수 있으므로 repr로 키에 포함
+    registry_key = (
+        os.path.abspath(path),
+        key,
+        bool(kwargs.get('required', False)),
+        repr(kwargs.get('default')),
+    )
+
+    with _registry_lock:
+        data_file = _registry.get(registry_key)
+        if data_file is None:
+            transform = (lambda data: data.get(key, kwargs.get('default'))) if key else None
+            data_file = DataFile(path, transform=transform, **kwargs)
+            _registry[registry_key] = data_file
+        return data_file
@@ -0,0 +1,26 @@
+"""
+경제 뉴스 우선순위 키워드 (CONTENT_STRATEGY.md 기준)
+
+뉴스 선정 점수(analyzers.news_selector)와 프롬프트 문장 선택(utils.prompt_builder)이 공유
+"""
+
+# 실질적 경제 뉴스 키워드
+PRIORITY_KEYWORDS = [
+    # 금융/통화 (최우선)
+    "금리", "환율", "달러", "원화", "연준", "Fed", "한국은행", "기준금리",
+    "통화정책", "양적완화", "긴축",
+    # 무역/관세 (최우선)
+    "관세", "무역", "수출", "수입", "무역수지", "통상",
+    # 부동산
+    "부동산", "아파트", "전세", "집값", "대출", "주택담보대출", "LTV", "DTI",
+    # 물가/세금
+    "물가", "인플레이션", "CPI", "소비자물가", "생산자물가", "세금", "세제", "감세", "증세",
+    # 투자/증시
+    "주식", "코스피", "다우", "나스닥", "S&P", "채권", "국채", "회사채",
+    # 정책 (경제 정책만)
+    "경기부양", "재정", "예산", "경제정책", "법안", "규제완화", "개정",
+    # 산업/경기
+    "GDP", "경제성장률", "실업률", "고용", "경기", "경기침체", "불황",
+    # 국제경제
+    "중국", "일본", "미국 경제", "유럽", "OPEC", "유가"
+]
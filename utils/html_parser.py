@@ -0,0 +1,96 @@
+"""
+HTML 파싱 헬퍼
+
+lxml 파서(C 구현)를 우선 사용하고, SoupStrainer로 필요한 요소(id/class)만
+트리로 만들어 큰 페이지의 파싱 시간과 메모리를 줄임
+"""
+
+from typing import Iterable
+
+from bs4 import BeautifulSoup, SoupStrainer
+
+# lxml 우선 사용 (없으면 내장 html.parser)
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = 'lxml'
+except ImportError:
+    HTML_PARSER = 'html.parser'
+    print("[WARNING] lxml not available, falling back to html.parser")
+
+# bs4 4.13+는 파싱 단계 필터가 ElementFilter.allow_tag_creation()으로 변경됨
+try:
+    from bs4.filter import ElementFilter
+except ImportError:
+    ElementFilter = None
+
+
+if ElementFilter is not None:
+    class _TagFilter(ElementFilter):
+        """(name, attrs)로 최상위 태그 생성 여부를 판단하는 필터 (bs4 4.13+)"""
+
+        def __init__(self, matches):
+            super().__init__()
+            self._matches = matches
+
+        def allow_tag_creation(self, nsprefix, name, attrs) -> bool:
+            return self._matches(name, attrs)
+
+        def allow_string_creation(self, string: str) -> bool:
+            # 대상 요소 밖의 텍스트는 버림
+            return False
+
+
+def make_strainer(ids: Iterable[str] = (), classes: Iterable[str] = ()):
+    """
+    지정한 id 또는 class를 가진 요소(와 그 하위 트리)만 남기는 파싱 필터 생성
+
+    Args:
+        ids: 남길 요소 id 목록
+        classes: 남길 요소 class 목록
+
+    Returns:
+        parse_only에 넘길 SoupStrainer (bs4 4.13+는 ElementFilter)
+    """
+    id_set = frozenset(ids)
+    class_set = frozenset(classes)
+
+    def matches(name, attrs) -> bool:
+        if not attrs:
+            return False
+
+        if id_set and attrs.get('id') in id_set:
+            return True
+
+        if class_set:
+            value = attrs.get('class')
+            if value:
+                # 파싱 단계에서는 "a b" 문자열, 트리에서는 리스트
+                names = value.split() if isinstance(value, str) else value
+                if not class_set.isdisjoint(names):
+                    return True
+
+        return False
+
+    if ElementFilter is not None:
+        return _TagFilter(matches)
+    return SoupStrainer(matches)
+
+
+def parse_html(markup, ids: Iterable[str] = (), classes: Iterable[str] = ()) -> BeautifulSoup:
+    """
+    HTML 파싱 (ids/classes 지정 시 해당 하위 트리만 파싱)
+
+    선택자는 남긴 하위 트리 안에서만 동작하므로
+    select()에 쓰는 최상위 id/class를 빠짐없이 넘길 것
+
+    Args:
+        markup: HTML 문자열 또는 bytes
+        ids: 남길 요소 id 목록
+        classes: 남길 요소 class 목록
+
+    Returns:
+        BeautifulSoup 객체
+    """
+    if ids or classes:
+        return BeautifulSoup(markup, HTML_PARSER, parse_only=make_strainer(ids, classes))
+    return BeautifulSoup(markup, HTML_PARSER)
@@ -0,0 +1,242 @@
+"""
+디스크 기반 HTTP 캐시 (Conditional GET)
+
+URL별로 본문과 ETag/Last-Modified를 저장해두고
+- TTL 이내: 네트워크 요청 없이 디스크에서 반환
+- TTL 경과: If-None-Match / If-Modified-Since로 재검증, 304면 디스크 본문 재사용
+전체 용량이 상한을 넘으면 가장 오래 사용하지 않은 항목부터 삭제 (LRU)
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from dataclasses import dataclass
+from typing import Optional
+
+from utils.config import Config
+from utils.http_client import http_get
+
+
+@dataclass
+class CachedResponse:
+    """캐시를 거친 HTTP 응답"""
+    url: str
+    content: bytes
+    encoding: str
+    status_code: int
+    from_cache: bool  # True면 본문을 디스크에서 읽음 (TTL 적중 또는 304)
+
+    @property
+    def text(self) -> str:
+        return self.content.decode(self.encoding, errors='replace')
+
+
+class HttpCache:
+    """URL 단위 디스크 캐시"""
+
+    def __init__(self, cache_dir: str = None, ttl: float = None, max_bytes: int = None):
+        """
+        Args:
+            cache_dir: 캐시 저장 경로 (None이면 Config.HTTP_CACHE_DIR)
+            ttl: 재검증 없이 사용할 기간 (초, None이면 Config.HTTP_CACHE_TTL)
+            max_bytes: 본문 총 용량 상한 (None이면 Config.HTTP_CACHE_MAX_MB)
+        """
+        self.cache_dir = cache_dir or Config.HTTP_CACHE_DIR
+        self.ttl = Config.HTTP_CACHE_TTL if ttl is None else ttl
+        self.max_bytes = max_bytes or Config.HTTP_CACHE_MAX_MB * 1024 * 1024
+        self._lock = threading.Lock()
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+    # ===== 조회 =====
+
+    def get(self, url: str, headers: dict = None, ttl: float = None, encoding: str = None) -> CachedResponse:
+        """
+        캐시를 거쳐 GET 요청
+
+        Args:
+            url: 요청 URL
+            headers: 추가 요청 헤더
+            ttl: 이 요청에만 적용할 TTL (초)
+            encoding: 본문 디코딩 인코딩 강제 (None이면 응답 헤더 기준)
+
+        Returns:
+            CachedResponse
+
+        Raises:
+            requests.RequestException: 네트워크 오류 또는 4xx/5xx 응답
+        """
+        meta = self.lookup(url)
+        if meta and self.is_fresh(meta, ttl):
+            cached = self.load(url, meta, encoding)
+            if cached:
+                return cached
+
+        request_headers = dict(headers or {})
+        request_headers.update(self.conditional_headers(meta))
+
+        response = http_get(url, headers=request_headers)
+
+        if response.status_code == 304 and meta:
+            self.revalidate(url, meta)
+            cached = self.load(url, meta, encoding)
+            if cached:
+                return cached
+            # 본문 파일이 사라진 경우 조건 없이 다시 요청
+            response = http_get(url, headers=headers)
+
+        response.raise_for_status()
+
+        # charset 미지정 응답은 requests가 ISO-8859-1로 추정하므로 utf-8로 취급
+        if not encoding and 'charset' in response.headers.get('Content-Type', '').lower():
+            encoding = response.encoding
+
+        return self.store(
+            url,
+            response.content,
+            encoding=encoding or 'utf-8',
+            etag=response.headers.get('ETag'),
+            last_modified=response.headers.get('Last-Modified'),
+            status_code=response.status_code
+        )
+
+    def lookup(self, url: str) -> Optional[dict]:
+        """저장된 메타데이터 반환 (없으면 None)"""
+        meta_path, body_path = self._paths(url)
+        if not os.path.exists(meta_path) or not os.path.exists(body_path):
+            return None
+
+        try:
+            with open(meta_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def is_fresh(self, meta: dict, ttl: float = None) -> bool:
+        """TTL 이내인지 여부"""
+        ttl = self.ttl if ttl is None else ttl
+        return time.time() - meta.get('fetched_at', 0) < ttl
+
+    def conditional_headers(self, meta: Optional[dict]) -> dict:
+        """재검증용 조건부 요청 헤더"""
+        headers = {}
+        if meta:
+            if meta.get('etag'):
+                headers['If-None-Match'] = meta['etag']
+            if meta.get('last_modified'):
+                headers['If-Modified-Since'] = meta['last_modified']
+        return headers
+
+    def load(self, url: str, meta: dict, encoding: str = None) -> Optional[CachedResponse]:
+        """디스크에서 본문 읽기 (사용 시각 갱신)"""
+        _, body_path = self._paths(url)
+        try:
+            with open(body_path, 'rb') as f:
+                content = f.read()
+            os.utime(body_path)  # LRU 기준 시각
+        except OSError:
+            return None
+
+        return CachedResponse(
+            url=url,
+            content=content,
+            encoding=encoding or meta.get('encoding') or 'utf-8',
+            status_code=200,
+            from_cache=True
+        )
+
+    # ===== 저장 =====
+
+    def store(
+        self,
+        url: str,
+        content: bytes,
+        encoding: str = 'utf-8',
+        etag: str = None,
+        last_modified: str = None,
+        status_code: int = 200
+    ) -> CachedResponse:
+        """응답 본문과 검증자 저장 후 용량 초과 시 정리"""
+        meta_path, body_path = self._paths(url)
+        meta = {
+            'url': url,
+            'etag': etag,
+            'last_modified': last_modified,
+            'encoding': encoding,
+            'fetched_at': time.time(),
+            'size': len(content)
+        }
+
+        with self._lock:
+            self._write_atomic(body_path, content)
+            self._write_atomic(meta_path, json.dumps(meta, ensure_ascii=False).encode('utf-8'))
+            self._evict()
+
+        return CachedResponse(
+            url=url,
+            content=content,
+            encoding=encoding,
+            status_code=status_code,
+            from_cache=False
+        )
+
+    def revalidate(self, url: str, meta: dict):
+        """304 응답 시 TTL 재시작"""
+        meta_path, _ = self._paths(url)
+        meta['fetched_at'] = time.time()
+        with self._lock:
+            self._write_atomic(meta_path, json.dumps(meta, ensure_ascii=False).encode('utf-8'))
+
+    def clear(self):
+        """캐시 전체 삭제"""
+        with self._lock:
+            for name in os.listdir(self.cache_dir):
+                try:
+                    os.remove(os.path.join(self.cache_dir, name))
+                except OSError:
+                    pass
+
+    # ===== 내부 =====
+
+    def _paths(self, url: str) -> tuple[str, str]:
+        key = hashlib.sha256(url.encode('utf-8')).hexdigest()
+        base = os.path.join(self.cache_dir, key)
+        return f"{base}.json", f"{base}.body"
+
+    def _write_atomic(self, path: str, data: bytes):
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+
+    def _evict(self):
+        """총 용량이 상한을 넘으면 오래 사용하지 않은 항목부터 삭제"""
+        entries = []
+        total = 0
+
+        for name in os.listdir(self.cache_dir):
+            if not name.endswith('.body'):
+                continue
+            path = os.path.join(self.cache_dir, name)
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+            total += stat.st_size
+
+        if total <= self.max_bytes:
+            return
+
+        entries.sort()
+        for _, size, body_path in entries:
+            if total <= self.max_bytes:
+                break
+            meta_path = body_path[:-len('.body')] + '.json'
+            for path in (body_path, meta_path):
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+            total -= size
@@ -0,0 +1,120 @@
+"""
+공용 HTTP 클라이언트
+
+프로세스 전역에서 하나의 requests.Session을 공유하여
+호스트별 keep-alive 연결 풀을 재사용 (DNS/TCP/TLS 핸드셰이크 절감)
+재시도/백오프/타임아웃은 Config에서 설정
+"""
+
+import threading
+from typing import Optional
+
+import httpx
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from utils.config import Config
+
+
+DEFAULT_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+}
+
+# 재시도 대상 상태 코드 (일시적 오류)
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+
+_session: Optional[requests.Session] = None
+_session_lock = threading.Lock()
+
+
+def _create_session() -> requests.Session:
+    """연결 풀 + 재시도 정책이 적용된 세션 생성"""
+    retry = Retry(
+        total=Config.HTTP_MAX_RETRIES,
+        backoff_factor=Config.HTTP_BACKOFF_FACTOR,
+        status_forcelist=RETRY_STATUS_CODES,
+        allowed_methods=frozenset(['GET', 'HEAD']),
+        respect_retry_after_header=True,
+        raise_on_status=False  # 최종 응답은 호출부의 raise_for_status()에서 처리
+    )
+    adapter = HTTPAdapter(
+        pool_connections=Config.HTTP_POOL_SIZE,  # 캐시할 호스트별 풀 개수
+        pool_maxsize=Config.HTTP_POOL_SIZE,      # 호스트당 유지할 연결 수
+        max_retries=retry
+    )
+
+    session = requests.Session()
+    session.headers.update(DEFAULT_HEADERS)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+
+def get_session() -> requests.Session:
+    """프로세스 전역 공유 세션 반환 (최초 호출 시 생성)"""
+    global _session
+
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                _session = _create_session()
+    return _session
+
+
+def http_get(url: str, **kwargs) -> requests.Response:
+    """
+    공유 세션으로 GET 요청
+
+    Args:
+        url: 요청 URL
+        **kwargs: requests.get과 동일 (timeout 미지정 시 Config.HTTP_TIMEOUT)
+
+    Returns:
+        requests.Response
+    """
+    kwargs.setdefault('timeout', Config.HTTP_TIMEOUT)
+    return get_session().get(url, **kwargs)
+
+
+def create_async_client(max_connections: Optional[int] = None, **kwargs) -> httpx.AsyncClient:
+    """
+    비동기 일괄 요청용 httpx 클라이언트 생성
+
+    AsyncClient는 이벤트 루프에 묶이므로 전역 공유하지 않고
+    배치 작업 단위로 생성 후 async with로 닫을 것
+
+    Args:
+        max_connections: 최대 동시 연결 수 (None이면 Config.HTTP_POOL_SIZE)
+        **kwargs: httpx.AsyncClient 추가 인자
+
+    Returns:
+        httpx.AsyncClient
+    """
+    max_connections = max_connections or Config.HTTP_POOL_SIZE
+
+    headers = dict(DEFAULT_HEADERS)
+    headers.update(kwargs.pop('headers', None) or {})
+
+    transport = httpx.AsyncHTTPTransport(
+        retries=Config.HTTP_MAX_RETRIES,  # 연결 실패 시 재시도
+        limits=httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_connections
+        )
+    )
+
+    kwargs.setdefault('timeout', Config.HTTP_TIMEOUT)
+    kwargs.setdefault('follow_redirects', True)
+
+    return httpx.AsyncClient(headers=headers, transport=transport, **kwargs)
+
+
+def close_session():
+    """공유 세션 종료 (프로세스 종료 시)"""
+    global _session
+
+    with _session_lock:
+        if _session is not None:
+            _session.close()
+            _session = None
@@ -0,0 +1,36 @@
+"""
+LLM 동시 호출 제한
+
+비동기 LLM 호출(Gemini, 쿠팡 추천 등)이 공유하는 세마포어
+이벤트 루프마다 하나씩 생성 (asyncio.Semaphore는 루프에 묶이므로)
+"""
+
+import asyncio
+import threading
+import weakref
+
+from utils.config import Config
+
+
+_semaphores: 'weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]' = weakref.WeakKeyDictionary()
+_lock = threading.Lock()
+
+
+def llm_semaphore() -> asyncio.Semaphore:
+    """
+    현재 이벤트 루프의 LLM 호출 세마포어 반환
+
+    동시 호출 수 상한은 Config.LLM_MAX_CONCURRENCY
+
+    Usage:
+        async with llm_semaphore():
+            response = await model.generate_content_async(prompt)
+    """
+    loop = asyncio.get_running_loop()
+
+    with _lock:
+        semaphore = _semaphores.get(loop)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(max(1, Config.LLM_MAX_CONCURRENCY))
+            _semaphores[loop] = semaphore
+        return semaphore
@@ -0,0 +1,282 @@
+"""
+LLM 응답 파싱
+
+Gemini 응답에서 JSON / "필드: 값" 형식 결과를 꺼내는 공용 모듈
+- 코드 블록(```json), 앞뒤 설명 문장, 끝 쉼표, 스마트 따옴표, 잘린 출력 등 흔한 형식 오류 보정
+- 스트리밍 응답을 조각 단위로 누적 파싱해, 필요한 필드가 도착하면 나머지를 기다리지 않고 중단
+
+사용 예:
+    stream = FieldStream(['선정 번호', '선정 이유'])
+    text = await read_stream_async(response, stream, until=['선정 번호'])
+    number = parse_int(stream.get('선정 번호'))
+"""
+
+import json
+import re
+from typing import Any, AsyncIterable, Iterable, Optional
+
+
+_FENCE_RE = re.compile(r'```(?:json|JSON)?\s*(.*?)(?:```|$)', re.DOTALL)
+_SMART_QUOTES = '“”„'  # 문자열 밖에서는 일반 따옴표로 취급
+_PY_LITERALS = {'True': 'true', 'False': 'false', 'None': 'null'}
+_CLOSERS = {'{': '}', '[': ']'}
+
+
+# ===== JSON =====
+
+def extract_json(text: str) -> Any:
+    """
+    응답 텍스트에서 JSON 값 추출
+
+    코드 블록/앞뒤 문장을 제거하고, 그대로 파싱되지 않으면 repair_json()으로 보정 후 재시도
+
+    Raises:
+        ValueError: JSON을 찾지 못했거나 보정 후에도 파싱 실패 (json.JSONDecodeError 포함)
+    """
+    candidate = _json_candidate(text)
+    if candidate is None:
+        raise ValueError("응답에서 JSON을 찾을 수 없습니다.")
+
+    try:
+        return json.loads(candidate)
+    except json.JSONDecodeError:
+        return json.loads(repair_json(candidate))
+
+
+def _json_candidate(text: str) -> Optional[str]:
+    """코드 블록 안쪽 또는 첫 '{' / '[' 부터의 텍스트"""
+    fenced = _FENCE_RE.search(text)
+    if fenced:
+        text = fenced.group(1)
+
+    starts = [pos for pos in (text.find('{'), text.find('[')) if pos >= 0]
+    if not starts:
+        return None
+    return text[min(starts):].strip()
+
+
+def repair_json(text: str) -> str:
+    """
+    흔한 JSON 형식 오류 보정
+
+    - 키/값을 감싼 스마트 따옴표 → 일반 따옴표 (문자열 안의 “강조” 따옴표는 그대로 유지)
+    - 문자열 안 줄바꿈 → \\n
+    - 끝 쉼표 제거 ("a": 1,} → "a": 1})
+    - 파이썬 리터럴 (True/False/None) → JSON 리터럴
+    - 닫히지 않은 문자열/괄호 닫기 (출력이 중간에 잘린 경우)
+    - 최상위 값 뒤에 붙은 설명 문장 제거
+    """
+    out: list[str] = []
+    stack: list[str] = []
+    in_string = False
+    smart_string = False  # 스마트 따옴표로 열린 문자열 (” 또는 "로 닫힘)
+    escaped = False
+    i = 0
+
+    while i < len(text):
+        ch = text[i]
+
+        if in_string:
+            if escaped:
+                escaped = False
+            elif ch == '\\':
+                escaped = True
+            elif ch == '"' or (smart_string and ch == '”'):
+                in_string = False
+                ch = '"'
+            elif ch == '\n':
+                ch = '\\n'
+            out.append(ch)
+            i += 1
+            continue
+
+        if ch == '"' or ch in _SMART_QUOTES:
+            in_string = True
+            smart_string = ch != '"'
+            ch = '"'
+        elif ch in _CLOSERS:
+            stack.append(_CLOSERS[ch])
+        elif ch in '}]':
+            _strip_trailing_comma(out)
+            if stack:
+                stack.pop()
+            out.append(ch)
+            if not stack:
+                break  # 최상위 값 종료 → 뒤쪽 텍스트 무시
+            i += 1
+            continue
+        elif ch.isascii() and ch.isalpha():
+            word = re.match(r'[A-Za-z]+', text[i:]).group()
+            out.append(_PY_LITERALS.get(word, word))
+            i += len(word)
+            continue
+
+        out.append(ch)
+        i += 1
+
+    # 잘린 출력 마무리
+    if in_string:
+        if escaped:
+            out.pop()
+        out.append('"')
+    _strip_dangling(out)
+    while stack:
+        _strip_trailing_comma(out)
+        out.append(stack.pop())
+
+    return ''.join(out)
+
+
+def _strip_trailing_comma(out: list[str]):
+    """출력 끝의 공백과 쉼표 제거"""
+    while out and out[-1].isspace():
+        out.pop()
+    if out and out[-1] == ',':
+        out.pop()
+
+
+def _strip_dangling(out: list[str]):
+    """값 없이 끝난 키("key": / "key") 제거"""
+    text = ''.join(out).rstrip()
+    trimmed = re.sub(r'(?:,\s*)?"(?:[^"\\]|\\.)*"\s*:\s*$', '', text)
+    if trimmed == text:
+        trimmed = re.sub(r'([{,])\s*"(?:[^"\\]|\\.)*"$', r'\1', text)
+    trimmed = re.sub(r'[,:]\s*$', '', trimmed)
+    out[:] = list(trimmed)
+
+
+# ===== "필드: 값" 형식 =====
+
+def _normalize_label(label: str) -> str:
+    return re.sub(r'\s+', '', label)
+
+
+class FieldStream:
+    """
+    "필드: 값" 줄 형식 스트리밍 파서
+
+        선정 번호: 3
+        선정 이유: ...
+
+    줄바꿈이 도착해야 그 줄의 값을 완료로 간주 (마지막 줄은 close() 시 완료)
+    마크다운 강조(**선정 번호**:), 전각 콜론(：), 대괄호 값([3])도 허용
+    """
+
+    def __init__(self, fields: Iterable[str] = None):
+        """
+        Args:
+            fields: 받을 필드명 (None이면 모든 "이름: 값" 줄)
+        """
+        self._labels = {_normalize_label(name): name for name in fields} if fields else None
+        self.text = ''
+        self.fields: dict[str, str] = {}
+        self._pending = ''
+
+    def feed(self, chunk: str) -> dict[str, str]:
+        """
+        응답 조각 추가
+
+        Returns:
+            이번 조각으로 새로 완료된 필드
+        """
+        self.text += chunk
+        self._pending += chunk
+
+        *lines, self._pending = self._pending.split('\n')
+        return self._parse_lines(lines)
+
+    def close(self) -> dict[str, str]:
+        """스트림 종료 (마지막 줄 처리)"""
+        lines, self._pending = [self._pending], ''
+        return self._parse_lines(lines)
+
+    def _parse_lines(self, lines: list[str]) -> dict[str, str]:
+        new = {}
+        for line in lines:
+            parsed = self._parse_line(line)
+            if parsed and parsed[0] not in self.fields:
+                new[parsed[0]] = parsed[1]
+        self.fields.update(new)
+        return new
+
+    def _parse_line(self, line: str) -> Optional[tuple[str, str]]:
+        cleaned = line.replace('*', '').replace('#', '').strip()
+        label, sep, value = cleaned.replace('：', ':').partition(':')
+        if not sep:
+            return None
+
+        label = label.strip().lstrip('-').strip()
+        if self._labels is None:
+            name = label
+        else:
+            name = self._labels.get(_normalize_label(label))
+            if name is None:
+                return None
+
+        value = value.strip()
+        if value.startswith('[') and value.endswith(']'):
+            value = value[1:-1].strip()
+        return name, value
+
+    def get(self, name: str, default: Any = None) -> Any:
+        return self.fields.get(name, default)
+
+    def has(self, *names: str) -> bool:
+        return all(name in self.fields for name in names)
+
+
+def parse_int(value: Optional[str]) -> Optional[int]:
+    """값의 첫 정수 ("3번", "[3]", "#3" → 3), 없으면 None"""
+    if not value:
+        return None
+    match = re.search(r'\d+', value)
+    return int(match.group()) if match else None
+
+
+# ===== 스트림 읽기 =====
+
+def _chunk_text(chunk) -> str:
+    """응답 조각 텍스트 (안전 필터 등으로 텍스트가 없는 조각은 빈 문자열)"""
+    try:
+        return chunk.text
+    except (ValueError, AttributeError):
+        return ''
+
+
+def read_stream(response: Iterable, parser, until: Iterable[str] = None) -> str:
+    """
+    스트리밍 응답을 parser에 전달하며 읽기
+
+    Args:
+        response: generate_content(..., stream=True) 응답
+        parser: FieldStream
+        until: 이 필드가 모두 도착하면 나머지 응답을 기다리지 않고 중단
+
+    Returns:
+        지금까지 받은 텍스트
+    """
+    until = list(until or [])
+    for chunk in response:
+        parser.feed(_chunk_text(chunk))
+        if until and parser.has(*until):
+            break
+    else:
+        _close(parser)
+    return parser.text
+
+
+async def read_stream_async(response: AsyncIterable, parser, until: Iterable[str] = None) -> str:
+    """read_stream()의 비동기 버전 (generate_content_async(..., stream=True) 응답)"""
+    until = list(until or [])
+    async for chunk in response:
+        parser.feed(_chunk_text(chunk))
+        if until and parser.has(*until):
+            break
+    else:
+        _close(parser)
+    return parser.text
+
+
+def _close(parser):
+    if hasattr(parser, 'close'):
+        parser.close()
@@ -0,0 +1,41 @@
+"""
+네이버 뉴스 URL 헬퍼
+
+스크래퍼/크롤러/발행 기사 저장소가 같은 기준으로 기사를 식별하도록 공유
+"""
+
+import re
+from typing import Optional
+
+
+# 기사 URL 패턴: /article/{oid}/{aid} 또는 ?oid=...&aid=...
+_ARTICLE_PATH_PATTERN = re.compile(r'/article/(\d{3})/(\d{6,})')
+_ARTICLE_QUERY_OID = re.compile(r'[?&]oid=(\d+)')
+_ARTICLE_QUERY_AID = re.compile(r'[?&]aid=(\d+)')
+
+
+def parse_article_id(url: str) -> Optional[str]:
+    """
+    네이버 기사 URL에서 정규 기사 ID 추출
+
+    같은 기사가 섹션/모바일/구형 URL 등 다른 형태로 노출되어도 동일한 ID를 반환
+
+    Args:
+        url: 기사 URL
+
+    Returns:
+        "{oid}/{aid}" 형식 ID (인식할 수 없는 URL이면 None)
+    """
+    if not url:
+        return None
+
+    match = _ARTICLE_PATH_PATTERN.search(url)
+    if match:
+        return f"{match.group(1)}/{match.group(2)}"
+
+    oid = _ARTICLE_QUERY_OID.search(url)
+    aid = _ARTICLE_QUERY_AID.search(url)
+    if oid and aid:
+        return f"{oid.group(1)}/{aid.group(1)}"
+
+    return None
@@ -0,0 +1,142 @@
+"""
+토큰 예산 기반 프롬프트 본문 구성
+
+긴 기사를 글자 수로 자르는 대신, 정보량이 많은 문장을 골라 토큰 예산에 맞춤
+- 숫자/통계(%, 조, 억)가 들어간 문장
+- 우선순위 키워드(utils.economy_keywords.PRIORITY_KEYWORDS)가 들어간 문장
+- 리드 문장(기사 첫 문장)
+선택한 문장은 원래 순서대로 이어붙임
+"""
+
+import math
+import re
+from dataclasses import dataclass
+from typing import Iterable, Optional
+
+from utils.economy_keywords import PRIORITY_KEYWORDS
+
+
+# 토큰 추정 계수 (Gemini 토크나이저 기준 근사치)
+HANGUL_TOKENS_PER_CHAR = 0.8   # 한글 음절 1자 ≈ 0.8 토큰
+OTHER_CHARS_PER_TOKEN = 4.0    # 영문/숫자/기호 4자 ≈ 1 토큰
+
+_HANGUL_RE = re.compile(r'[가-힣ㄱ-ㆎ]')
+_SENTENCE_SPLIT_RE = re.compile(r'(?<=[.!?。])\s+|\n+')
+_STAT_RE = re.compile(r'\d+\.?\d*%|\d+조|\d+억')
+_NUMBER_RE = re.compile(r'\d')
+
+
+@dataclass
+class FittedText:
+    """예산에 맞춘 본문"""
+    text: str
+    tokens: int           # 추정 토큰 수
+    original_tokens: int  # 원문 추정 토큰 수
+    truncated: bool       # 문장 선택/절단 여부
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    텍스트 토큰 수 추정 (API 호출 없이)
+
+    한글은 음절 단위, 그 외 문자는 글자 수 기준으로 근사
+    """
+    if not text:
+        return 0
+    hangul = len(_HANGUL_RE.findall(text))
+    other = len(text) - hangul
+    return math.ceil(hangul * HANGUL_TOKENS_PER_CHAR + other / OTHER_CHARS_PER_TOKEN)
+
+
+def split_sentences(text: str) -> list[str]:
+    """문장 단위 분리 (마침표/물음표/느낌표 뒤 공백, 줄바꿈 기준)"""
+    return [s.strip() for s in _SENTENCE_SPLIT_RE.split(text) if s and s.strip()]
+
+
+def sentence_score(sentence: str, keywords: Iterable[str], is_lead: bool = False) -> float:
+    """
+    문장 정보량 점수
+
+    배점:
+    - 통계 수치(%, 조, 억): 개당 3점 (최대 9점)
+    - 기타 숫자 포함: 1점
+    - 우선순위 키워드: 개당 2점 (최대 8점)
+    - 리드 문장: 5점
+    """
+    score = 0.0
+
+    stats = len(_STAT_RE.findall(sentence))
+    score += min(9, stats * 3)
+    if not stats and _NUMBER_RE.search(sentence):
+        score += 1
+
+    keyword_hits = sum(1 for kw in keywords if kw in sentence)
+    score += min(8, keyword_hits * 2)
+
+    if is_lead:
+        score += 5
+
+    return score
+
+
+def fit_to_budget(text: str, max_tokens: int, keywords: Optional[Iterable[str]] = None) -> FittedText:
+    """
+    본문을 토큰 예산에 맞춤
+
+    예산 이내면 원문 그대로, 넘으면 점수가 높은 문장부터 예산이 찰 때까지 선택
+
+    Args:
+        text: 원문
+        max_tokens: 토큰 예산
+        keywords: 가중치를 줄 키워드 (None이면 PRIORITY_KEYWORDS)
+
+    Returns:
+        FittedText
+    """
+    text = (text or '').strip()
+    original_tokens = estimate_tokens(text)
+
+    if original_tokens <= max_tokens:
+        return FittedText(text=text, tokens=original_tokens, original_tokens=original_tokens, truncated=False)
+
+    keywords = list(PRIORITY_KEYWORDS if keywords is None else keywords)
+    sentences = split_sentences(text)
+
+    ranked = sorted(
+        range(len(sentences)),
+        key=lambda i: (-sentence_score(sentences[i], keywords, is_lead=(i == 0)), i)
+    )
+
+    selected = []
+    used = 0
+    for i in ranked:
+        cost = estimate_tokens(sentences[i]) + 1  # 문장 사이 공백
+        if used + cost > max_tokens:
+            continue
+        selected.append(i)
+        used += cost
+
+    if selected:
+        fitted = ' '.join(sentences[i] for i in sorted(selected))
+    else:
+        # 한 문장도 예산에 들어가지 않으면 첫 문장을 잘라서 사용
+        fitted = _truncate_to_tokens(sentences[0] if sentences else text, max_tokens)
+
+    return FittedText(
+        text=fitted,
+        tokens=estimate_tokens(fitted),
+        original_tokens=original_tokens,
+        truncated=True
+    )
+
+
+def _truncate_to_tokens(text: str, max_tokens: int) -> str:
+    """글자 단위로 잘라 예산에 맞춤"""
+    lo, hi = 0, len(text)
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if estimate_tokens(text[:mid]) <= max_tokens:
+            lo = mid
+        else:
+            hi = mid - 1
+    return text[:lo]
@@ -0,0 +1,109 @@
+"""
+요청 속도 제한
+
+- HostRateLimiter: 같은 호스트로 가는 요청 사이에 최소 간격(Config.SCRAPING_DELAY)을 보장
+- TokenBucket: 초당 허용량 + 순간 허용량(버스트) 제한 (텔레그램 발송 등)
+동기(스레드)/비동기(asyncio) 호출 모두 지원
+"""
+
+import asyncio
+import threading
+import time
+from typing import Optional
+from urllib.parse import urlparse
+
+from utils.config import Config
+
+
+class HostRateLimiter:
+    """호스트 단위 최소 요청 간격 보장"""
+
+    def __init__(self, delay: Optional[float] = None):
+        """
+        Args:
+            delay: 같은 호스트 요청 간 최소 간격 (초, None이면 Config.SCRAPING_DELAY)
+        """
+        self.delay = Config.SCRAPING_DELAY if delay is None else delay
+        self._next_slot: dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def _reserve(self, url: str) -> float:
+        """다음 요청 슬롯을 예약하고 대기해야 할 시간(초) 반환"""
+        host = urlparse(url).netloc
+
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot.get(host, now))
+            self._next_slot[host] = slot + self.delay
+            return slot - now
+
+    def wait(self, url: str):
+        """요청 전 대기 (동기)"""
+        wait_time = self._reserve(url)
+        if wait_time > 0:
+            time.sleep(wait_time)
+
+    async def wait_async(self, url: str):
+        """요청 전 대기 (비동기)"""
+        wait_time = self._reserve(url)
+        if wait_time > 0:
+            await asyncio.sleep(wait_time)
+
+
+class TokenBucket:
+    """
+    토큰 버킷 (초당 rate개, 최대 capacity개까지 몰아서 허용)
+
+    토큰을 미리 예약하는 방식이라 동시에 여러 요청이 와도 순서대로 간격이 벌어짐
+    """
+
+    def __init__(self, rate: float, capacity: float = 1):
+        """
+        Args:
+            rate: 초당 토큰 보충 수
+            capacity: 버킷 크기 (연속 허용 개수)
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._blocked_until = 0.0
+        self._lock = threading.Lock()
+
+    def _reserve(self) -> float:
+        """토큰 1개를 예약하고 대기해야 할 시간(초) 반환"""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+
+            wait_time = -self._tokens / self.rate if self._tokens < 0 else 0.0
+            return max(wait_time, self._blocked_until - now)
+
+    def block(self, seconds: float):
+        """서버가 요청한 대기 시간(429 retry_after) 동안 토큰 지급 중단 (남은 토큰도 비움)"""
+        with self._lock:
+            now = time.monotonic()
+            self._blocked_until = max(self._blocked_until, now + seconds)
+            self._tokens = min(self._tokens, 0)
+            self._updated = max(self._updated, now)
+
+    def is_full(self) -> bool:
+        """토큰이 가득 찼고 차단 중이 아닌지 (버려도 다시 만든 것과 같은 상태)"""
+        with self._lock:
+            now = time.monotonic()
+            tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            return tokens >= self.capacity and now >= self._blocked_until
+
+    def wait(self):
+        """토큰 획득까지 대기 (동기)"""
+        wait_time = self._reserve()
+        if wait_time > 0:
+            time.sleep(wait_time)
+
+    async def wait_async(self):
+        """토큰 획득까지 대기 (비동기)"""
+        wait_time = self._reserve()
+        if wait_time > 0:
+            await asyncio.sleep(wait_time)
@@ -0,0 +1,256 @@
+"""
+문자 n-gram TF-IDF 유사도 인덱스
+
+한국어는 조사/어미가 붙어 단어 단위 매칭이 잘 안 되므로
+어절 경계를 포함한 문자 2~3-gram으로 문서를 벡터화
+- 문서 행렬은 n-gram(열) 기준 희소 구조(CSC)로 디스크에 .npy 저장 후 mmap으로 로드
+- 질의는 질의에 등장한 n-gram 열만 모아 한 번의 희소 행렬-벡터 곱으로 전체 문서 점수 계산
+- 문서별 n-gram 빈도를 해시 기준으로 캐시해, 문서가 바뀌면 바뀐 문서만 다시 토큰화
+"""
+
+import hashlib
+import json
+import math
+import os
+import pickle
+import re
+import shutil
+from collections import Counter
+from typing import Optional
+
+import numpy as np
+
+
+INDEX_VERSION = 1
+NGRAM_RANGE = (2, 3)
+
+_NON_WORD_RE = re.compile(r'[^\w]+')
+
+
+def char_ngrams(text: str, ngram_range: tuple[int, int] = NGRAM_RANGE) -> Counter:
+    """
+    어절 경계 포함 문자 n-gram 빈도
+
+    "기준금리 인상" → " 기", "기준", "준금", ..., "리 ", " 인", "인상", "상 ", " 기준", ...
+    """
+    counts = Counter()
+    min_n, max_n = ngram_range
+
+    for token in _NON_WORD_RE.sub(' ', text.lower()).split():
+        padded = f" {token} "
+        for n in range(min_n, max_n + 1):
+            for i in range(len(padded) - n + 1):
+                counts[padded[i:i + n]] += 1
+
+    return counts
+
+
+class TfidfIndex:
+    """디스크 캐시 TF-IDF 문서 인덱스"""
+
+    def __init__(self, cache_dir: str):
+        """
+        Args:
+            cache_dir: 인덱스 저장 경로
+        """
+        self.cache_dir = cache_dir
+        self.signature: Optional[str] = None
+        self.num_docs = 0
+
+        self._vocab: dict[str, int] = {}
+        self._idf: Optional[np.ndarray] = None
+        self._term_ptr: Optional[np.ndarray] = None      # n-gram별 구간 시작 위치 (len = vocab + 1)
+        self._term_docs: Optional[np.ndarray] = None     # 문서 번호
+        self._term_weights: Optional[np.ndarray] = None  # 정규화된 TF-IDF 가중치
+
+    # ===== 빌드 / 로드 =====
+
+    def build(self, documents: list[str]) -> 'TfidfIndex':
+        """
+        문서 목록으로 인덱스 준비
+
+        저장된 인덱스의 문서 해시 목록이 같으면 mmap 로드만 하고,
+        다르면 캐시되지 않은 문서만 토큰화하여 다시 조립 후 저장
+
+        Args:
+            documents: 문서 텍스트 (문서 번호 = 목록 순서)
+        """
+        doc_hashes = [hashlib.sha256(doc.encode('utf-8')).hexdigest() for doc in documents]
+        signature = hashlib.sha256(
+            f"{INDEX_VERSION}:{NGRAM_RANGE}:{','.join(doc_hashes)}".encode('utf-8')
+        ).hexdigest()
+
+        if signature == self.signature:
+            return self
+        if self._load(signature):
+            return self
+
+        counts = self._doc_counts(documents, doc_hashes)
+        arrays, vocab = self._assemble(counts)
+        self._save(signature, arrays, vocab, num_docs=len(documents))
+        self._load(signature)
+        return self
+
+    def _doc_counts(self, documents: list[str], doc_hashes: list[str]) -> list[Counter]:
+        """문서별 n-gram 빈도 (해시 캐시 재사용, 새 문서만 토큰화)"""
+        cache_path = os.path.join(self.cache_dir, 'doc_counts.pkl')
+        cache = {}
+        if os.path.exists(cache_path):
+            try:
+                with open(cache_path, 'rb') as f:
+                    cache = pickle.load(f)
+            except Exception as e:
+                print(f"[WARNING] TF-IDF 문서 캐시 로드 실패, 전체 재계산: {e}")
+
+        counts = []
+        fresh = {}
+        for doc, doc_hash in zip(documents, doc_hashes):
+            doc_counts = cache.get(doc_hash)
+            if doc_counts is None:
+                doc_counts = char_ngrams(doc)
+            fresh[doc_hash] = doc_counts
+            counts.append(doc_counts)
+
+        # 현재 문서만 남겨 저장 (삭제된 문서는 정리)
+        os.makedirs(self.cache_dir, exist_ok=True)
+        tmp_path = f"{cache_path}.tmp"
+        with open(tmp_path, 'wb') as f:
+            pickle.dump(fresh, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, cache_path)
+
+        return counts
+
+    def _assemble(self, counts: list[Counter]) -> tuple[dict[str, np.ndarray], list[str]]:
+        """문서별 빈도 → n-gram 기준 정렬된 희소 행렬 배열"""
+        num_docs = len(counts)
+        vocab = sorted({gram for doc_counts in counts for gram in doc_counts})
+        vocab_ids = {gram: i for i, gram in enumerate(vocab)}
+
+        term_ids, doc_ids, tf = [], [], []
+        for doc_id, doc_counts in enumerate(counts):
+            for gram, count in doc_counts.items():
+                term_ids.append(vocab_ids[gram])
+                doc_ids.append(doc_id)
+                tf.append(count)
+
+        term_ids = np.array(term_ids, dtype=np.int32)
+        doc_ids = np.array(doc_ids, dtype=np.int32)
+        tf = np.array(tf, dtype=np.float32)
+
+        # idf = ln((1 + N) / (1 + df)) + 1, tf = 1 + ln(count)
+        df = np.bincount(term_ids, minlength=len(vocab))
+        idf = (np.log((1 + num_docs) / (1 + df)) + 1).astype(np.float32)
+        weights = (1 + np.log(tf)) * idf[term_ids]
+
+        # 문서 벡터 L2 정규화
+        norms = np.sqrt(np.bincount(doc_ids, weights=weights * weights, minlength=num_docs))
+        weights = (weights / np.maximum(norms[doc_ids], 1e-12)).astype(np.float32)
+
+        # n-gram 기준 정렬 (CSC)
+        order = np.argsort(term_ids, kind='stable')
+        term_ptr = np.zeros(len(vocab) + 1, dtype=np.int64)
+        np.cumsum(df, out=term_ptr[1:])
+
+        arrays = {
+            'idf': idf,
+            'term_ptr': term_ptr,
+            'term_docs': doc_ids[order],
+            'term_weights': weights[order],
+        }
+        return arrays, vocab
+
+    def _save(self, signature: str, arrays: dict[str, np.ndarray], vocab: list[str], num_docs: int):
+        """시그니처별 디렉터리에 저장 후 current.json 교체 (이전 버전은 정리)"""
+        index_dir = os.path.join(self.cache_dir, signature[:16])
+        os.makedirs(index_dir, exist_ok=True)
+
+        for name, array in arrays.items():
+            np.save(os.path.join(index_dir, f"{name}.npy"), array)
+        with open(os.path.join(index_dir, 'vocab.json'), 'w', encoding='utf-8') as f:
+            json.dump(vocab, f, ensure_ascii=False)
+
+        meta = {'signature': signature, 'dir': signature[:16], 'num_docs': num_docs}
+        tmp_path = os.path.join(self.cache_dir, 'current.json.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(meta, f)
+        os.replace(tmp_path, os.path.join(self.cache_dir, 'current.json'))
+
+        for name in os.listdir(self.cache_dir):
+            path = os.path.join(self.cache_dir, name)
+            if os.path.isdir(path) and name != signature[:16]:
+                # 다른 프로세스가 mmap 중이면 (Windows) 삭제 실패 → 다음 기회에 정리
+                shutil.rmtree(path, ignore_errors=True)
+
+    def _load(self, signature: str) -> bool:
+        """저장된 인덱스가 같은 시그니처면 mmap 로드"""
+        meta_path = os.path.join(self.cache_dir, 'current.json')
+        try:
+            with open(meta_path, 'r', encoding='utf-8') as f:
+                meta = json.load(f)
+            if meta.get('signature') != signature:
+                return False
+
+            index_dir = os.path.join(self.cache_dir, meta['dir'])
+            with open(os.path.join(index_dir, 'vocab.json'), 'r', encoding='utf-8') as f:
+                vocab = json.load(f)
+
+            self._idf = np.load(os.path.join(index_dir, 'idf.npy'), mmap_mode='r')
+            self._term_ptr = np.load(os.path.join(index_dir, 'term_ptr.npy'), mmap_mode='r')
+            self._term_docs = np.load(os.path.join(index_dir, 'term_docs.npy'), mmap_mode='r')
+            self._term_weights = np.load(os.path.join(index_dir, 'term_weights.npy'), mmap_mode='r')
+        except (OSError, ValueError, KeyError):
+            return False
+
+        self._vocab = {gram: i for i, gram in enumerate(vocab)}
+        self.num_docs = meta['num_docs']
+        self.signature = signature
+        return True
+
+    # ===== 질의 =====
+
+    def query(self, text: str, num_docs: int = None) -> np.ndarray:
+        """
+        전체 문서와의 코사인 유사도
+
+        Args:
+            text: 질의 텍스트
+            num_docs: 결과 배열 길이 (None이면 인덱스 문서 수, 끝쪽 빈 문서 포함용)
+
+        Returns:
+            문서 번호 순서의 유사도 배열 (float32)
+        """
+        size = max(self.num_docs, num_docs or 0)
+        scores = np.zeros(size, dtype=np.float32)
+        if self._term_ptr is None:
+            return scores
+
+        counts = char_ngrams(text)
+        known = [(self._vocab[gram], count) for gram, count in counts.items() if gram in self._vocab]
+        if not known:
+            return scores
+
+        term_ids = np.array([term_id for term_id, _ in known], dtype=np.int64)
+        tf = np.array([count for _, count in known], dtype=np.float32)
+        q = (1 + np.log(tf)) * self._idf[term_ids]
+
+        # 질의 벡터 정규화 (인덱스에 없는 n-gram도 df=0의 idf로 노름에 포함)
+        unknown_idf = math.log(1 + self.num_docs) + 1
+        unknown_sq = sum(
+            ((1 + math.log(count)) * unknown_idf) ** 2
+            for gram, count in counts.items() if gram not in self._vocab
+        )
+        q /= max(math.sqrt(float(np.dot(q, q)) + unknown_sq), 1e-12)
+
+        # 질의 n-gram 열만 모아 희소 행렬-벡터 곱
+        starts = self._term_ptr[term_ids]
+        lengths = self._term_ptr[term_ids + 1] - starts
+        total = int(lengths.sum())
+        if not total:
+            return scores
+
+        offsets = np.repeat(starts - np.cumsum(lengths) + lengths, lengths) + np.arange(total)
+        contributions = self._term_weights[offsets] * np.repeat(q, lengths)
+        scores[:self.num_docs] = np.bincount(
+            self._term_docs[offsets], weights=contributions, minlength=self.num_docs
+        )[:self.num_docs]
+        return scores